@@ -0,0 +1,92 @@
+"""
+Benchmark of near-duplicate clustering, with checks that copies collapse.
+
+Times collapse_duplicates on large synthetic batches of unrelated items
+into which copies of one story are mixed, and checks on small and large
+batches that every copy of a story collapses into a single item however
+large a share of the batch the copies are.
+
+Usage:
+    python -m benchmarks.clustering_benchmark --items 2000 --copies 300
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.search_benchmark import make_items, make_vocabulary
+
+def make_copies(count: int, description_words: int, vocabulary: tuple, offset: int) -> list:
+    """Return copies of one story from different sources, like syndicated wire articles."""
+    story = make_items(1, description_words, vocabulary, offset)[0]
+    return [
+        story.__class__(
+            id=f"copy_{offset + index}",
+            title=story.title,
+            url=f"https://source{index}.example.com/story",
+            source=f"source{index}.example.com",
+            origin='news_api',
+            description=story.description,
+            published=story.published
+        )
+        for index in range(count)
+    ]
+
+def check_collapse(unrelated: int, copies: int, description_words: int, vocabulary: tuple) -> bool:
+    """Whether a batch of unrelated items and copies of one story collapses to unrelated + 1 items."""
+    from src.services.clustering import collapse_duplicates
+    items = (make_items(unrelated, description_words, vocabulary)
+             + make_copies(copies, description_words, vocabulary, unrelated))
+    random.shuffle(items)
+    return len(collapse_duplicates(items)) == unrelated + 1
+
+def run_benchmark(args) -> dict:
+    random.seed(42)
+    vocabulary = make_vocabulary(args.vocabulary)
+    from src.services.clustering import collapse_duplicates
+
+    items = (make_items(args.items, args.description_words, vocabulary)
+             + make_copies(args.copies, args.description_words, vocabulary, args.items))
+    random.shuffle(items)
+    latencies = []
+    for _ in range(args.repeats):
+        started = time.perf_counter()
+        collapsed = collapse_duplicates(items)
+        latencies.append(time.perf_counter() - started)
+
+    checks = {
+        f"check_{unrelated}_unrelated_{copies}_copies": check_collapse(
+            unrelated, copies, args.description_words, vocabulary
+        )
+        for unrelated, copies in ((0, 2), (1, 3), (2, 4), (0, 10), (5, 50), (args.items, args.copies))
+    }
+    return {
+        'items': len(items),
+        'items_after_collapse': len(collapsed),
+        'collapse_ms': min(latencies) * 1000,
+        **checks
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--items', type=int, default=2000, help='unrelated items in the timed batch')
+    parser.add_argument('--copies', type=int, default=300, help='copies of one story mixed into the timed batch')
+    parser.add_argument('--description-words', type=int, default=60, help='words per item description')
+    parser.add_argument('--vocabulary', type=int, default=20000, help='distinct words with Zipf frequencies')
+    parser.add_argument('--repeats', type=int, default=3, help='timed runs, the fastest is reported')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    results = run_benchmark(parse_args(argv))
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+    if not all(value for name, value in results.items() if name.startswith('check_')):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
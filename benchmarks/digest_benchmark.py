@@ -0,0 +1,137 @@
+"""
+Benchmark of the rolling digest against summarizing each batch from scratch.
+
+Feeds the real GeminiSummarizer, backed by the stub Gemini model, a series
+of batches in which some stories continue from earlier cycles and others
+are new, once in each summarization mode, and reports the prompt tokens
+sent and the topics posted per cycle.
+
+Usage:
+    python -m benchmarks.digest_benchmark --cycles 12 --continuing 6 --new-stories 4
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants import app_constants
+from benchmarks.search_benchmark import make_vocabulary
+from benchmarks.stub_server import StubGeminiModel
+
+def make_story(vocabulary: tuple) -> list:
+    """Return the distinctive words a story's headlines keep repeating."""
+    words, _ = vocabulary
+    return random.sample(words[len(words) // 10:], 4)
+
+def make_item(story: list, vocabulary: tuple, number: int, description_words: int):
+    from src.models.news_item import NewsItem
+    words, cum_weights = vocabulary
+    title = story[:3] + random.choices(words, cum_weights=cum_weights, k=3)
+    random.shuffle(title)
+    return NewsItem(
+        id=f"digest_{number}",
+        title=' '.join(title).title(),
+        url=f"https://example.com/{number}",
+        source='example.com',
+        origin='rss',
+        description=' '.join(random.choices(words, cum_weights=cum_weights, k=description_words)),
+        published=int(time.time())
+    )
+
+async def run_mode(incremental: bool, batches: list, data_dir: str, topic_words: int) -> dict:
+    app_constants.DIGEST_CONFIG['INCREMENTAL'] = incremental
+    from src.services.digest import RollingDigest
+    from src.services.summarizer import GeminiSummarizer
+    from src.services.summary_cache import SummaryCache
+
+    # Each mode starts without memoized summaries or topics
+    summarizer = GeminiSummarizer()
+    summarizer.cache.close()
+    summarizer.cache = SummaryCache(persist=False)
+    summarizer.digest = RollingDigest(summarizer._generate, os.path.join(data_dir, f"digest-{incremental}.json"))
+    model = StubGeminiModel(latency=0.0, seconds_per_1k_tokens=0.0, topic_words=topic_words)
+    summarizer.model = model
+    prompt_tokens = []
+    topics = []
+    updates = 0
+    for items in batches:
+        chars = model.prompt_chars
+        summary = await summarizer.summarize_batch('ai', items)
+        prompt_tokens.append((model.prompt_chars - chars) // 4)
+        topics.append(summary.count('🔹'))
+        updates += summary.count('(update)')
+    summarizer.close()
+    return {
+        'gemini_calls': model.calls,
+        'prompt_tokens_first_cycle': prompt_tokens[0],
+        'prompt_tokens_last_cycle': prompt_tokens[-1],
+        'prompt_tokens_total': sum(prompt_tokens),
+        'topics_posted': sum(topics),
+        'topics_posted_as_updates': updates,
+        'topics_tracked': len(summarizer.digest.topics('ai')) if incremental else 0
+    }
+
+async def run_benchmark(args) -> dict:
+    data_dir = tempfile.mkdtemp(prefix='newsbot-digest-')
+    app_constants.LOGGING_CONFIG['DIRECTORY'] = os.path.join(data_dir, 'logs')
+    for name, path in app_constants.STORAGE_PATHS.items():
+        app_constants.STORAGE_PATHS[name] = os.path.join(data_dir, os.path.basename(path))
+    app_constants.GEMINI_LIMITS['REQUESTS_PER_MINUTE'] = 1e6
+    app_constants.GEMINI_LIMITS['TOKENS_PER_MINUTE'] = 1e9
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+
+    random.seed(42)
+    vocabulary = make_vocabulary(args.vocabulary)
+    stories = []
+    batches = []
+    continuing_items = 0
+    number = 0
+    for cycle in range(args.cycles):
+        continuing = random.sample(stories, min(args.continuing, len(stories)))
+        new_stories = [make_story(vocabulary) for _ in range(args.new_stories if cycle else args.initial_stories)]
+        stories.extend(new_stories)
+        items = []
+        for story in continuing + new_stories:
+            for _ in range(args.items_per_story):
+                items.append(make_item(story, vocabulary, number, args.description_words))
+                number += 1
+        continuing_items += len(continuing) * args.items_per_story
+        random.shuffle(items)
+        batches.append(items)
+
+    results = {
+        'items': number,
+        'items_of_continuing_stories': continuing_items,
+        'stories': len(stories)
+    }
+    for mode, incremental in (('full', False), ('incremental', True)):
+        for name, value in (await run_mode(incremental, batches, data_dir, args.topic_words)).items():
+            results[f"{mode}_{name}"] = value
+    return results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--cycles', type=int, default=12, help='batches to summarize')
+    parser.add_argument('--initial-stories', type=int, default=10, help='stories in the first batch')
+    parser.add_argument('--continuing', type=int, default=6, help='earlier stories with new items each cycle')
+    parser.add_argument('--new-stories', type=int, default=4, help='stories starting each cycle')
+    parser.add_argument('--items-per-story', type=int, default=2, help='items per story and cycle')
+    parser.add_argument('--description-words', type=int, default=60, help='words per item description')
+    parser.add_argument('--topic-words', type=int, default=80, help='words per topic summary from the stub Gemini')
+    parser.add_argument('--vocabulary', type=int, default=20000, help='distinct words with Zipf frequencies')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    results = asyncio.run(run_benchmark(parse_args(argv)))
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark of feed parsing: feedparser on the whole document versus the
+streaming parser that stops after MAX_RESULTS['RSS_FEED'] entries.
+
+Reports parse time and peak traced memory per feed for a large synthetic
+RSS and Atom feed, for a feed whose newest entries were already processed,
+and for a malformed feed that falls back to feedparser.
+
+Usage:
+    python -m benchmarks.parser_benchmark --entries 300 --description-words 400
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants.app_constants import FETCH_CONFIG, MAX_RESULTS
+from src.services.feed_fetcher import FeedFetcher
+from src.services.stream_parser import StreamingFeedParser
+from benchmarks.stub_server import StubUpstream
+
+def feedparser_path(body: bytes) -> list:
+    return FeedFetcher._parse(body, {})
+
+def streaming_path(body: bytes, processed: set = frozenset()) -> list:
+    """Feed the body in network-sized chunks, as FeedFetcher does."""
+    parser = StreamingFeedParser(MAX_RESULTS['RSS_FEED'])
+    chunk_size = FETCH_CONFIG['STREAM_CHUNK_BYTES']
+    for offset in range(0, len(body), chunk_size):
+        parser.feed(body[offset:offset + chunk_size])
+        if parser.stop_at(processed.__contains__):
+            break
+    return parser.close()
+
+def fallback_path(body: bytes) -> list:
+    try:
+        return streaming_path(body)
+    except Exception:
+        return FeedFetcher._parse(body, {})
+
+def measure(parse, body: bytes, repeats: int) -> dict:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        entries = parse(body)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'entries': len(entries),
+        'median_ms': statistics.median(times) * 1000,
+        'peak_kb': peak / 1024
+    }
+
+def run_benchmark(args) -> list:
+    upstream = StubUpstream(items_per_feed=args.entries, description_words=args.description_words)
+    upstream.base_url = 'http://stub'
+    rss = upstream.feed_document('rss', 'large').encode('utf-8')
+    atom = upstream.feed_document('atom', 'large').encode('utf-8')
+    # The three newest entries are new, the rest were processed on earlier polls
+    processed = {entry['id'] for entry in upstream._entries('large')[3:]}
+    malformed = rss.replace(b'<channel>', b'<channel><copyright>&copy; Stub</copyright>', 1)
+
+    cases = [
+        ('rss', rss, feedparser_path, streaming_path),
+        ('atom', atom, feedparser_path, streaming_path),
+        ('rss, 3 new entries', rss, feedparser_path, lambda body: streaming_path(body, processed)),
+        ('malformed rss', malformed, feedparser_path, fallback_path)
+    ]
+    rows = []
+    for name, body, baseline, candidate in cases:
+        rows.append((name, len(body), 'feedparser', measure(baseline, body, args.repeats)))
+        rows.append((name, len(body), 'streaming', measure(candidate, body, args.repeats)))
+    return rows
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--entries', type=int, default=300, help='entries in each synthetic feed')
+    parser.add_argument('--description-words', type=int, default=400, help='words per entry description')
+    parser.add_argument('--repeats', type=int, default=5, help='timed parses per case')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    rows = run_benchmark(parse_args(argv))
+    print(f"{'feed':<20} {'size_kb':>8} {'parser':<11} {'entries':>7} {'median_ms':>10} {'peak_kb':>9}")
+    for name, size, parser, result in rows:
+        print(f"{name:<20} {size / 1024:>8.0f} {parser:<11} {result['entries']:>7} "
+              f"{result['median_ms']:>10.2f} {result['peak_kb']:>9.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+"""
+Offline end-to-end benchmark of the news pipeline.
+
+Runs the real NewsService and NewsBot cycle code against local stand-ins
+for the feeds, NewsAPI, YouTube, Gemini and Discord, and reports
+throughput, cycle latency percentiles, peak memory and event loop lag.
+
+Usage:
+    python -m benchmarks.pipeline_benchmark --feeds 12 --items 20 --cycles 5 --guilds 1
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants import app_constants
+from benchmarks.stub_server import StubChannel, StubGeminiModel, StubGuild, StubUpstream
+
+def configure_constants(upstream: StubUpstream, feed_count: int, data_dir: str, keep_rate_limits: bool):
+    """
+    Point the bot's configuration at the stub upstream and a scratch directory.
+
+    Must run before any src.services module is imported, since those bind
+    storage paths as default arguments at import time.
+    """
+    categories = list(app_constants.RSS_FEEDS.keys())
+    app_constants.RSS_FEEDS.clear()
+    for category in categories:
+        app_constants.RSS_FEEDS[category] = []
+    for index in range(feed_count):
+        category = categories[index % len(categories)]
+        kind = 'rss' if index % 2 == 0 else 'atom'
+        app_constants.RSS_FEEDS[category].append(f"{upstream.base_url}/{kind}/feed{index}")
+
+    app_constants.API_ENDPOINTS['NEWS_API'] = f"{upstream.base_url}/newsapi"
+    app_constants.API_ENDPOINTS['YOUTUBE_SEARCH'] = f"{upstream.base_url}/youtube"
+    app_constants.LOGGING_CONFIG['DIRECTORY'] = os.path.join(data_dir, 'logs')
+    for name, path in app_constants.STORAGE_PATHS.items():
+        app_constants.STORAGE_PATHS[name] = os.path.join(data_dir, os.path.basename(path))
+    # Every synthetic feed changes each cycle, so poll them all every cycle
+    app_constants.POLL_CONFIG['MIN_INTERVAL'] = 0
+    app_constants.POLL_CONFIG['MAX_INTERVAL'] = 0
+    if not keep_rate_limits:
+        # The stubs have no quotas, so measure the pipeline itself
+        app_constants.PIPELINE_CONFIG['STAGE_RATE_LIMITS'].clear()
+        app_constants.GEMINI_LIMITS['REQUESTS_PER_MINUTE'] = 1e6
+        app_constants.GEMINI_LIMITS['TOKENS_PER_MINUTE'] = 1e9
+        app_constants.DELIVERY_CONFIG['GLOBAL_RATE'] = app_constants.DELIVERY_CONFIG['GLOBAL_BURST'] = 1e6
+
+class LoopLagSampler:
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, loop.time() - start - self.interval))
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+
+def percentile(values: list, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+def _item_counts() -> dict:
+    """Sum the fetched/deduplicated item counters by source."""
+    from src.utils.metrics import ITEMS_FETCHED, ITEMS_DEDUPLICATED
+    counts = {}
+    for counter, field in ((ITEMS_FETCHED, 'fetched'), (ITEMS_DEDUPLICATED, 'deduplicated')):
+        for (category, source), value in counter._values.items():
+            counts.setdefault(source, {'fetched': 0, 'deduplicated': 0})[field] += value
+    return counts
+
+async def run_benchmark(args) -> dict:
+    upstream = StubUpstream(
+        items_per_feed=args.items,
+        new_items_per_cycle=args.new_items,
+        description_words=args.description_words,
+        latency=args.upstream_latency
+    )
+    await upstream.start()
+    data_dir = tempfile.mkdtemp(prefix='newsbot-bench-')
+    configure_constants(upstream, args.feeds, data_dir, args.keep_rate_limits)
+
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+    os.environ.setdefault('YOUTUBE_API_KEY', 'benchmark')
+    os.environ.setdefault('NEWS_API_KEY', 'benchmark')
+    from src.bot.news_bot import NewsBot
+    from src.utils.logger import Logger
+
+    bot = NewsBot()
+    model = StubGeminiModel(latency=args.gemini_latency, topic_words=args.topic_words)
+    bot.summarizer.model = model
+    # One subscribed channel per category in each guild, resolved through the bot's channel cache
+    guilds = [StubGuild(guild_id, f"guild-{guild_id}") for guild_id in range(args.guilds)]
+    channels = {
+        category: [
+            StubChannel(f"{category}-{guild.id}", latency=args.send_latency,
+                        failure_rate=args.send_failure_rate, guild=guild)
+            for guild in guilds
+        ]
+        for category in app_constants.CATEGORIES
+    }
+    for category, category_channels in channels.items():
+        for channel in category_channels:
+            bot.subscriptions.subscribe(channel.guild.id, channel.id, category)
+    bot.channel_cache.rebuild(guilds)
+    await bot.news_service.start()
+    bot.delivery.start()
+
+    sampler = LoopLagSampler()
+    sampler.start()
+    cycle_times = {'rss': [], 'other': []}
+    start = time.perf_counter()
+    for _ in range(args.cycles):
+        upstream.new_cycle()
+        for source, loop_task in (('rss', bot.check_rss_feeds), ('other', bot.fetch_other_sources)):
+            cycle_start = time.perf_counter()
+            await loop_task.coro(bot)
+            cycle_times[source].append(time.perf_counter() - cycle_start)
+    # Sends run off the pipeline, so wait for the queue to drain
+    drain_start = time.perf_counter()
+    await bot.delivery.join()
+    drain_seconds = time.perf_counter() - drain_start
+    elapsed = time.perf_counter() - start
+    await sampler.stop()
+
+    dedup = bot.news_service.dedup_stats()
+    limiter = bot.summarizer.limiter.stats()
+    await bot.delivery.stop()
+    await bot.news_service.close()
+    bot.summarizer.close()
+    await upstream.stop()
+    subscribed = [channel for category_channels in channels.values() for channel in category_channels]
+
+    items_processed = sum(
+        stats['fetched'] - stats['deduplicated']
+        for stats in _item_counts().values()
+    )
+    all_cycles = cycle_times['rss'] + cycle_times['other']
+    log_stats = Logger.stats()
+    return {
+        'cycles': args.cycles,
+        'feeds': args.feeds,
+        'guilds': args.guilds,
+        'upstream_requests': upstream.requests,
+        'upstream_not_modified': upstream.not_modified,
+        'items_processed': items_processed,
+        'gemini_calls': model.calls,
+        'gemini_queued': limiter['queued'],
+        'gemini_mean_wait_s': limiter['mean_wait_seconds'],
+        'messages_sent': sum(channel.sent for channel in subscribed),
+        'sends_failed_and_retried': sum(channel.failed for channel in subscribed),
+        'longest_embed_chars': max((channel.longest_description for channel in subscribed), default=0),
+        'delivery_drain_s': drain_seconds,
+        'items_already_processed': dedup['already_processed'],
+        'items_cross_source_duplicates': dedup['cross_source'],
+        'dedup_elimination_rate': (
+            (dedup['already_processed'] + dedup['cross_source']) / dedup['fetched'] if dedup['fetched'] else 0.0
+        ),
+        'throughput_items_per_s': items_processed / elapsed if elapsed else 0.0,
+        'rss_cycle_p50_s': percentile(cycle_times['rss'], 0.5),
+        'rss_cycle_p99_s': percentile(cycle_times['rss'], 0.99),
+        'other_cycle_p50_s': percentile(cycle_times['other'], 0.5),
+        'other_cycle_p99_s': percentile(cycle_times['other'], 0.99),
+        'cycle_mean_s': statistics.mean(all_cycles) if all_cycles else 0.0,
+        'peak_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'loop_lag_p50_ms': percentile(sampler.samples, 0.5) * 1000,
+        'loop_lag_p99_ms': percentile(sampler.samples, 0.99) * 1000,
+        'loop_lag_max_ms': max(sampler.samples, default=0.0) * 1000,
+        'log_records': log_stats['records'],
+        'log_records_per_s': log_stats['records'] / elapsed if elapsed else 0.0,
+        'log_mean_enqueue_us': log_stats['mean_enqueue_us'],
+        'log_max_enqueue_us': log_stats['max_enqueue_us'],
+        'log_queue_depth': log_stats['queue_depth']
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--feeds', type=int, default=12, help='number of synthetic feeds')
+    parser.add_argument('--items', type=int, default=20, help='entries per feed and API response')
+    parser.add_argument('--new-items', type=int, default=5, help='new entries per feed each cycle')
+    parser.add_argument('--description-words', type=int, default=80, help='words per item description')
+    parser.add_argument('--cycles', type=int, default=5, help='RSS and other-source cycles to run')
+    parser.add_argument('--upstream-latency', type=float, default=0.05, help='seconds per upstream response')
+    parser.add_argument('--gemini-latency', type=float, default=1.0, help='seconds per Gemini call')
+    parser.add_argument('--guilds', type=int, default=1, help='guilds subscribed to every category')
+    parser.add_argument('--send-failure-rate', type=float, default=0.0,
+                        help='fraction of Discord sends failing with a retryable error')
+    parser.add_argument('--topic-words', type=int, default=8, help='words per topic in stub Gemini roundups')
+    parser.add_argument('--send-latency', type=float, default=0.1, help='seconds per Discord send')
+    parser.add_argument('--keep-rate-limits', action='store_true',
+                        help='keep the pipeline token buckets instead of disabling them')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    results = asyncio.run(run_benchmark(parse_args(argv)))
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+if __name__ == '__main__':
+    main()
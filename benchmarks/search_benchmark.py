@@ -0,0 +1,134 @@
+"""
+Benchmark of the article store: batched writes and FTS5 search latency.
+
+Stores synthetic articles through the real ArticleStore while sampling event
+loop lag, then times a mix of searches against the full index.
+
+Usage:
+    python -m benchmarks.search_benchmark --articles 300000 --queries 200
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants import app_constants
+from benchmarks.pipeline_benchmark import LoopLagSampler, percentile
+from benchmarks.stub_server import WORDS
+
+def make_vocabulary(size: int) -> tuple:
+    """
+    Build a vocabulary with Zipf-distributed word frequencies, like natural text.
+
+    Returns:
+        tuple: (words, cumulative weights) for random.choices; the stub WORDS
+        only, uniformly weighted, when size is not larger than them
+    """
+    words = list(WORDS)
+    while len(words) < size:
+        words.append(''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=random.randint(4, 10))))
+    weights = [1 / rank for rank in range(1, len(words) + 1)] if size > len(WORDS) else [1] * len(words)
+    return words, list(itertools.accumulate(weights))
+
+def make_items(count: int, description_words: int, vocabulary: tuple, offset: int = 0) -> list:
+    from src.models.news_item import NewsItem
+    words, cum_weights = vocabulary
+    return [
+        NewsItem(
+            id=f"bench_{offset + index}",
+            title=' '.join(random.choices(words, cum_weights=cum_weights, k=8)).title(),
+            url=f"https://example.com/{offset + index}",
+            source='example.com',
+            origin='rss',
+            description=f"<p>{' '.join(random.choices(words, cum_weights=cum_weights, k=description_words))}</p>",
+            published=int(time.time()) - index
+        )
+        for index in range(count)
+    ]
+
+async def run_benchmark(args) -> dict:
+    data_dir = tempfile.mkdtemp(prefix='newsbot-search-')
+    app_constants.STORAGE_PATHS['ARTICLE_DB'] = os.path.join(data_dir, 'articles.db')
+    app_constants.LOGGING_CONFIG['DIRECTORY'] = os.path.join(data_dir, 'logs')
+    from src.services.article_store import ArticleStore
+
+    random.seed(42)
+    store = ArticleStore()
+    store.start()
+    categories = app_constants.CATEGORIES
+    vocabulary = make_vocabulary(args.vocabulary)
+
+    # Feed the store the way NewsService does: one small batch per fetched feed
+    sampler = LoopLagSampler()
+    sampler.start()
+    add_seconds = 0.0
+    start = time.perf_counter()
+    for offset in range(0, args.articles, args.batch):
+        items = make_items(min(args.batch, args.articles - offset), args.description_words, vocabulary, offset)
+        add_start = time.perf_counter()
+        store.add(categories[offset // args.batch % len(categories)], items)
+        add_seconds += time.perf_counter() - add_start
+        await asyncio.sleep(0)
+    await store.flush()
+    write_seconds = time.perf_counter() - start
+    await sampler.stop()
+    stored = await store.count()
+
+    # Query words are drawn like article words, skipping the most frequent ones as stopwords
+    words, cum_weights = vocabulary
+    query_words = words[len(WORDS):] if len(words) > len(WORDS) else words
+    query_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(query_words) + 1)))
+    queries = [
+        ' '.join(random.choices(query_words, cum_weights=query_weights, k=random.choice((1, 2, 3))))
+        for _ in range(args.queries)
+    ]
+    queries[::5] = [f"{query[:3]}*" for query in queries[::5]]
+    latencies = []
+    result_counts = []
+    for index, query in enumerate(queries):
+        category = categories[index % len(categories)] if index % 2 else None
+        query_start = time.perf_counter()
+        results = await store.search(query, category)
+        latencies.append(time.perf_counter() - query_start)
+        result_counts.append(len(results))
+    await store.close()
+
+    return {
+        'articles_stored': stored,
+        'db_size_mb': os.path.getsize(app_constants.STORAGE_PATHS['ARTICLE_DB']) / 2 ** 20,
+        'write_articles_per_s': stored / write_seconds if write_seconds else 0.0,
+        'add_ms_per_batch_on_loop': add_seconds / max(1, args.articles // args.batch) * 1000,
+        'loop_lag_p99_ms': percentile(sampler.samples, 0.99) * 1000,
+        'loop_lag_max_ms': max(sampler.samples, default=0.0) * 1000,
+        'vocabulary': len(vocabulary[0]),
+        'queries': len(queries),
+        'mean_results': sum(result_counts) / len(result_counts),
+        'search_p50_ms': percentile(latencies, 0.5) * 1000,
+        'search_p99_ms': percentile(latencies, 0.99) * 1000
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--articles', type=int, default=300000, help='synthetic articles to store')
+    parser.add_argument('--batch', type=int, default=20, help='articles added per call, like one fetched feed')
+    parser.add_argument('--description-words', type=int, default=60, help='words per article description')
+    parser.add_argument('--vocabulary', type=int, default=20000,
+                        help='distinct words with Zipf frequencies; 0 uses only the stub words, the worst case')
+    parser.add_argument('--queries', type=int, default=200, help='searches to time')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    results = asyncio.run(run_benchmark(parse_args(argv)))
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+if __name__ == '__main__':
+    main()
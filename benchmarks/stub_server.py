@@ -0,0 +1,310 @@
+"""
+Local stand-ins for the bot's upstream services.
+
+Serves synthetic RSS/Atom feeds, NewsAPI JSON and YouTube search results
+from an aiohttp server, a minimal WebSub hub, plus stub Gemini model and
+Discord channel objects with configurable latency.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import secrets
+import random
+import re
+import aiohttp
+from aiohttp import web
+
+WORDS = (
+    'ai model chip startup funding launch robot cloud security data open source '
+    'research agent benchmark gpu quantum battery phone app browser privacy '
+    'regulation acquisition ipo developer platform update release network'
+).split()
+
+TITLE_PATTERN = re.compile(r'^\s*Title: (.+)$', re.MULTILINE)
+DIGEST_TOPIC_PATTERN = re.compile(r'^\s*\[(T\d+)\] (.+)$', re.MULTILINE)
+DIGEST_ITEM_PATTERN = re.compile(r'^\s*\[(\d+)\]\s*\n\s*Title: (.+)$', re.MULTILINE)
+
+def _sentence(rng: random.Random, length: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(length))
+
+class StubUpstream:
+    def __init__(self, items_per_feed: int = 20, new_items_per_cycle: int = 5,
+                 description_words: int = 80, latency: float = 0.05):
+        """
+        Configure the synthetic upstreams.
+
+        Args:
+            items_per_feed (int): Entries in every feed and API response
+            new_items_per_cycle (int): Entries replaced by new ones on each new_cycle()
+            description_words (int): Words per item description
+            latency (float): Seconds each response is delayed
+        """
+        self.items_per_feed = items_per_feed
+        self.new_items_per_cycle = new_items_per_cycle
+        self.description_words = description_words
+        self.latency = latency
+        self.generation = 0
+        self.requests = 0
+        self.not_modified = 0
+        self.hub_url = None
+        self.app = web.Application()
+        self.app.add_routes([
+            web.get('/rss/{feed}', self.rss_feed),
+            web.get('/atom/{feed}', self.atom_feed),
+            web.get('/newsapi', self.news_api),
+            web.get('/youtube', self.youtube_search)
+        ])
+        self._runner = None
+        self.base_url = None
+
+    async def start(self, host: str = '127.0.0.1'):
+        """Start serving on a free port and set base_url."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    def new_cycle(self):
+        """Publish new_items_per_cycle fresh entries in every feed."""
+        self.generation += 1
+
+    def _entries(self, feed: str) -> list:
+        """Return the current entries of a feed, newest first."""
+        first = self.generation * self.new_items_per_cycle
+        entries = []
+        for number in range(first + self.items_per_feed - 1, first - 1, -1):
+            rng = random.Random(f"{feed}-{number}")
+            entries.append({
+                'id': f"{feed}-{number}",
+                'title': _sentence(rng, 8).capitalize(),
+                'link': f"https://example.com/{feed}/{number}",
+                'description': _sentence(rng, self.description_words)
+            })
+        return entries
+
+    async def _respond(self, request, body: str, content_type: str):
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        etag = f'"{self.generation}"'
+        if request.headers.get('If-None-Match') == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(text=body, content_type=content_type, headers={'ETag': etag})
+
+    def feed_document(self, kind: str, feed: str) -> str:
+        """Render the current entries of a feed as an 'rss' or 'atom' document."""
+        topic = f"{self.base_url}/{kind}/{feed}"
+        hub_link = f'<atom:link rel="hub" href="{self.hub_url}"/>' if self.hub_url else ''
+        self_link = f'<atom:link rel="self" href="{topic}"/>'
+        if kind == 'rss':
+            items = ''.join(
+                f"<item><title>{entry['title']}</title><link>{entry['link']}</link>"
+                f"<guid>{entry['id']}</guid><description>{entry['description']}</description></item>"
+                for entry in self._entries(feed)
+            )
+            return (f'<?xml version="1.0"?><rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom">'
+                    f'<channel><title>{feed}</title>{hub_link}{self_link}{items}</channel></rss>')
+        entries = ''.join(
+            f"<entry><title>{entry['title']}</title><link href=\"{entry['link']}\"/>"
+            f"<id>{entry['id']}</id><summary>{entry['description']}</summary></entry>"
+            for entry in self._entries(feed)
+        )
+        return (f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom" '
+                f'xmlns:atom="http://www.w3.org/2005/Atom">'
+                f'<title>{feed}</title>{hub_link}{self_link}{entries}</feed>')
+
+    async def rss_feed(self, request):
+        body = self.feed_document('rss', request.match_info['feed'])
+        return await self._respond(request, body, 'application/rss+xml')
+
+    async def atom_feed(self, request):
+        body = self.feed_document('atom', request.match_info['feed'])
+        return await self._respond(request, body, 'application/atom+xml')
+
+    async def news_api(self, request):
+        query = request.query.get('q', '')
+        # Every other article is a feed0 story behind a tracking link, as
+        # aggregators return publisher articles that also appear in RSS
+        entries = [
+            dict(feed_entry, link=f"{feed_entry['link'].replace('https://', 'http://www.')}/?utm_source=newsapi")
+            if index % 2 else entry
+            for index, (entry, feed_entry) in enumerate(zip(
+                self._entries(f"newsapi-{query}"), self._entries('feed0')
+            ))
+        ]
+        articles = [
+            {
+                'title': entry['title'],
+                'description': entry['description'],
+                'url': entry['link'],
+                'source': {'name': 'Stub News'}
+            }
+            for entry in entries
+        ]
+        return await self._respond(request, json.dumps({'status': 'ok', 'articles': articles}), 'application/json')
+
+    async def youtube_search(self, request):
+        query = request.query.get('q', '')
+        max_results = int(request.query.get('maxResults', 5))
+        items = [
+            {
+                'id': {'videoId': entry['id']},
+                'snippet': {
+                    'title': entry['title'],
+                    'description': entry['description'],
+                    'thumbnails': {'default': {'url': f"{entry['link']}.jpg"}}
+                }
+            }
+            for entry in self._entries(f"youtube-{query}")[:max_results]
+        ]
+        return await self._respond(request, json.dumps({'items': items}), 'application/json')
+
+class StubHub:
+    """Minimal WebSub hub: verifies subscriber intents and pushes signed payloads."""
+
+    def __init__(self):
+        self.subscriptions = {}
+        self.verified = asyncio.Event()
+        self.app = web.Application()
+        self.app.add_routes([web.post('/hub', self.handle_request)])
+        self._runner = None
+        self._session = None
+        self._tasks = set()
+        self.url = None
+
+    async def start(self, host: str = '127.0.0.1'):
+        """Start serving on a free port and set url."""
+        self._session = aiohttp.ClientSession()
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}/hub"
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def handle_request(self, request):
+        form = await request.post()
+        if form.get('hub.mode') != 'subscribe':
+            return web.Response(text='Only subscribe is supported', status=400)
+        task = asyncio.create_task(self._verify(
+            form['hub.topic'], form['hub.callback'], form.get('hub.secret', ''),
+            int(form.get('hub.lease_seconds', 86400))
+        ))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return web.Response(status=202)
+
+    async def _verify(self, topic: str, callback: str, secret: str, lease_seconds: int):
+        challenge = secrets.token_hex(8)
+        params = {
+            'hub.mode': 'subscribe',
+            'hub.topic': topic,
+            'hub.challenge': challenge,
+            'hub.lease_seconds': str(lease_seconds)
+        }
+        async with self._session.get(callback, params=params) as response:
+            if response.status == 200 and await response.text() == challenge:
+                self.subscriptions[topic] = (callback, secret)
+                self.verified.set()
+
+    async def publish(self, topic: str, body: str, content_type: str) -> int:
+        """
+        Push a feed document to every verified subscriber of a topic.
+
+        Returns:
+            int: Number of subscribers that accepted the delivery
+        """
+        if topic not in self.subscriptions:
+            return 0
+        callback, secret = self.subscriptions[topic]
+        payload = body.encode('utf-8')
+        signature = hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+        headers = {'Content-Type': content_type, 'X-Hub-Signature': f"sha256={signature}"}
+        async with self._session.post(callback, data=payload, headers=headers) as response:
+            return int(response.status // 100 == 2)
+
+class StubGeminiResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+class StubGeminiModel:
+    """Drop-in for the Gemini model used by GeminiSummarizer that waits instead of calling Gemini."""
+
+    def __init__(self, latency: float = 1.0, seconds_per_1k_tokens: float = 0.05, topic_words: int = 8):
+        self.latency = latency
+        self.seconds_per_1k_tokens = seconds_per_1k_tokens
+        self.topic_words = topic_words
+        self.calls = 0
+        self.prompt_chars = 0
+
+    async def generate_content_async(self, prompt: str) -> StubGeminiResponse:
+        self.calls += 1
+        self.prompt_chars += len(prompt)
+        await asyncio.sleep(self.latency + len(prompt) / 4000 * self.seconds_per_1k_tokens)
+        summary = ' '.join(random.choice(WORDS) for _ in range(self.topic_words))
+        if 'rolling news digest' in prompt:
+            # Delta prompts: every ongoing topic is updated, new items sharing two title words are one story
+            stories = []
+            for number, title in DIGEST_ITEM_PATTERN.findall(prompt):
+                words = set(title.lower().split())
+                story = next((story for story in stories if len(story[1] & words) >= 2), None)
+                if story is None:
+                    stories.append(([number], words, title))
+                else:
+                    story[0].append(number)
+            tagged = DIGEST_TOPIC_PATTERN.findall(prompt) + [
+                (f"NEW {', '.join(numbers)}", title) for numbers, _, title in stories
+            ]
+            return StubGeminiResponse('\n\n'.join(f"🔹 **[{tag}] {title}**\n{summary}." for tag, title in tagged))
+        titles = TITLE_PATTERN.findall(prompt)[:10]
+        topics = '\n\n'.join(f"🔹 **{title}**\n{summary}." for title in titles)
+        return StubGeminiResponse(f"📰 **Latest News Roundup**\n\n{topics}")
+
+class StubGuild:
+    """Drop-in for a Discord guild holding stub text channels."""
+
+    def __init__(self, guild_id: int, name: str):
+        self.id = guild_id
+        self.name = name
+        self.text_channels = []
+
+class StubChannel:
+    """Drop-in for a Discord text channel that waits instead of sending, failing a fraction of sends."""
+
+    def __init__(self, name: str, latency: float = 0.1, failure_rate: float = 0.0, guild: StubGuild = None):
+        self.id = abs(hash(name)) % (10 ** 18)
+        self.name = name
+        self.guild = guild
+        if guild is not None:
+            guild.text_channels.append(self)
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.sent = 0
+        self.failed = 0
+        self.longest_description = 0
+
+    async def send(self, *args, embed=None, **kwargs):
+        await asyncio.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            self.failed += 1
+            raise aiohttp.ServerDisconnectedError()
+        self.sent += 1
+        if embed is not None:
+            self.longest_description = max(self.longest_description, len(embed.description or ''))
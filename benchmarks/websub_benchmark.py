@@ -0,0 +1,139 @@
+"""
+Offline benchmark of WebSub push ingestion.
+
+Subscribes the bot's feeds to a local stand-in hub through the real API
+server callbacks, then publishes new entries through the hub and measures
+how long pushed items take to be posted, and how many feed requests
+polling would have needed instead.
+
+Usage:
+    python -m benchmarks.websub_benchmark --feeds 12 --cycles 5
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants import app_constants
+from benchmarks.pipeline_benchmark import configure_constants, percentile
+from benchmarks.stub_server import StubChannel, StubGeminiModel, StubGuild, StubHub, StubUpstream
+
+def _free_port(host: str) -> int:
+    with socket.socket() as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+async def _wait_for(condition, timeout: float, interval: float = 0.005) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        await asyncio.sleep(interval)
+    return True
+
+async def run_benchmark(args) -> dict:
+    min_poll_interval = app_constants.POLL_CONFIG['MIN_INTERVAL']
+    upstream = StubUpstream(items_per_feed=args.items, new_items_per_cycle=args.new_items, latency=0.0)
+    hub = StubHub()
+    await upstream.start()
+    await hub.start()
+    upstream.hub_url = hub.url
+
+    data_dir = tempfile.mkdtemp(prefix='newsbot-websub-bench-')
+    configure_constants(upstream, args.feeds, data_dir, keep_rate_limits=False)
+    host = '127.0.0.1'
+    app_constants.API_CONFIG['HOST'] = host
+    app_constants.API_CONFIG['PORT'] = _free_port(host)
+    app_constants.WEBSUB_CONFIG['CALLBACK_URL'] = f"http://{host}:{app_constants.API_CONFIG['PORT']}"
+
+    os.environ.setdefault('GEMINI_API_KEY', 'benchmark')
+    os.environ.setdefault('YOUTUBE_API_KEY', 'benchmark')
+    os.environ.setdefault('NEWS_API_KEY', 'benchmark')
+    from src.api.server import ApiServer
+    from src.bot.news_bot import NewsBot
+
+    bot = NewsBot()
+    bot.summarizer.model = StubGeminiModel(latency=args.gemini_latency)
+    bot.is_ready = lambda: True
+    guild = StubGuild(0, 'benchmark')
+    channels = {
+        category: StubChannel(category, latency=args.send_latency, guild=guild)
+        for category in app_constants.CATEGORIES
+    }
+    for category, channel in channels.items():
+        bot.subscriptions.subscribe(guild.id, channel.id, category)
+    bot.channel_cache.rebuild([guild])
+
+    def sent() -> int:
+        return sum(channel.sent for channel in channels.values())
+
+    await bot.news_service.start()
+    bot.delivery.start()
+    api_server = ApiServer(bot)
+    await api_server.start()
+
+    subscribe_start = time.perf_counter()
+    await bot.maintain_push_subscriptions.coro(bot)
+    topics = [url for urls in app_constants.RSS_FEEDS.values() for url in urls]
+    verified = await _wait_for(lambda: len(hub.subscriptions) == len(topics), timeout=10)
+    subscribe_seconds = time.perf_counter() - subscribe_start
+
+    # Process the initial entries by polling so each push only carries new ones
+    await bot.check_rss_feeds.coro(bot)
+    requests_before = upstream.requests
+
+    latencies = []
+    for _ in range(args.cycles):
+        upstream.new_cycle()
+        expected = sent() + len(topics)
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            hub.publish(topic, upstream.feed_document(*topic.rsplit('/', 2)[1:]), 'application/xml')
+            for topic in topics
+        ))
+        if await _wait_for(lambda: sent() >= expected, timeout=30):
+            latencies.append(time.perf_counter() - start)
+
+    await api_server.stop()
+    await bot.delivery.stop()
+    await bot.news_service.close()
+    bot.summarizer.close()
+    await hub.stop()
+    await upstream.stop()
+
+    return {
+        'feeds': len(topics),
+        'subscriptions_verified': len(hub.subscriptions) if verified else f"{len(hub.subscriptions)} (timed out)",
+        'subscribe_s': subscribe_seconds,
+        'cycles_delivered': f"{len(latencies)}/{args.cycles}",
+        'push_to_post_p50_s': percentile(latencies, 0.5),
+        'push_to_post_p99_s': percentile(latencies, 0.99),
+        'feed_requests_during_push': upstream.requests - requests_before,
+        'feed_requests_polling_would_need': len(topics) * args.cycles,
+        'min_poll_interval_s': min_poll_interval
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--feeds', type=int, default=12, help='number of synthetic feeds')
+    parser.add_argument('--items', type=int, default=20, help='entries per feed')
+    parser.add_argument('--new-items', type=int, default=5, help='new entries per feed each cycle')
+    parser.add_argument('--cycles', type=int, default=5, help='publish rounds to push')
+    parser.add_argument('--gemini-latency', type=float, default=1.0, help='seconds per Gemini call')
+    parser.add_argument('--send-latency', type=float, default=0.1, help='seconds per Discord send')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    results = asyncio.run(run_benchmark(parse_args(argv)))
+    width = max(len(name) for name in results)
+    for name, value in results.items():
+        print(f"{name:<{width}}  {value:.3f}" if isinstance(value, float) else f"{name:<{width}}  {value}")
+
+if __name__ == '__main__':
+    main()
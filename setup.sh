@@ -1,10 +1,10 @@
 #!/bin/bash
 
-# Create logs directory if it doesn't exist
-mkdir -p logs
+# Create logs and data directories if they don't exist
+mkdir -p logs data
 
-# Set permissions for logs directory
-chmod 777 logs
+# Set permissions for logs and data directories
+chmod 777 logs data
 
 # Create .env file if it doesn't exist
 if [ ! -f .env ]; then
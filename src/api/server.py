@@ -0,0 +1,251 @@
+"""
+HTTP API for health checks, manually triggering news checks, article search and WebSub callbacks.
+"""
+
+import asyncio
+import time
+from aiohttp import web
+from src.utils import metrics
+from src.services.circuit_breaker import BREAKERS
+from src.services.job_queue import JobQueue
+from src.utils.logger import Logger
+from src.constants.app_constants import API_CONFIG, ARTICLE_STORE_CONFIG, CATEGORIES, RSS_FEEDS, WEBSUB_CONFIG
+
+class JobContext:
+    """Stand-in for a command context that records messages on a job."""
+
+    def __init__(self, job: dict, logger: Logger):
+        self.job = job
+        self.logger = logger
+
+    async def send(self, message):
+        self.job['messages'].append(message)
+        self.logger.info(f"API trigger message: {message}")
+
+class ApiServer:
+    def __init__(self, bot):
+        """
+        Create the API server for a bot.
+
+        The server must be started on the bot's event loop so triggered jobs
+        run alongside the bot's own tasks.
+
+        Args:
+            bot (NewsBot): The bot whose checks are triggered
+        """
+        self.logger = Logger(__name__)
+        self.bot = bot
+        self.jobs = JobQueue()
+        self.app = web.Application()
+        self.app.add_routes([
+            web.get('/health', self.health_check),
+            web.get('/metrics', self.export_metrics),
+            web.post('/api/trigger/rss', self.trigger_rss),
+            web.post('/api/trigger/other', self.trigger_other),
+            web.post('/api/trigger/all', self.trigger_all),
+            web.get('/api/jobs/{job_id}', self.get_job),
+            web.get('/api/breakers', self.get_breakers),
+            web.get('/api/feeds', self.get_feeds),
+            web.get('/api/search', self.search_articles),
+            web.get('/websub/{subscription_id}', self.websub_verify),
+            web.post('/websub/{subscription_id}', self.websub_receive)
+        ])
+        self._runner = None
+        self._loop_monitor = None
+        self._push_tasks = set()
+
+    async def start(self):
+        """Start the job workers and listen for HTTP requests."""
+        self.jobs.start()
+        self._loop_monitor = asyncio.create_task(metrics.monitor_event_loop_lag())
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, API_CONFIG['HOST'], API_CONFIG['PORT'])
+        await site.start()
+        self.logger.info(f"API server started on http://{API_CONFIG['HOST']}:{API_CONFIG['PORT']}")
+
+    async def stop(self):
+        """Stop accepting requests and cancel running jobs."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+        if self._loop_monitor is not None:
+            self._loop_monitor.cancel()
+        for task in self._push_tasks:
+            task.cancel()
+        await asyncio.gather(*self._push_tasks, return_exceptions=True)
+        await self.jobs.stop()
+
+    async def health_check(self, request):
+        """Readiness check: 200 only when the bot can fetch, summarize and post."""
+        session = self.bot.news_service.session
+        checks = {
+            'discord_connected': self.bot.is_ready() and not self.bot.is_closed(),
+            'background_tasks_running': all(task.is_running() for task in self.bot.background_tasks),
+            'http_session_open': session is not None and not session.closed,
+            'job_workers_running': self.jobs.is_running(),
+            'delivery_workers_running': self.bot.delivery.is_running()
+        }
+        ready = all(checks.values())
+        return web.json_response(
+            {'status': 'ok' if ready else 'unavailable', 'checks': checks},
+            status=200 if ready else 503
+        )
+
+    async def export_metrics(self, request):
+        """Metrics endpoint in the Prometheus text format."""
+        metrics.JOB_QUEUE_DEPTH.set(self.jobs.depth())
+        metrics.DELIVERY_QUEUE_DEPTH.set(self.bot.delivery.depth())
+        article_stats = self.bot.news_service.article_store.stats()
+        metrics.ARTICLE_STORE_PENDING.set(article_stats['pending'])
+        for category, channels in self.bot.subscriptions.describe().items():
+            metrics.SUBSCRIBED_CHANNELS.set(channels, category=category)
+        log_stats = Logger.stats()
+        metrics.LOG_RECORDS.set(log_stats['records'])
+        metrics.LOG_QUEUE_DEPTH.set(log_stats['queue_depth'])
+        metrics.LOG_ENQUEUE_SECONDS.set(log_stats['mean_enqueue_us'] / 1e6, stat='mean')
+        metrics.LOG_ENQUEUE_SECONDS.set(log_stats['max_enqueue_us'] / 1e6, stat='max')
+        return web.Response(
+            text=metrics.REGISTRY.render(),
+            content_type='text/plain',
+            charset='utf-8'
+        )
+
+    async def _submit_trigger(self, request, kind: str):
+        """Validate a trigger request and queue the matching job."""
+        try:
+            data = await request.json() if request.can_read_body else {}
+        except ValueError:
+            return web.Response(text="Invalid JSON body", status=400)
+        if not isinstance(data, dict):
+            return web.Response(text="JSON body must be an object", status=400)
+        category = data.get('category', None)
+
+        # Validate category if provided
+        if category and category not in CATEGORIES:
+            return web.Response(text=f"Invalid category: {category}", status=400)
+
+        if not self.bot.is_ready():
+            return web.Response(text="Bot not ready", status=503)
+
+        async def run(job):
+            ctx = JobContext(job, self.logger)
+            if kind in ('rss', 'all'):
+                await self.bot.manual_rss_check(ctx, category)
+            if kind in ('other', 'all'):
+                await self.bot.manual_other_sources_check(ctx, category)
+
+        try:
+            job, coalesced = self.jobs.submit(kind, category, run)
+        except asyncio.QueueFull:
+            return web.Response(text="Job queue is full, try again later", status=429)
+
+        if coalesced:
+            self.logger.info(f"Coalesced {kind} trigger{f' for {category}' if category else ''} into job {job['id']}")
+        return web.json_response(
+            {
+                'job_id': job['id'],
+                'status': job['status'],
+                'coalesced': coalesced,
+                'status_url': f"/api/jobs/{job['id']}"
+            },
+            status=202
+        )
+
+    async def trigger_rss(self, request):
+        """API endpoint to trigger RSS feed check."""
+        return await self._submit_trigger(request, 'rss')
+
+    async def trigger_other(self, request):
+        """API endpoint to trigger other sources check."""
+        return await self._submit_trigger(request, 'other')
+
+    async def trigger_all(self, request):
+        """API endpoint to trigger all news sources."""
+        return await self._submit_trigger(request, 'all')
+
+    async def get_job(self, request):
+        """API endpoint reporting the status of a triggered job."""
+        job = self.jobs.get(request.match_info['job_id'])
+        if job is None:
+            return web.Response(text="Job not found", status=404)
+        return web.json_response(job)
+
+    async def get_breakers(self, request):
+        """API endpoint reporting the circuit breaker state of every upstream source."""
+        return web.json_response(BREAKERS.describe())
+
+    async def get_feeds(self, request):
+        """API endpoint reporting each RSS feed's adaptive polling state and WebSub subscription."""
+        news_service = self.bot.news_service
+        polling = news_service.poll_scheduler.describe()
+        push = news_service.websub.describe()
+        return web.json_response({
+            category: {
+                feed_url: {'polling': polling.get(feed_url), 'websub': push.get(feed_url)}
+                for feed_url in feed_urls
+            }
+            for category, feed_urls in RSS_FEEDS.items()
+        })
+
+    async def search_articles(self, request):
+        """API endpoint searching stored articles: ?q=<query>[&category=<category>][&limit=<n>]."""
+        query = request.query.get('q', '').strip()
+        if not query:
+            return web.Response(text="Missing query parameter q", status=400)
+        category = request.query.get('category') or None
+        if category and category not in CATEGORIES:
+            return web.Response(text=f"Invalid category: {category}", status=400)
+        try:
+            limit = int(request.query.get('limit', ARTICLE_STORE_CONFIG['SEARCH_LIMIT']))
+        except ValueError:
+            return web.Response(text="Invalid limit", status=400)
+
+        start = time.perf_counter()
+        results = await self.bot.news_service.article_store.search(query, category, limit)
+        return web.json_response({
+            'query': query,
+            'category': category,
+            'took_ms': round((time.perf_counter() - start) * 1000, 2),
+            'results': results
+        })
+
+    async def websub_verify(self, request):
+        """WebSub callback answering a hub's verification of intent."""
+        challenge = self.bot.news_service.websub.verify_intent(
+            request.match_info['subscription_id'], request.query
+        )
+        if challenge is None:
+            return web.Response(text="Unknown subscription", status=404)
+        return web.Response(text=challenge)
+
+    async def websub_receive(self, request):
+        """WebSub callback receiving a pushed feed document."""
+        found = self.bot.news_service.websub.get(request.match_info['subscription_id'])
+        if found is None:
+            return web.Response(text="Unknown subscription", status=404)
+        if (request.content_length or 0) > WEBSUB_CONFIG['MAX_PAYLOAD_BYTES']:
+            return web.Response(text="Payload too large", status=413)
+        if not self.bot.is_ready():
+            # The hub retries failed deliveries
+            return web.Response(text="Bot not ready", status=503)
+
+        feed_url, subscription = found
+        body = await request.read()
+        signature = request.headers.get('X-Hub-Signature')
+        if not self.bot.news_service.websub.verify_signature(subscription, body, signature):
+            # Acknowledge but drop, as WebSub requires for bad signatures
+            self.logger.warning(f"Dropped WebSub push for {feed_url} with an invalid signature")
+            return web.Response(status=202)
+
+        headers = {'content-type': request.headers.get('Content-Type', '')}
+        task = asyncio.create_task(self._process_push(feed_url, body, headers))
+        self._push_tasks.add(task)
+        task.add_done_callback(self._push_tasks.discard)
+        return web.Response(status=202)
+
+    async def _process_push(self, feed_url: str, body: bytes, headers: dict):
+        try:
+            outcome = await self.bot.process_pushed_feed(feed_url, body, headers)
+            self.logger.info(outcome)
+        except Exception as e:
+            self.logger.error(f"❌ Error processing WebSub push from {feed_url}: {str(e)}")
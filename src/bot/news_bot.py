@@ -6,11 +6,19 @@ import discord
 from discord.ext import commands, tasks
 from datetime import datetime, timezone
 import asyncio
+from src.services.channel_cache import ChannelCache
+from src.services.circuit_breaker import CircuitOpenError
+from src.services.delivery import DeliveryQueue
 from src.services.news_service import NewsService
+from src.services.pipeline import PipelineScheduler
+from src.services.subscriptions import SubscriptionRegistry
 from src.services.summarizer import GeminiSummarizer
+from src.bot.search_commands import SearchCommands
+from src.bot.subscription_commands import SubscriptionCommands
 from src.utils.logger import Logger
+from src.utils.embed_splitter import split_embed_text
 from src.constants.app_constants import (
-    CHANNEL_IDS,
+    CATEGORIES,
     INTERVALS,
     EMBED_COLORS
 )
@@ -41,6 +49,10 @@ class NewsBot(commands.Bot):
         # Initialize services
         self.news_service = NewsService()
         self.summarizer = GeminiSummarizer()
+        self.scheduler = PipelineScheduler()
+        self.subscriptions = SubscriptionRegistry()
+        self.channel_cache = ChannelCache()
+        self.delivery = DeliveryQueue(on_channel_gone=self._unsubscribe_channel)
         
         # Start background tasks
         self.start_tasks()
@@ -51,294 +63,321 @@ class NewsBot(commands.Bot):
         self.logger.info(f"Logged in as {self.user.name} ({self.user.id})")
         self.logger.info(f"Connected to {len(self.guilds)} guilds:")
         for guild in self.guilds:
-            self.logger.info(f"- {guild.name} (ID: {guild.id})")
-            # Log available channels
-            self.logger.info(f"Available channels in {guild.name}:")
-            for channel in guild.text_channels:
-                self.logger.info(f"- {channel.name} (ID: {channel.id})")
+            self.logger.info(f"- {guild.name} (ID: {guild.id}), {len(guild.text_channels)} text channels")
+        self.channel_cache.rebuild(self.guilds)
         
+    async def on_guild_join(self, guild: discord.Guild):
+        """Index the channels of a guild the bot was added to."""
+        for channel in guild.text_channels:
+            self.channel_cache.add(channel)
+            
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Forget the channels of a guild the bot left."""
+        self.channel_cache.remove_guild(guild)
+        
+    async def on_guild_channel_create(self, channel):
+        """Index a new text channel."""
+        if isinstance(channel, discord.TextChannel):
+            self.channel_cache.add(channel)
+            
+    async def on_guild_channel_delete(self, channel):
+        """Forget a deleted channel."""
+        self.channel_cache.remove(channel)
+        
+    async def on_guild_channel_update(self, before, after):
+        """Re-index a renamed channel, or forget one that is no longer a text channel."""
+        if isinstance(after, discord.TextChannel):
+            self.channel_cache.update(before, after)
+        else:
+            self.channel_cache.remove(before)
+            
     def start_tasks(self):
         """Initialize and start background tasks."""
         self.background_tasks = [
             self.check_rss_feeds,
             self.fetch_other_sources
         ]
+        if self.news_service.websub.enabled:
+            self.background_tasks.append(self.maintain_push_subscriptions)
         
     
         
     async def setup_hook(self):
         """Set up the bot and start background tasks."""
         self.logger.info("Starting bot setup...")
+        await self.news_service.start()
+        await self.add_cog(SubscriptionCommands(self))
+        await self.add_cog(SearchCommands(self))
+        self.delivery.start()
         for task in self.background_tasks:
             task.start()
         self.logger.info("Bot setup completed")
         
-    async def manual_rss_check(self, ctx, category=None):
-        """Manually trigger RSS feed check for all or a specific category."""
-        await ctx.send(f"🔄 Manually triggering RSS feed check{f' for {category}' if category else ''}...")
+    async def close(self):
+        """Release service resources before closing the Discord connection."""
+        await self.delivery.stop()
+        await self.news_service.close()
+        self.summarizer.close()
+        await super().close()
         
-        categories = [category] if category else ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']
+    def resolve_channels(self, category: str) -> list:
+        """
+        Find the Discord channels subscribed to a category.
         
-        for cat in categories:
-            if cat not in ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']:
-                await ctx.send(f"⚠️ Invalid category: {cat}. Skipping.")
-                continue
-                
-            await ctx.send(f"📰 Processing RSS feeds for {cat}...")
+        Args:
+            category (str): News category
             
-            try:
-                # Get channel for the category
-                channel_id = CHANNEL_IDS.get(cat.upper())
-                if not channel_id:
-                    await ctx.send(f"⚠️ No channel ID configured for category: {cat}")
-                    continue
-                    
-                channel = self.get_channel(channel_id)
-                if not channel:
-                    # Try to find channel by name if ID doesn't work
-                    category_name = cat.replace('_', '-')
-                    for guild in self.guilds:
-                        channel = discord.utils.get(guild.text_channels, name=category_name)
-                        if channel:
-                            break
-                    
-                    if not channel:
-                        await ctx.send(f"⚠️ Channel not found for category: {cat}")
-                        continue
-                
-                # Fetch all news items
-                news_items = await self.news_service.fetch_rss_news(cat)
-                if not news_items:
-                    await ctx.send(f"ℹ️ No new RSS items found for {cat}")
-                    continue
-                    
-                # Get a batch summary
-                summary = await self.summarizer.summarize_batch(cat, news_items)
-                
-                # Create and send the embed
-                embed = discord.Embed(
-                    description=summary,
-                    color=EMBED_COLORS[cat.upper()],
-                    timestamp=datetime.now(timezone.utc)
-                )
-                embed.set_footer(text=f"News Bot - {cat.replace('_', ' ').title()} (Manual Trigger)")
-                
-                await channel.send(embed=embed)
-                
-                # Mark all items as processed
-                for item in news_items:
-                    self.news_service.mark_as_processed(item['id'])
-                    
-                await ctx.send(f"✅ Successfully processed RSS feeds for {cat}")
-                
-            except Exception as e:
-                error_msg = f"❌ Error processing RSS feeds for {cat}: {str(e)}"
-                self.logger.error(error_msg)
-                await ctx.send(error_msg)
+        Returns:
+            list: The subscribed channels the bot can see
+        """
+        return self.channel_cache.resolve(category, self.subscriptions)
         
-        await ctx.send("✅ Manual RSS feed check completed")
+    async def fetch_items(self, category: str, source: str, force: bool = False) -> list:
+        """
+        Fetch unprocessed items for a category from one group of sources.
         
-    async def manual_other_sources_check(self, ctx, category=None):
-        """Manually trigger other sources check for all or a specific category."""
-        await ctx.send(f"🔄 Manually triggering other sources check{f' for {category}' if category else ''}...")
+        Args:
+            category (str): News category
+            source (str): 'rss' for RSS feeds, 'other' for YouTube and Google News
+            force (bool): Poll every RSS feed, even those not due yet
+            
+        Returns:
+            list: List of news items
+        """
+        if source == 'rss':
+            return await self.news_service.fetch_rss_news(category, force)
+            
+        videos, articles = await asyncio.gather(
+            self.news_service.fetch_youtube_news(category),
+            self.news_service.fetch_google_news(category)
+        )
+        return videos + articles
         
-        categories = [category] if category else ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']
+    async def process_category(self, category: str, source: str, manual: bool = False) -> str:
+        """
+        Run the fetch → dedup → summarize → post pipeline for one category.
         
-        for cat in categories:
-            if cat not in ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']:
-                await ctx.send(f"⚠️ Invalid category: {cat}. Skipping.")
-                continue
-                
-            await ctx.send(f"📰 Processing other sources for {cat}...")
+        Args:
+            category (str): News category
+            source (str): 'rss' or 'other', see fetch_items
+            manual (bool): Whether the run was triggered manually
             
-            try:
-                # Get channel for the category
-                channel_id = CHANNEL_IDS.get(cat.upper())
-                if not channel_id:
-                    await ctx.send(f"⚠️ No channel ID configured for category: {cat}")
-                    continue
-                    
-                channel = self.get_channel(channel_id)
-                if not channel:
-                    # Try to find channel by name if ID doesn't work
-                    category_name = cat.replace('_', '-')
-                    for guild in self.guilds:
-                        channel = discord.utils.get(guild.text_channels, name=category_name)
-                        if channel:
-                            break
-                    
-                    if not channel:
-                        await ctx.send(f"⚠️ Channel not found for category: {cat}")
-                        continue
-                
-                # Fetch all news items
-                all_items = []
-                
-                # Fetch YouTube videos
-                videos = await self.news_service.fetch_youtube_news(cat)
-                all_items.extend(videos)
-                
-                # Fetch Google News articles
-                articles = await self.news_service.fetch_google_news(cat)
-                all_items.extend(articles)
-                
-                if not all_items:
-                    await ctx.send(f"ℹ️ No new items found from other sources for {cat}")
-                    continue
-                    
-                # Get a batch summary
-                summary = await self.summarizer.summarize_batch(cat, all_items)
-                
-                # Create and send the embed
-                embed = discord.Embed(
-                    description=summary,
-                    color=EMBED_COLORS[cat.upper()],
-                    timestamp=datetime.now(timezone.utc)
-                )
-                embed.set_footer(text=f"News Bot - {cat.replace('_', ' ').title()} (Manual Trigger)")
-                
-                await channel.send(embed=embed)
-                
-                # Mark all items as processed
-                for item in all_items:
-                    self.news_service.mark_as_processed(item['id'])
-                    
-                await ctx.send(f"✅ Successfully processed other sources for {cat}")
+        Returns:
+            str: Human-readable outcome of the run
+        """
+        source_name = 'RSS feeds' if source == 'rss' else 'other sources'
+        channels = self.resolve_channels(category)
+        if not channels:
+            return f"⚠️ Channel not found for category: {category}"
+            
+        # Fetch all unprocessed news items
+        async with self.scheduler.stage('fetch'):
+            news_items = await self.fetch_items(category, source, force=manual)
+        if not news_items:
+            return f"ℹ️ No new items found from {source_name} for {category}"
+            
+        return await self.publish_items(category, channels, news_items, source_name, manual)
+        
+    async def publish_items(self, category: str, channels: list, news_items: list,
+                            source_name: str, manual: bool = False) -> str:
+        """
+        Summarize fetched items once, post the summary to every subscribed channel
+        and mark the items as processed.
+        
+        Args:
+            category (str): News category
+            channels (list): Subscribed channels to post to
+            news_items (list): Unprocessed news items
+            source_name (str): Source description used in the outcome message
+            manual (bool): Whether the run was triggered manually
+            
+        Returns:
+            str: Human-readable outcome of the run
+        """
+        # Get a batch summary
+        async with self.scheduler.stage('summarize'):
+            summary = await self.summarizer.summarize_batch(
+                category, news_items, 'manual' if manual else 'scheduled'
+            )
+            
+        # Queue the embeds for every channel; sending and retries happen off the pipeline
+        embeds = self.build_embeds(category, summary, manual)
+        for channel in channels:
+            self.delivery.submit(category, channel, embeds)
+            
+        # Mark all items as processed
+        self.news_service.mark_items_as_processed(news_items)
+        
+        if len(channels) > 1:
+            return f"✅ Successfully processed {source_name} for {category} (queued for {len(channels)} channels)"
+        return f"✅ Successfully processed {source_name} for {category}"
+        
+    def build_embeds(self, category: str, summary: str, manual: bool = False) -> list:
+        """
+        Build the embeds for a roundup, split between topics when it exceeds the description limit.
+        
+        Args:
+            category (str): News category
+            summary (str): Roundup text
+            manual (bool): Whether the run was triggered manually
+            
+        Returns:
+            list: Embeds to send in order
+        """
+        parts = split_embed_text(summary)
+        timestamp = datetime.now(timezone.utc)
+        footer = f"News Bot - {category.replace('_', ' ').title()}"
+        if manual:
+            footer = f"{footer} (Manual Trigger)"
+        embeds = []
+        for index, part in enumerate(parts, 1):
+            embed = discord.Embed(
+                description=part,
+                color=EMBED_COLORS[category.upper()],
+                timestamp=timestamp
+            )
+            embed.set_footer(text=f"{footer} · {index}/{len(parts)}" if len(parts) > 1 else footer)
+            embeds.append(embed)
+        return embeds
+        
+    def _unsubscribe_channel(self, channel_id: int):
+        """Drop the subscriptions of a channel that no longer exists."""
+        removed = self.subscriptions.unsubscribe(channel_id)
+        if removed:
+            self.subscriptions.save()
+            self.logger.info(f"Unsubscribed deleted channel {channel_id} from {', '.join(removed)}")
+            
+    async def run_pipeline(self, source: str, categories: list = None, manual: bool = False) -> dict:
+        """
+        Process several categories concurrently through the pipeline scheduler.
+        
+        Args:
+            source (str): 'rss' or 'other', see fetch_items
+            categories (list, optional): Categories to process, defaults to all
+            manual (bool): Whether the run was triggered manually
+            
+        Returns:
+            dict: Mapping of category to outcome message
+        """
+        source_name = 'RSS feeds' if source == 'rss' else 'other sources'
+        dedup_before = self.news_service.dedup_stats()
+        results = await self.scheduler.run(
+            categories or CATEGORIES,
+            lambda category: self.process_category(category, source, manual),
+            source
+        )
+        
+        outcomes = {}
+        for category, result in results.items():
+            if isinstance(result, CircuitOpenError):
+                outcome = f"⏸️ Skipped {source_name} for {category}: {str(result)}"
+                self.logger.info(outcome)
+            elif isinstance(result, Exception):
+                outcome = f"❌ Error processing {source_name} for {category}: {str(result)}"
+                self.logger.error(outcome, exc_info=result)
+            else:
+                outcome = result
+                self.logger.info(outcome)
+            outcomes[category] = outcome
+            
+        dedup = {
+            name: value - dedup_before[name]
+            for name, value in self.news_service.dedup_stats().items()
+        }
+        eliminated = dedup['already_processed'] + dedup['cross_source']
+        self.logger.info(
+            f"Dedup ({source_name}): {dedup['fetched']} fetched, {dedup['already_processed']} already processed, "
+            f"{dedup['cross_source']} cross-source duplicates "
+            f"({eliminated / dedup['fetched'] if dedup['fetched'] else 0:.0%} eliminated)"
+        )
+        
+        stats = self.news_service.connection_stats()
+        self.logger.info(
+            f"HTTP connections: {stats['new_connections']} opened, "
+            f"{stats['reused_connections']} reused ({stats['reuse_ratio']:.0%} reuse)"
+        )
+        return outcomes
+        
+    async def process_pushed_feed(self, feed_url: str, body: bytes, headers: dict) -> str:
+        """
+        Run a feed document pushed by a WebSub hub through the dedup → summarize → post pipeline.
+        
+        Args:
+            feed_url (str): Subscribed feed the payload belongs to
+            body (bytes): Pushed RSS/Atom document
+            headers (dict): Request headers with lowercase keys
+            
+        Returns:
+            str: Human-readable outcome of the run
+        """
+        category, news_items = await self.news_service.ingest_pushed_feed(feed_url, body, headers)
+        if category is None:
+            return f"⚠️ Received WebSub push for unknown feed: {feed_url}"
+        if not news_items:
+            return f"ℹ️ No new items in WebSub push from {feed_url}"
+        channels = self.resolve_channels(category)
+        if not channels:
+            return f"⚠️ Channel not found for category: {category}"
+            
+        results = await self.scheduler.run(
+            [category],
+            lambda category: self.publish_items(category, channels, news_items, 'WebSub push'),
+            'websub'
+        )
+        result = results[category]
+        if isinstance(result, Exception):
+            raise result
+        return result
+        
+    async def _manual_check(self, ctx, source: str, category=None):
+        """Run a manual check and report progress to the invoking context."""
+        source_name = 'RSS feed' if source == 'rss' else 'other sources'
+        await ctx.send(f"🔄 Manually triggering {source_name} check{f' for {category}' if category else ''}...")
+        
+        categories = [category] if category else CATEGORIES
+        if category and category not in CATEGORIES:
+            await ctx.send(f"⚠️ Invalid category: {category}. Skipping.")
+            categories = []
+            
+        if categories:
+            outcomes = await self.run_pipeline(source, categories, manual=True)
+            for outcome in outcomes.values():
+                await ctx.send(outcome)
                 
-            except Exception as e:
-                error_msg = f"❌ Error processing other sources for {cat}: {str(e)}"
-                self.logger.error(error_msg)
-                await ctx.send(error_msg)
+        await ctx.send(f"✅ Manual {source_name} check completed")
+        
+    async def manual_rss_check(self, ctx, category=None):
+        """Manually trigger RSS feed check for all or a specific category."""
+        await self._manual_check(ctx, 'rss', category)
         
-        await ctx.send("✅ Manual other sources check completed")
+    async def manual_other_sources_check(self, ctx, category=None):
+        """Manually trigger other sources check for all or a specific category."""
+        await self._manual_check(ctx, 'other', category)
         
     @tasks.loop(seconds=INTERVALS['RSS_CHECK'])
     async def check_rss_feeds(self):
         """Check RSS feeds for new content."""
-        self.logger.info("Starting RSS feed check")
-        
-        for category in ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']:
-            self.logger.info(f"Processing RSS feeds for category: {category}")
-            channel_id = CHANNEL_IDS.get(category.upper())
-            if not channel_id:
-                self.logger.warning(f"No channel ID configured for category: {category}")
-                continue
-                
-            channel = self.get_channel(channel_id)
-            if not channel:
-                # Try to find channel by name if ID doesn't work
-                category_name = category.replace('_', '-')
-                for guild in self.guilds:
-                    channel = discord.utils.get(guild.text_channels, name=category_name)
-                    if channel:
-                        break
-                
-                if not channel:
-                    self.logger.warning(f"Channel not found for category: {category}")
-                    continue
-                
-            try:
-                # Fetch all news items
-                news_items = await self.news_service.fetch_rss_news(category)
-                if not news_items:
-                    continue
-                    
-                # Get a batch summary
-                summary = await self.summarizer.summarize_batch(category, news_items)
-                
-                # Create and send the embed
-                embed = discord.Embed(
-                    description=summary,
-                    color=EMBED_COLORS[category.upper()],
-                    timestamp=datetime.now(timezone.utc)
-                )
-                embed.set_footer(text=f"News Bot - {category.replace('_', ' ').title()}")
-                
-                await channel.send(embed=embed)
-                
-                # Mark all items as processed
-                for item in news_items:
-                    self.news_service.mark_as_processed(item['id'])
-                    
-            except discord.Forbidden:
-                self.logger.error(f"Bot doesn't have permission to send messages in channel: {channel.name}")
-            except Exception as e:
-                self.logger.error(f"Error processing RSS feeds for {category}: {str(e)}")
-            
-            # Add timeout between categories
-            if category != 'startup_news':  # Don't wait after the last category
-                self.logger.info(f"Waiting 300 seconds before processing next category...")
-                await asyncio.sleep(300)
-                
+        # Most ticks have no feed due in most categories; those are skipped without a pipeline run
+        categories = self.news_service.due_rss_categories()
+        if not categories:
+            return
+        self.logger.info(f"Starting RSS feed check for {', '.join(categories)}")
+        await self.run_pipeline('rss', categories)
+        
     @tasks.loop(seconds=INTERVALS['OTHER_SOURCES'])
     async def fetch_other_sources(self):
         """Fetch news from YouTube and Google News."""
         self.logger.info("Starting other sources check")
-        
-        for category in ['ai_news', 'hackathon_news', 'tech_news', 'startup_news']:
-            self.logger.info(f"Processing other sources for category: {category}")
-            channel_id = CHANNEL_IDS.get(category.upper())
-            if not channel_id:
-                self.logger.warning(f"No channel ID configured for category: {category}")
-                continue
-                
-            channel = self.get_channel(channel_id)
-            if not channel:
-                # Try to find channel by name if ID doesn't work
-                category_name = category.replace('_', '-')
-                for guild in self.guilds:
-                    channel = discord.utils.get(guild.text_channels, name=category_name)
-                    if channel:
-                        break
-                
-                if not channel:
-                    self.logger.warning(f"Channel not found for category: {category}")
-                    continue
-                
-            try:
-                # Fetch all news items
-                all_items = []
-                
-                # Fetch YouTube videos
-                videos = await self.news_service.fetch_youtube_news(category)
-                all_items.extend(videos)
-                
-                # Fetch Google News articles
-                articles = await self.news_service.fetch_google_news(category)
-                all_items.extend(articles)
-                
-                if not all_items:
-                    continue
-                    
-                # Get a batch summary
-                summary = await self.summarizer.summarize_batch(category, all_items)
-                
-                # Create and send the embed
-                embed = discord.Embed(
-                    description=summary,
-                    color=EMBED_COLORS[category.upper()],
-                    timestamp=datetime.now(timezone.utc)
-                )
-                embed.set_footer(text=f"News Bot - {category.replace('_', ' ').title()}")
-                
-                await channel.send(embed=embed)
-                
-                # Mark all items as processed
-                for item in all_items:
-                    self.news_service.mark_as_processed(item['id'])
-                    
-            except discord.Forbidden:
-                self.logger.error(f"Bot doesn't have permission to send messages in channel: {channel.name}")
-            except Exception as e:
-                self.logger.error(f"Error processing other sources for {category}: {str(e)}")
-            
-            # Add timeout between categories
-            if category != 'startup_news':  # Don't wait after the last category
-                self.logger.info(f"Waiting 300 seconds before processing next category...")
-                await asyncio.sleep(300)
+        await self.run_pipeline('other')
                 
+    @tasks.loop(seconds=INTERVALS['WEBSUB_MAINTAIN'])
+    async def maintain_push_subscriptions(self):
+        """Subscribe to feeds that offer WebSub push and renew expiring subscriptions."""
+        await self.news_service.websub.maintain()
+        
     @check_rss_feeds.before_loop
     @fetch_other_sources.before_loop
+    @maintain_push_subscriptions.before_loop
     async def before_tasks(self):
         """Wait for the bot to be ready before starting tasks."""
         await self.wait_until_ready()
@@ -0,0 +1,71 @@
+"""
+Command for searching the stored articles.
+"""
+
+import discord
+from datetime import datetime, timezone
+from discord.ext import commands
+from src.utils.logger import Logger
+from src.constants.app_constants import CATEGORIES, DELIVERY_CONFIG, EMBED_COLORS
+
+# Room left in an embed title for the query once the prefix and the longest category are added
+QUERY_DISPLAY_CHARS = DELIVERY_CONFIG['EMBED_TITLE_LIMIT'] - 40 - max(len(category) for category in CATEGORIES)
+
+class SearchCommands(commands.Cog):
+    def __init__(self, bot):
+        """
+        Create the cog.
+
+        Args:
+            bot (NewsBot): Bot whose news service holds the article store
+        """
+        self.logger = Logger(__name__)
+        self.article_store = bot.news_service.article_store
+
+    @staticmethod
+    def _format_result(result: dict) -> str:
+        published = ''
+        if result['published']:
+            published = f" · {datetime.fromtimestamp(result['published'], timezone.utc):%Y-%m-%d}"
+        title = discord.utils.escape_markdown(result['title'] or 'No Title')
+        return (
+            f"**[{title}]({result['url']})**\n"
+            f"{result['source']}{published}\n"
+            f"{result['snippet']}"
+        )
+
+    @commands.command(name='search')
+    async def search(self, ctx, *, text: str):
+        """Search stored articles: !search <query> [category]."""
+        words = text.split()
+        category = None
+        if len(words) > 1 and words[-1] in CATEGORIES:
+            category = words.pop()
+        query = ' '.join(words)
+
+        results = await self.article_store.search(query, category)
+        scope = f" in {category}" if category else ''
+        # The query is echoed back shortened so the title stays within Discord's limit
+        shown = query if len(query) <= QUERY_DISPLAY_CHARS else f"{query[:QUERY_DISPLAY_CHARS - 1]}…"
+        if not results:
+            await ctx.send(f"🔍 No articles found for \"{shown}\"{scope}")
+            return
+
+        embed = discord.Embed(
+            title=f"🔍 Results for \"{shown}\"{scope}",
+            color=EMBED_COLORS[category.upper()] if category else discord.Color.blurple()
+        )
+        description = ''
+        for result in results:
+            entry = self._format_result(result)
+            if len(description) + len(entry) + 2 > DELIVERY_CONFIG['EMBED_DESCRIPTION_LIMIT']:
+                break
+            description += f"{entry}\n\n"
+        embed.description = description.rstrip()
+        await ctx.send(embed=embed)
+
+    async def cog_command_error(self, ctx, error):
+        if isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send(f"⚠️ Usage: `!search <query> [category]`, categories: {', '.join(CATEGORIES)}")
+        else:
+            self.logger.error(f"Error in command {ctx.command}: {str(error)}", exc_info=False)
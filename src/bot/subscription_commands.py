@@ -0,0 +1,92 @@
+"""
+Commands for subscribing Discord channels to news categories.
+"""
+
+import discord
+from discord.ext import commands
+from src.utils.logger import Logger
+from src.constants.app_constants import CATEGORIES
+
+class SubscriptionCommands(commands.Cog):
+    def __init__(self, bot):
+        """
+        Create the cog.
+
+        Args:
+            bot (NewsBot): Bot owning the subscription registry
+        """
+        self.logger = Logger(__name__)
+        self.bot = bot
+        self.subscriptions = bot.subscriptions
+
+    @staticmethod
+    def _parse_categories(category: str) -> list:
+        """Resolve a command argument to categories: a category name, or 'all' for every category."""
+        if category == 'all':
+            return list(CATEGORIES)
+        return [category] if category in CATEGORIES else []
+
+    @commands.command(name='subscribe')
+    @commands.guild_only()
+    @commands.has_permissions(manage_channels=True)
+    async def subscribe(self, ctx, category: str):
+        """Subscribe this channel to a category, or to 'all' categories."""
+        categories = self._parse_categories(category)
+        if not categories:
+            await ctx.send(f"⚠️ Invalid category: {category}. Choose from: {', '.join(CATEGORIES)} or all")
+            return
+        added = [name for name in categories if self.subscriptions.subscribe(ctx.guild.id, ctx.channel.id, name)]
+        self.subscriptions.save()
+        if added:
+            self.logger.info(f"Subscribed #{ctx.channel.name} ({ctx.guild.name}) to {', '.join(added)}")
+            await ctx.send(f"✅ Subscribed this channel to {', '.join(added)}")
+        else:
+            await ctx.send(f"ℹ️ This channel is already subscribed to {', '.join(categories)}")
+
+    @commands.command(name='unsubscribe')
+    @commands.guild_only()
+    @commands.has_permissions(manage_channels=True)
+    async def unsubscribe(self, ctx, category: str = 'all'):
+        """Unsubscribe this channel from a category, or from all of them."""
+        removed = self.subscriptions.unsubscribe(ctx.channel.id, None if category == 'all' else category)
+        self.subscriptions.save()
+        if removed:
+            self.logger.info(f"Unsubscribed #{ctx.channel.name} ({ctx.guild.name}) from {', '.join(removed)}")
+            await ctx.send(f"✅ Unsubscribed this channel from {', '.join(removed)}")
+        else:
+            await ctx.send(f"ℹ️ This channel is not subscribed to {category}")
+
+    @commands.command(name='subscriptions')
+    @commands.guild_only()
+    async def list_subscriptions(self, ctx):
+        """List the categories this channel is subscribed to."""
+        categories = self.subscriptions.categories(ctx.channel.id)
+        if categories:
+            await ctx.send(f"📋 This channel is subscribed to {', '.join(categories)}")
+        else:
+            await ctx.send("ℹ️ This channel has no subscriptions. Use `!subscribe <category>` or `!subscribe all`")
+
+    async def cog_command_error(self, ctx, error):
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send("⚠️ You need the Manage Channels permission to change subscriptions")
+        elif isinstance(error, commands.MissingRequiredArgument):
+            await ctx.send(f"⚠️ Usage: `!{ctx.command.name} <category>`, categories: {', '.join(CATEGORIES)} or all")
+        elif isinstance(error, commands.NoPrivateMessage):
+            await ctx.send("⚠️ Subscriptions can only be managed in a server channel")
+        else:
+            self.logger.error(f"Error in command {ctx.command}: {str(error)}", exc_info=False)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Drop the subscriptions of a guild the bot was removed from."""
+        removed = self.subscriptions.remove_guild(guild.id)
+        if removed:
+            self.subscriptions.save()
+            self.logger.info(f"Removed {removed} subscribed channels of guild {guild.name} (ID: {guild.id})")
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        """Drop the subscriptions of a deleted channel."""
+        if self.subscriptions.unsubscribe(channel.id):
+            self.subscriptions.save()
+            self.logger.info(f"Removed subscriptions of deleted channel #{channel.name} (ID: {channel.id})")
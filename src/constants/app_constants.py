@@ -2,7 +2,9 @@
 Constants for the Discord News Bot application.
 """
 
-# Channel Configuration
+import os
+
+# Channel Configuration, seeds the subscription registry on first run
 CHANNEL_IDS = {
     'AI_NEWS': 1342736251022872636,
     'HACKATHON_NEWS': 1341818303630413895,
@@ -12,8 +14,45 @@ CHANNEL_IDS = {
 
 # Time Intervals (in seconds)
 INTERVALS = {
-    'RSS_CHECK': 7200,  # 2 hours
-    'OTHER_SOURCES': 21600  # 6 hours
+    'RSS_CHECK': 300,  # 5 minutes, feeds are only polled when due (see POLL_CONFIG)
+    'OTHER_SOURCES': 21600,  # 6 hours
+    'WEBSUB_MAINTAIN': 3600  # 1 hour, subscribe new feeds and renew expiring leases
+}
+
+# Pipeline Scheduling
+PIPELINE_CONFIG = {
+    'MAX_CONCURRENT_CATEGORIES': 4,
+    'STAGE_CONCURRENCY': {
+        'fetch': 4,
+        'summarize': 2
+    },
+    # Token buckets spacing out calls to rate-limited upstreams
+    'STAGE_RATE_LIMITS': {}
+}
+
+# Article Store and Search
+ARTICLE_STORE_CONFIG = {
+    'BATCH_SIZE': 500,  # queued articles that trigger an early flush
+    'FLUSH_INTERVAL': 5.0,  # seconds between flushes of the write queue
+    'MAX_DESCRIPTION_CHARS': 2000,  # plain text kept and indexed per article
+    'SEARCH_LIMIT': 10,
+    'MAX_SEARCH_LIMIT': 50,
+    'MAX_CANDIDATES': 2000,  # newest matches ranked per search, bounds latency for common words
+    'TITLE_WEIGHT': 5.0,  # bm25 weight of title matches relative to description matches
+    'SNIPPET_TOKENS': 24
+}
+
+# Discord Delivery Queue
+DELIVERY_CONFIG = {
+    'WORKERS': 8,  # sends in flight
+    'GLOBAL_RATE': 20.0,  # messages per second across all channels, below Discord's global limit of 50
+    'GLOBAL_BURST': 20,
+    'CHANNEL_RATE': 1.0,  # messages per second per channel, Discord allows 5 per 5 seconds
+    'CHANNEL_BURST': 5,
+    'MAX_RETRIES': 5,
+    'RETRY_BASE': 2.0,  # seconds before the first retry, doubled per retry with jitter
+    'EMBED_DESCRIPTION_LIMIT': 4096,  # longer roundups are split between topics
+    'EMBED_TITLE_LIMIT': 256
 }
 
 # RSS Feed URLs
@@ -40,6 +79,167 @@ RSS_FEEDS = {
     ]
 }
 
+# Feeds known to list entries strictly newest first, so reading can stop at the
+# first already-processed entry. Ranked feeds (Reddit's "hot" /.rss) must not be
+# listed: a new post ranked below a seen one would be dropped.
+CHRONOLOGICAL_FEEDS = {
+    'https://blogs.nvidia.com/feed/',
+    'https://www.wired.com/feed/tag/ai/latest/rss',
+    'https://techcrunch.com/feed/',
+    'https://www.theverge.com/rss/index.xml',
+    'https://www.pcmag.com/feeds/rss/latest',
+    'https://news.crunchbase.com/feed/'
+}
+
+# Feed Fetching Configuration
+FETCH_CONFIG = {
+    'REQUEST_TIMEOUT': 20,  # seconds, whole request including body
+    'CONNECT_TIMEOUT': 5,  # seconds
+    'MAX_CONNECTIONS': 50,
+    'PER_HOST_LIMIT': 2,  # concurrent requests per host (reddit, arxiv, ...)
+    'PER_HOST_CONNECTIONS': 4,  # pooled keep-alive connections per host
+    'KEEPALIVE_TIMEOUT': 120,  # seconds an idle connection stays pooled
+    'DNS_CACHE_TTL': 600,  # seconds
+    'PARSE_WORKERS': 4,
+    'STREAM_PARSING': True,  # parse while downloading, falling back to feedparser on malformed XML
+    'STREAM_CHUNK_BYTES': 64 * 1024,
+    'STOP_AT_PROCESSED': False,  # stop every feed at its first processed entry; otherwise only CHRONOLOGICAL_FEEDS
+    'USER_AGENT': 'Mozilla/5.0 (compatible; DiscordNewsBot/1.0)'
+}
+
+# Per-Source Circuit Breakers
+BREAKER_CONFIG = {
+    'FAILURE_THRESHOLD': 3,  # consecutive failed calls before a source is skipped
+    'RESET_TIMEOUT': 300,  # seconds before a skipped source gets a probe call
+    'MAX_RESET_TIMEOUT': 21600,  # 6 hours, the cooldown doubles after each failed probe
+    'BACKOFF_BASE': 1.0,  # seconds before the first retry, doubled per retry with jitter
+    'BACKOFF_MAX': 10.0,
+    'SOURCES': {
+        'rss': {'TIMEOUT': 15, 'RETRIES': 1},
+        'newsapi': {'TIMEOUT': 15, 'RETRIES': 2},
+        'youtube': {'TIMEOUT': 15, 'RETRIES': 2},
+        'gemini': {'TIMEOUT': 90, 'RETRIES': 2}
+    }
+}
+
+# Shared Gemini quota, applied across all categories by GeminiLimiter
+GEMINI_LIMITS = {
+    'MAX_CONCURRENCY': 2,  # requests in flight at once
+    'REQUESTS_PER_MINUTE': 15,
+    'TOKENS_PER_MINUTE': 1000000,
+    'EXPECTED_OUTPUT_TOKENS': 1000,  # added to the prompt estimate before a request is admitted
+    'QUOTA_BACKOFF': 30,  # seconds to stop admitting requests after a 429
+    'QUOTA_RETRIES': 3,  # times a request rejected for quota is queued again after the pause
+    'PRIORITIES': {'scheduled': 0, 'manual': 1}  # lower is admitted first; swap to favor manual runs
+}
+
+# Persistent Storage Paths
+DATA_DIR = 'data'
+STORAGE_PATHS = {
+    'HTTP_CACHE': os.path.join(DATA_DIR, 'http_cache.json'),
+    'DEDUP_DB': os.path.join(DATA_DIR, 'processed_items.db'),
+    'SUMMARY_CACHE': os.path.join(DATA_DIR, 'summary_cache.db'),
+    'POLL_STATE': os.path.join(DATA_DIR, 'poll_state.json'),
+    'WEBSUB_STATE': os.path.join(DATA_DIR, 'websub_subscriptions.json'),
+    'SUBSCRIPTIONS': os.path.join(DATA_DIR, 'subscriptions.json'),
+    'ARTICLE_DB': os.path.join(DATA_DIR, 'articles.db'),
+    'DIGEST_STATE': os.path.join(DATA_DIR, 'digest_topics.json')
+}
+
+# Adaptive Feed Polling
+POLL_CONFIG = {
+    'INITIAL_INTERVAL': 7200,  # 2 hours
+    'MIN_INTERVAL': 600,  # 10 minutes
+    'MAX_INTERVAL': 43200,  # 12 hours
+    'TARGET_NEW_ITEMS_PER_POLL': 3,
+    'BACKOFF_FACTOR': 1.5,  # applied when a poll finds nothing new
+    'SMOOTHING': 0.5,  # weight of the latest estimate against the previous interval
+    'JITTER': 0.1  # +/- fraction randomizing each next poll time
+}
+
+# Processed Item Deduplication
+DEDUP_CONFIG = {
+    'TTL': 2592000,  # 30 days
+    'EVICTION_INTERVAL': 86400,  # 1 day
+    'BLOOM_FILTER': True,
+    'BLOOM_CAPACITY': 200000,
+    'BLOOM_ERROR_RATE': 0.01
+}
+
+# Summarization Limits
+SUMMARIZER_CONFIG = {
+    'MAX_PROMPT_TOKENS': 8000,  # larger batches are split into sub-batches
+    'PROMPT_OVERHEAD_TOKENS': 500,  # instructions around the items
+    'MAX_ITEM_TOKENS': 300,  # long descriptions (arxiv abstracts) are truncated
+    'MAP_CONCURRENCY': 3
+}
+
+# Rolling Digest
+DIGEST_CONFIG = {
+    'INCREMENTAL': True,  # merge new items into earlier topics instead of summarizing each batch from scratch
+    'UPDATE_ITEM_TOKENS': 30,  # description lead sent for items joining a known topic
+    'TOPIC_TTL': 172800,  # 48 hours without new items before a topic is forgotten
+    'MAX_TOPICS': 50,  # per category, least recently updated dropped first
+    'MATCH_THRESHOLD': 0.5,  # share of an item's title words found in a topic
+    'MIN_SHARED_TERMS': 2,
+    'MAX_TERM_FREQUENCY': 0.5,  # ignore words found in more than half of the topics
+    'MAX_TOPIC_TERMS': 40  # most frequent title words kept per topic
+}
+
+# Near-Duplicate Clustering
+CLUSTERING_CONFIG = {
+    'TITLE_THRESHOLD': 0.6,  # Jaccard similarity of title words
+    'DESCRIPTION_THRESHOLD': 0.5,  # Jaccard similarity of description 3-word shingles
+    'MAX_DESCRIPTION_CHARS': 1000,
+    'SHINGLE_SAMPLING': 4,  # index 1 in N shingles of every description in a batch...
+    'MIN_SHINGLES_TO_SAMPLE': 40,  # ...once any description has this many
+    'MAX_FEATURE_POSTINGS': 200  # features of more items only narrow down candidates in large batches
+}
+
+# Summary Memoization
+SUMMARY_CACHE_CONFIG = {
+    'PERSIST': True,
+    'MAX_ENTRIES': 500,
+    'MAX_BYTES': 5242880  # 5MB of summaries held in memory
+}
+
+# News Categories
+CATEGORIES = list(RSS_FEEDS.keys())
+
+# External API Endpoints
+API_ENDPOINTS = {
+    'NEWS_API': 'https://newsapi.org/v2/everything',
+    'YOUTUBE_SEARCH': 'https://www.googleapis.com/youtube/v3/search'
+}
+
+# HTTP API Server
+API_CONFIG = {
+    'HOST': '0.0.0.0',
+    'PORT': 8080,
+    'JOB_QUEUE_SIZE': 20,  # pending trigger jobs before requests get 429
+    'JOB_WORKERS': 2,
+    'JOB_HISTORY': 100  # finished jobs kept for /api/jobs lookups
+}
+
+# WebSub Push Subscriptions
+WEBSUB_CONFIG = {
+    # Public base URL of the API server, e.g. https://news.example.com; push is disabled when unset
+    'CALLBACK_URL': os.getenv('WEBSUB_CALLBACK_URL', '').rstrip('/'),
+    'LEASE_SECONDS': 864000,  # 10 days requested from the hub
+    'RENEW_MARGIN': 86400,  # renew leases expiring within a day
+    'VERIFY_TIMEOUT': 3600,  # resubscribe if the hub has not verified within an hour
+    'REDISCOVER_INTERVAL': 86400,  # recheck feeds without a hub once a day
+    'MAX_PAYLOAD_BYTES': 1024 * 1024
+}
+
+# Logging
+LOGGING_CONFIG = {
+    'DIRECTORY': 'logs',
+    'MAX_BYTES': 10485760,  # 10MB
+    'BACKUP_COUNT': 5,
+    'FORMAT': os.getenv('LOG_FORMAT', 'text')  # 'text' or 'json'
+}
+
 # Search Queries
 SEARCH_QUERIES = {
     'ai_news': 'artificial intelligence news',
@@ -0,0 +1,84 @@
+"""
+Normalized news item shared by every source and pipeline stage.
+"""
+
+import hashlib
+import sys
+from dataclasses import dataclass, field, replace
+from urllib.parse import urlsplit
+from src.utils.url_canonicalizer import canonicalize_url
+
+def _content_hash(title: str, description: str) -> bytes:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(title.encode('utf-8'))
+    digest.update(b'\x00')
+    digest.update(description.encode('utf-8'))
+    return digest.digest()
+
+@dataclass(frozen=True, slots=True)
+class NewsItem:
+    """
+    One news item from any source.
+
+    Attributes:
+        id (str): Dedup key, computed once when the item is built
+        title (str): Headline
+        url (str): Link to the article or video
+        source (str): Publisher name, e.g. 'techcrunch.com', 'YouTube' or a NewsAPI source
+        origin (str): Source group that produced the item: 'rss', 'youtube' or 'newsapi'
+        description (str): Summary text, may contain HTML
+        published (int): Publication time as a UTC timestamp, None if unknown
+        thumbnail (str): Preview image URL, if any
+        related_sources (tuple): (source, url) pairs of near-duplicates collapsed into this item
+        content_hash (bytes): 16-byte hash of the title and description, computed on creation
+        url_key (str): Cross-source dedup key from the canonical URL, empty without a usable URL
+    """
+
+    id: str
+    title: str
+    url: str
+    source: str
+    origin: str
+    description: str = ''
+    published: int = None
+    thumbnail: str = ''
+    related_sources: tuple = ()
+    content_hash: bytes = field(init=False, repr=False, compare=False)
+    url_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, 'content_hash', _content_hash(self.title, self.description))
+        canonical_url = canonicalize_url(self.url)
+        object.__setattr__(self, 'url_key', f"url:{canonical_url}" if canonical_url else '')
+
+    @staticmethod
+    def feed_key(feed_url: str, entry_id: str) -> str:
+        """Build the dedup key of an RSS/Atom entry."""
+        return f"{feed_url}_{entry_id}"
+
+    @classmethod
+    def from_feed_entry(cls, feed_url: str, entry: dict) -> 'NewsItem':
+        """
+        Build an item from an entry dict produced by FeedFetcher.
+
+        Args:
+            feed_url (str): Feed the entry came from
+            entry (dict): Entry with id, title, link, description and published
+
+        Returns:
+            NewsItem: The item
+        """
+        return cls(
+            id=cls.feed_key(feed_url, entry['id']),
+            title=entry['title'] or '',
+            url=(entry['link'] or '').strip(),
+            # Interned so every item of a feed shares one string
+            source=sys.intern((urlsplit(feed_url).hostname or feed_url).removeprefix('www.')),
+            origin='rss',
+            description=entry['description'] or '',
+            published=entry.get('published')
+        )
+
+    def with_related(self, items: list) -> 'NewsItem':
+        """Return a copy listing the source and URL of each of items as related sources."""
+        return replace(self, related_sources=tuple((item.source, item.url) for item in items))
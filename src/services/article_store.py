@@ -0,0 +1,243 @@
+"""
+Persistent store of fetched articles with SQLite FTS5 full-text search.
+
+Writes are buffered and flushed in batches on a dedicated thread that owns
+the write connection, so storing articles never blocks the event loop.
+Searches run on a second thread with a read-only connection, which WAL
+mode lets proceed while a batch is being written.
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.logger import Logger
+from src.utils.metrics import ARTICLES_STORED, ARTICLE_SEARCH_SECONDS, ARTICLE_STORE_BATCHES
+from src.constants.app_constants import ARTICLE_STORE_CONFIG, STORAGE_PATHS
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+TERM_PATTERN = re.compile(r'\w+\*?')
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS articles ('
+    'id INTEGER PRIMARY KEY, item_id TEXT NOT NULL UNIQUE, category TEXT NOT NULL, '
+    'title TEXT NOT NULL, description TEXT NOT NULL, url TEXT NOT NULL, source TEXT NOT NULL, '
+    'origin TEXT NOT NULL, published INTEGER, fetched_at REAL NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS idx_articles_category ON articles (category)',
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    "title, description, content='articles', content_rowid='id', tokenize='porter unicode61')",
+    'CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN '
+    'INSERT INTO articles_fts (rowid, title, description) VALUES (new.id, new.title, new.description); END',
+    'CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN '
+    "INSERT INTO articles_fts (articles_fts, rowid, title, description) "
+    "VALUES ('delete', old.id, old.title, old.description); END"
+)
+
+# Rowid of the oldest of the newest N matches; FTS5 walks matches in rowid order, so this is cheap
+CANDIDATE_FLOOR_SQL = (
+    "SELECT rowid FROM articles_fts WHERE articles_fts MATCH ? ORDER BY rowid DESC LIMIT 1 OFFSET ?"
+)
+
+# The same within one category, so newer matches in other categories do not push its matches out
+CATEGORY_CANDIDATE_FLOOR_SQL = (
+    "SELECT articles_fts.rowid FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+    "WHERE articles_fts MATCH ? AND a.category = ? ORDER BY articles_fts.rowid DESC LIMIT 1 OFFSET ?"
+)
+
+SEARCH_SQL = (
+    "SELECT a.title, a.url, a.source, a.category, a.published, "
+    "snippet(articles_fts, 1, '**', '**', '…', ?) "
+    "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+    "WHERE articles_fts MATCH ? AND articles_fts.rowid >= ?{category_filter} "
+    "ORDER BY bm25(articles_fts, ?, 1.0) LIMIT ?"
+)
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query matching all of its words.
+
+    Words are quoted so FTS5 operators in user input are treated as text; a
+    trailing '*' on a word is kept as a prefix search.
+
+    Returns:
+        str: FTS5 MATCH expression, empty if the query has no words
+    """
+    terms = []
+    for term in TERM_PATTERN.findall(query):
+        prefix = term.endswith('*')
+        term = term.rstrip('*')
+        terms.append(f'"{term}"*' if prefix else f'"{term}"')
+    return ' '.join(terms)
+
+class ArticleStore:
+    def __init__(self, path: str = STORAGE_PATHS['ARTICLE_DB']):
+        """
+        Open (or create) the article database.
+
+        Args:
+            path (str): SQLite database path
+        """
+        self.logger = Logger(__name__)
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._write_conn = None
+        self._read_conn = None
+        # Each connection is owned by one thread, sqlite3 connections are bound to their thread
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='article-writer')
+        self._reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='article-reader')
+        self._writer.submit(self._open_writer).result()
+        self._reader.submit(self._open_reader).result()
+        self._pending = []
+        self._batch_ready = asyncio.Event()
+        self._flush_task = None
+        self._flush_lock = asyncio.Lock()
+        self._stats = {'stored': 0, 'batches': 0}
+
+    def _open_writer(self):
+        self._write_conn = sqlite3.connect(self.path)
+        self._write_conn.execute('PRAGMA journal_mode=WAL')
+        self._write_conn.execute('PRAGMA synchronous=NORMAL')
+        with self._write_conn:
+            for statement in SCHEMA:
+                self._write_conn.execute(statement)
+
+    def _open_reader(self):
+        self._read_conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+
+    def start(self):
+        """Start the periodic flush task on the running event loop."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_periodically(), name='article-store-flush')
+
+    async def _flush_periodically(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), ARTICLE_STORE_CONFIG['FLUSH_INTERVAL'])
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+    @staticmethod
+    def _row(category: str, item, fetched_at: float) -> tuple:
+        description = WHITESPACE_PATTERN.sub(' ', TAG_PATTERN.sub(' ', item.description)).strip()
+        return (
+            item.id, category, item.title, description[:ARTICLE_STORE_CONFIG['MAX_DESCRIPTION_CHARS']],
+            item.url, item.source, item.origin, item.published, fetched_at
+        )
+
+    def add(self, category: str, news_items: list):
+        """
+        Queue items to be stored; items already stored under the same ID are ignored.
+
+        Args:
+            category (str): News category the items were fetched for
+            news_items (list): NewsItems
+        """
+        if not news_items:
+            return
+        now = time.time()
+        self._pending.extend(self._row(category, item, now) for item in news_items)
+        if len(self._pending) >= ARTICLE_STORE_CONFIG['BATCH_SIZE']:
+            self._batch_ready.set()
+
+    def _write(self, rows: list) -> int:
+        with self._write_conn:
+            cursor = self._write_conn.executemany(
+                'INSERT OR IGNORE INTO articles (item_id, category, title, description, url, source, '
+                'origin, published, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+        return cursor.rowcount
+
+    async def flush(self):
+        """Write the queued items in one transaction on the writer thread."""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            rows, self._pending = self._pending, []
+            try:
+                stored = await asyncio.get_running_loop().run_in_executor(self._writer, self._write, rows)
+            except Exception as e:
+                self.logger.error(f"Error storing {len(rows)} articles: {str(e)}", exc_info=False)
+                return
+            self._stats['stored'] += stored
+            self._stats['batches'] += 1
+            ARTICLES_STORED.inc(stored)
+            ARTICLE_STORE_BATCHES.inc()
+
+    def _search(self, match: str, category, limit: int) -> list:
+        # Scoring every match of a very common word is linear in the corpus,
+        # so only the newest matches are ranked
+        offset = ARTICLE_STORE_CONFIG['MAX_CANDIDATES'] - 1
+        if category:
+            floor = self._read_conn.execute(CATEGORY_CANDIDATE_FLOOR_SQL, (match, category, offset)).fetchone()
+        else:
+            floor = self._read_conn.execute(CANDIDATE_FLOOR_SQL, (match, offset)).fetchone()
+        sql = SEARCH_SQL.format(category_filter=' AND a.category = ?' if category else '')
+        params = [ARTICLE_STORE_CONFIG['SNIPPET_TOKENS'], match, floor[0] if floor else 0]
+        if category:
+            params.append(category)
+        params.extend([ARTICLE_STORE_CONFIG['TITLE_WEIGHT'], limit])
+        return [
+            {
+                'title': title,
+                'url': url,
+                'source': source,
+                'category': row_category,
+                'published': published,
+                'snippet': snippet
+            }
+            for title, url, source, row_category, published, snippet in self._read_conn.execute(sql, params)
+        ]
+
+    async def search(self, query: str, category: str = None, limit: int = ARTICLE_STORE_CONFIG['SEARCH_LIMIT']) -> list:
+        """
+        Find stored articles matching every word of a query, best matches first.
+
+        Ranking considers the newest ARTICLE_STORE_CONFIG['MAX_CANDIDATES']
+        matches, so latency stays bounded as the store grows.
+
+        Args:
+            query (str): Free-text query, a trailing '*' on a word matches prefixes
+            category (str, optional): Only return articles of this category
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Result dicts with title, url, source, category, published and snippet
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        limit = max(1, min(limit, ARTICLE_STORE_CONFIG['MAX_SEARCH_LIMIT']))
+        with ARTICLE_SEARCH_SECONDS.time():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._reader, self._search, match, category, limit
+            )
+
+    def _count(self) -> int:
+        return self._read_conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+
+    async def count(self) -> int:
+        """Return the number of stored articles."""
+        return await asyncio.get_running_loop().run_in_executor(self._reader, self._count)
+
+    def stats(self) -> dict:
+        """Return the number of articles stored and batches written since startup, and queued items."""
+        return {**self._stats, 'pending': len(self._pending)}
+
+    async def close(self):
+        """Write the queued items and close both connections."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._writer, self._write_conn.close)
+        await loop.run_in_executor(self._reader, self._read_conn.close)
+        self._writer.shutdown()
+        self._reader.shutdown()
@@ -0,0 +1,90 @@
+"""
+Map of the text channels the bot can see, kept current from gateway events.
+"""
+
+from src.utils.logger import Logger
+
+class ChannelCache:
+    def __init__(self):
+        self.logger = Logger(__name__)
+        self._by_id = {}
+        self._by_name = {}
+        self._resolved = {}
+        self._subscriptions_version = None
+
+    def rebuild(self, guilds: list):
+        """
+        Index every text channel of the given guilds, replacing the current map.
+
+        Args:
+            guilds (list): Guilds the bot is connected to
+        """
+        self._by_id.clear()
+        self._by_name.clear()
+        self._resolved.clear()
+        for guild in guilds:
+            for channel in guild.text_channels:
+                self.add(channel)
+        self.logger.info(f"Indexed {len(self._by_id)} text channels in {len(guilds)} guilds")
+
+    def add(self, channel):
+        """Index a text channel."""
+        self._by_id[channel.id] = channel
+        self._by_name.setdefault(channel.name, {})[channel.id] = channel
+        self._resolved.clear()
+
+    def remove(self, channel):
+        """Drop a channel from the index."""
+        if self._by_id.pop(channel.id, None) is None:
+            return
+        named = self._by_name.get(channel.name, {})
+        named.pop(channel.id, None)
+        if not named:
+            self._by_name.pop(channel.name, None)
+        self._resolved.clear()
+
+    def update(self, before, after):
+        """Re-index a channel that was renamed or changed."""
+        self.remove(before)
+        self.add(after)
+
+    def remove_guild(self, guild):
+        """Drop every channel of a guild the bot left."""
+        for channel in [channel for channel in self._by_id.values() if channel.guild.id == guild.id]:
+            self.remove(channel)
+
+    def get(self, channel_id: int):
+        """Return the channel with an ID, or None if the bot cannot see it."""
+        return self._by_id.get(channel_id)
+
+    def resolve(self, category: str, subscriptions) -> list:
+        """
+        Return the visible channels subscribed to a category.
+
+        Results are memoized until a channel event or a subscription change.
+        A category without visible subscribers falls back to a channel named
+        after it, e.g. 'ai-news'.
+
+        Args:
+            category (str): News category
+            subscriptions (SubscriptionRegistry): Registry of subscribed channels
+
+        Returns:
+            list: Channels to post the category to
+        """
+        if subscriptions.version != self._subscriptions_version:
+            self._resolved.clear()
+            self._subscriptions_version = subscriptions.version
+        channels = self._resolved.get(category)
+        if channels is None:
+            channels = [
+                self._by_id[channel_id]
+                for channel_id in subscriptions.subscribers(category)
+                if channel_id in self._by_id
+            ]
+            if not channels:
+                named = self._by_name.get(category.replace('_', '-'))
+                if named:
+                    channels = [next(iter(named.values()))]
+            self._resolved[category] = channels
+        return channels
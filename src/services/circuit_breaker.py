@@ -0,0 +1,190 @@
+"""
+Per-source circuit breakers with timeouts and jittered retries.
+
+Every upstream (each RSS feed, NewsAPI, YouTube and Gemini) gets its own
+breaker. After repeated failures the breaker opens and calls fail
+immediately, so a dead source costs nothing per cycle; after a cooldown a
+single half-open probe decides whether to close it again.
+"""
+
+import asyncio
+import random
+import time
+import aiohttp
+from src.utils.logger import Logger
+from src.constants.app_constants import BREAKER_CONFIG
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504}
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a source whose circuit is open."""
+
+class QuotaExceededError(RuntimeError):
+    """Raised by a call rejected for quota, which the caller waits out instead of the breaker."""
+
+def is_retryable(error: Exception) -> bool:
+    """Return True for errors worth retrying: timeouts, connection failures and 429/5xx responses."""
+    if isinstance(error, QuotaExceededError):
+        return False
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)):
+        return True
+    # aiohttp errors carry .status, Google API errors carry .code
+    status = getattr(error, 'status', None) or getattr(error, 'code', None)
+    return status in RETRYABLE_STATUSES
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = BREAKER_CONFIG['FAILURE_THRESHOLD'],
+                 reset_timeout: float = BREAKER_CONFIG['RESET_TIMEOUT'],
+                 max_reset_timeout: float = BREAKER_CONFIG['MAX_RESET_TIMEOUT']):
+        """
+        Create a closed breaker.
+
+        Args:
+            name (str): Source name, e.g. 'rss:<url>', 'newsapi', 'youtube' or 'gemini'
+            failure_threshold (int): Consecutive failed calls that open the circuit
+            reset_timeout (float): Seconds the circuit stays open before a probe
+            max_reset_timeout (float): Cap for the cooldown, which doubles after each failed probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.last_error = None
+        self.calls = 0
+        self.failures = 0
+        self.rejected = 0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead, moving an expired open circuit to half-open."""
+        if self.state == OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.calls += 1
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.reset_timeout = self.base_reset_timeout
+        self._probing = False
+
+    def record_failure(self, error: Exception) -> bool:
+        """
+        Count a failed call.
+
+        Returns:
+            bool: True if this failure opened the circuit
+        """
+        self.calls += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        if self.state == HALF_OPEN:
+            self.reset_timeout = min(self.reset_timeout * 2, self.max_reset_timeout)
+        opens = self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        )
+        if opens:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+        self._probing = False
+        return opens
+
+    def describe(self) -> dict:
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'calls': self.calls,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'reset_timeout': self.reset_timeout,
+            'retry_in': retry_in,
+            'last_error': self.last_error
+        }
+
+class BreakerRegistry:
+    def __init__(self):
+        self.logger = Logger(__name__)
+        self._breakers = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Return the breaker for a source, creating it on first use."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+        return breaker
+
+    async def call(self, name: str, kind: str, func, before_retry=None):
+        """
+        Call a source through its breaker with a timeout and jittered exponential backoff.
+
+        Retries only transient errors, and never while probing a half-open
+        circuit. A call counts as one breaker failure once its retries are spent.
+        A QuotaExceededError is neither retried nor counted: the source is up
+        and only asks the caller to slow down.
+
+        Args:
+            name (str): Source name identifying the breaker
+            kind (str): Key in BREAKER_CONFIG['SOURCES'] with the timeout and retry count
+            func: Coroutine function making one attempt
+            before_retry (optional): Coroutine function awaited before each retry, outside the timeout
+
+        Returns:
+            The result of func
+
+        Raises:
+            CircuitOpenError: If the circuit is open
+            Exception: The last error of func once retries are exhausted
+        """
+        breaker = self.get(name)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {name}, last error: {breaker.last_error}")
+
+        settings = BREAKER_CONFIG['SOURCES'][kind]
+        retries = 0 if breaker.state == HALF_OPEN else settings['RETRIES']
+        for attempt in range(retries + 1):
+            try:
+                result = await asyncio.wait_for(func(), settings['TIMEOUT'])
+            except (asyncio.CancelledError, QuotaExceededError):
+                breaker._probing = False
+                raise
+            except Exception as e:
+                if attempt < retries and is_retryable(e):
+                    delay = min(BREAKER_CONFIG['BACKOFF_MAX'], BREAKER_CONFIG['BACKOFF_BASE'] * 2 ** attempt)
+                    await asyncio.sleep(random.uniform(delay / 2, delay))
+                    if before_retry is not None:
+                        await before_retry()
+                    continue
+                if breaker.record_failure(e):
+                    self.logger.warning(
+                        f"Circuit opened for {name} for {breaker.reset_timeout:.0f}s: {breaker.last_error}"
+                    )
+                raise
+            else:
+                if breaker.state != CLOSED:
+                    self.logger.info(f"Circuit closed for {name}")
+                breaker.record_success()
+                return result
+
+    def describe(self) -> dict:
+        """Return the state of every breaker, keyed by source name."""
+        return {name: breaker.describe() for name, breaker in sorted(self._breakers.items())}
+
+BREAKERS = BreakerRegistry()
@@ -0,0 +1,160 @@
+"""
+Local near-duplicate clustering of news items.
+"""
+
+import re
+from collections import Counter, defaultdict
+from itertools import chain
+from src.models.news_item import NewsItem
+from src.constants.app_constants import CLUSTERING_CONFIG
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or that the
+this to was were will with after about into over new how why what says said
+""".split())
+
+def _tokens(text: str) -> list:
+    """Lowercase word tokens with HTML tags and stopwords removed."""
+    text = TAG_PATTERN.sub(' ', text or '').lower()
+    return [token for token in TOKEN_PATTERN.findall(text) if token not in STOPWORDS]
+
+def title_terms(title: str) -> frozenset:
+    """Return the distinct words of a title that clustering compares, without stopwords."""
+    return frozenset(_tokens(title))
+
+def _features(item: NewsItem) -> tuple:
+    """
+    Extract the comparison features of an item.
+
+    Returns:
+        tuple: (title word set, set of 3-word shingle tuples from the description)
+    """
+    body = _tokens(item.description[:CLUSTERING_CONFIG['MAX_DESCRIPTION_CHARS']])
+    return title_terms(item.title), frozenset(zip(body, body[1:], body[2:]))
+
+def _sample_shingles(shingle_sets: list) -> list:
+    """
+    Keep the shingles whose hash falls in a fixed residue class, if any description is long.
+
+    Filtering two sets by the same hash condition estimates their Jaccard
+    similarity at a fraction of the indexing cost, but only when both are
+    filtered: a sample compared with a full set underestimates it. So every
+    set of a batch is sampled, or none.
+    """
+    if all(len(shingles) < CLUSTERING_CONFIG['MIN_SHINGLES_TO_SAMPLE'] for shingles in shingle_sets):
+        return shingle_sets
+    sampling = CLUSTERING_CONFIG['SHINGLE_SAMPLING']
+    return [
+        frozenset(shingle for shingle in shingles if hash(shingle) % sampling == 0)
+        for shingles in shingle_sets
+    ]
+
+def _find(parents: list, i: int) -> int:
+    while parents[i] != i:
+        parents[i] = parents[parents[i]]
+        i = parents[i]
+    return i
+
+def _similar_pairs(feature_sets: list, threshold: float):
+    """
+    Yield index pairs whose Jaccard similarity reaches the threshold.
+
+    Identical feature sets are paired directly. Other candidates come from
+    an inverted index, so only items sharing at least one feature are
+    compared and overlap counts are computed in one pass over each item's
+    postings instead of over every pair. In large batches, features with
+    very long postings only narrow down the candidates, and the similarity
+    of each candidate is still computed on the full sets.
+    """
+    postings = defaultdict(list)
+    first_with_features = {}
+    for index, features in enumerate(feature_sets):
+        if not features:
+            continue
+        first = first_with_features.setdefault(features, index)
+        if first != index:
+            yield first, index
+            continue
+        for feature in features:
+            postings[feature].append(index)
+
+    max_postings = CLUSTERING_CONFIG['MAX_FEATURE_POSTINGS']
+    for index in first_with_features.values():
+        features = feature_sets[index]
+        matches = [postings[feature] for feature in features]
+        frequent = [indexes for indexes in matches if len(indexes) > max_postings]
+        overlaps = Counter(chain.from_iterable(
+            indexes for indexes in matches if len(indexes) <= max_postings
+        ))
+        if frequent and not overlaps:
+            # Every feature is common, so fall back to the shortest postings
+            overlaps = Counter(min(frequent, key=len))
+        for other, shared in overlaps.items():
+            if other <= index:
+                continue
+            if frequent:
+                shared = len(features & feature_sets[other])
+            union = len(features) + len(feature_sets[other]) - shared
+            if shared / union >= threshold:
+                yield index, other
+
+def cluster_items(news_items: list) -> list:
+    """
+    Group near-duplicate news items.
+
+    Two items are duplicates when they share a canonical URL, or when their
+    titles or their description shingles are similar enough; clusters are
+    the transitive closure.
+
+    Args:
+        news_items (list): News items to cluster
+
+    Returns:
+        list: List of clusters, each a list of items in their original order
+    """
+    features = [_features(item) for item in news_items]
+    parents = list(range(len(news_items)))
+
+    first_with_url = {}
+    for index, item in enumerate(news_items):
+        if item.url_key:
+            parents[index] = first_with_url.setdefault(item.url_key, index)
+
+    for feature_sets, threshold in (
+        ([title for title, _ in features], CLUSTERING_CONFIG['TITLE_THRESHOLD']),
+        (_sample_shingles([shingles for _, shingles in features]), CLUSTERING_CONFIG['DESCRIPTION_THRESHOLD'])
+    ):
+        for i, j in _similar_pairs(feature_sets, threshold):
+            root_i, root_j = _find(parents, i), _find(parents, j)
+            if root_i != root_j:
+                parents[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters = defaultdict(list)
+    for index, item in enumerate(news_items):
+        clusters[_find(parents, index)].append(item)
+    return list(clusters.values())
+
+def collapse_duplicates(news_items: list) -> list:
+    """
+    Replace each cluster of near-duplicates with one representative item.
+
+    The representative is the member with the longest description, and it
+    carries the source name and URL of every member in related_sources.
+
+    Args:
+        news_items (list): News items to deduplicate
+
+    Returns:
+        list: One item per cluster
+    """
+    collapsed = []
+    for cluster in cluster_items(news_items):
+        if len(cluster) == 1:
+            collapsed.append(cluster[0])
+            continue
+        representative = max(cluster, key=lambda item: len(item.description))
+        collapsed.append(representative.with_related(cluster))
+    return collapsed
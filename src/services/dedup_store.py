@@ -0,0 +1,112 @@
+"""
+Persistent store of already processed news item IDs.
+"""
+
+import os
+import sqlite3
+import time
+from src.utils.bloom_filter import BloomFilter
+from src.utils.logger import Logger
+from src.constants.app_constants import STORAGE_PATHS, DEDUP_CONFIG
+
+class DedupStore:
+    def __init__(self, path: str = STORAGE_PATHS['DEDUP_DB'], ttl: int = DEDUP_CONFIG['TTL'],
+                 use_bloom_filter: bool = DEDUP_CONFIG['BLOOM_FILTER']):
+        """
+        Open (or create) the SQLite-backed store.
+
+        Args:
+            path (str): SQLite database path
+            ttl (int): Seconds an item stays marked as processed
+            use_bloom_filter (bool): Keep an in-memory Bloom filter in front of SQLite
+        """
+        self.logger = Logger(__name__)
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS processed_items ('
+            'item_id TEXT PRIMARY KEY, processed_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_processed_items_processed_at '
+            'ON processed_items (processed_at)'
+        )
+        self._conn.commit()
+        self._bloom = None
+        if use_bloom_filter:
+            self._bloom = BloomFilter(DEDUP_CONFIG['BLOOM_CAPACITY'], DEDUP_CONFIG['BLOOM_ERROR_RATE'])
+        self._last_eviction = 0.0
+        self.evict_expired()
+
+    def _rebuild_bloom_filter(self):
+        """Reload the Bloom filter from the IDs currently in the database."""
+        if self._bloom is None:
+            return
+        self._bloom.clear()
+        for (item_id,) in self._conn.execute('SELECT item_id FROM processed_items'):
+            self._bloom.add(item_id)
+
+    def evict_expired(self) -> int:
+        """
+        Delete items older than the TTL.
+
+        Returns:
+            int: Number of evicted items
+        """
+        now = time.time()
+        with self._conn:
+            cursor = self._conn.execute(
+                'DELETE FROM processed_items WHERE processed_at < ?', (now - self.ttl,)
+            )
+        self._last_eviction = now
+        # Bloom filters cannot forget keys, so rebuild after evicting
+        self._rebuild_bloom_filter()
+        if cursor.rowcount:
+            self.logger.info(f"Evicted {cursor.rowcount} expired processed items")
+        return cursor.rowcount
+
+    def __contains__(self, item_id: str) -> bool:
+        """Return True if the item was processed within the TTL."""
+        if self._bloom is not None and item_id not in self._bloom:
+            return False
+        row = self._conn.execute(
+            'SELECT 1 FROM processed_items WHERE item_id = ? AND processed_at >= ?',
+            (item_id, time.time() - self.ttl)
+        ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM processed_items').fetchone()[0]
+
+    def add(self, item_id: str):
+        """Mark a single item as processed."""
+        self.add_many([item_id])
+
+    def add_many(self, item_ids):
+        """
+        Mark several items as processed in a single transaction.
+
+        Args:
+            item_ids: Iterable of item IDs
+        """
+        item_ids = list(item_ids)
+        if not item_ids:
+            return
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO processed_items (item_id, processed_at) VALUES (?, ?)',
+                [(item_id, now) for item_id in item_ids]
+            )
+        if self._bloom is not None:
+            for item_id in item_ids:
+                self._bloom.add(item_id)
+        if now - self._last_eviction >= DEDUP_CONFIG['EVICTION_INTERVAL']:
+            self.evict_expired()
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,163 @@
+"""
+Outbound queue delivering roundups to Discord channels.
+
+Sends run on their own workers, spaced by a global token bucket and one
+bucket per channel, so a slow or throttled channel never holds up the
+fetch and summarize stages or the other channels. Failed sends are retried
+from the part that failed with jittered backoff, without occupying a worker
+while they wait.
+"""
+
+import asyncio
+import random
+import discord
+from src.services.circuit_breaker import is_retryable
+from src.utils.logger import Logger
+from src.utils.metrics import DISCORD_DELIVERIES, DISCORD_SEND_SECONDS
+from src.utils.rate_limiter import TokenBucket
+from src.constants.app_constants import DELIVERY_CONFIG
+
+class DeliveryQueue:
+    def __init__(self, on_channel_gone=None):
+        """
+        Create the queue.
+
+        Args:
+            on_channel_gone (optional): Function called with the ID of a channel that no longer exists
+        """
+        self.logger = Logger(__name__)
+        self.on_channel_gone = on_channel_gone
+        self._queue = asyncio.Queue()
+        self._global_bucket = TokenBucket(DELIVERY_CONFIG['GLOBAL_RATE'], DELIVERY_CONFIG['GLOBAL_BURST'])
+        self._channel_buckets = {}
+        self._workers = []
+        self._retry_handles = set()
+        self._pending = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def start(self):
+        """Start the worker tasks on the running event loop."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"delivery-worker-{i}")
+                for i in range(DELIVERY_CONFIG['WORKERS'])
+            ]
+
+    async def stop(self):
+        """Cancel the workers and pending retries; undelivered messages are dropped."""
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._pending:
+            self.logger.warning(f"Dropped {self._pending} undelivered messages on shutdown")
+
+    def is_running(self) -> bool:
+        """Return True if every worker task is alive."""
+        return bool(self._workers) and not any(worker.done() for worker in self._workers)
+
+    def depth(self) -> int:
+        """Return the number of deliveries queued, in progress or waiting to retry."""
+        return self._pending
+
+    async def join(self):
+        """Wait until every submitted delivery has finished, including retries."""
+        await self._idle.wait()
+
+    def submit(self, category: str, channel, embeds: list):
+        """
+        Queue embeds to be sent to a channel in order, one message each.
+
+        Args:
+            category (str): News category, for metrics and logs
+            channel (discord.TextChannel): Channel to post to
+            embeds (list): Embeds to send
+        """
+        self._pending += 1
+        self._idle.clear()
+        self._queue.put_nowait({
+            'category': category,
+            'channel': channel,
+            'embeds': embeds,
+            'next_part': 0,
+            'attempts': 0
+        })
+
+    def _channel_bucket(self, channel_id: int) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel_id)
+        if bucket is None:
+            bucket = self._channel_buckets[channel_id] = TokenBucket(
+                DELIVERY_CONFIG['CHANNEL_RATE'], DELIVERY_CONFIG['CHANNEL_BURST']
+            )
+        return bucket
+
+    def _requeue_later(self, delivery: dict, delay: float):
+        """Put a delivery back on the queue after delay seconds without holding a worker."""
+        def requeue():
+            self._retry_handles.discard(handle)
+            self._queue.put_nowait(delivery)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    def _finish(self, delivery: dict, outcome: str):
+        DISCORD_DELIVERIES.inc(category=delivery['category'], outcome=outcome)
+        self._pending -= 1
+        if not self._pending:
+            self._idle.set()
+
+    async def _worker(self):
+        while True:
+            delivery = await self._queue.get()
+            try:
+                await self._deliver(delivery)
+            except Exception as e:
+                self.logger.error(f"Error delivering {delivery['category']}: {str(e)}", exc_info=False)
+                self._finish(delivery, 'failed')
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, delivery: dict):
+        """Send the remaining parts of a delivery, requeueing it if the channel is busy or a send fails."""
+        channel = delivery['channel']
+        bucket = self._channel_bucket(channel.id)
+        while delivery['next_part'] < len(delivery['embeds']):
+            delay = bucket.try_acquire()
+            if delay > 0:
+                self._requeue_later(delivery, delay)
+                return
+            await self._global_bucket.acquire()
+            try:
+                with DISCORD_SEND_SECONDS.time(category=delivery['category']):
+                    await channel.send(embed=delivery['embeds'][delivery['next_part']])
+            except discord.NotFound:
+                self.logger.warning(f"Channel {channel.id} no longer exists")
+                if self.on_channel_gone is not None:
+                    self.on_channel_gone(channel.id)
+                self._finish(delivery, 'channel_gone')
+                return
+            except discord.Forbidden:
+                self.logger.warning(f"Bot doesn't have permission to send messages in channel: {channel.name}")
+                self._finish(delivery, 'forbidden')
+                return
+            except Exception as e:
+                if is_retryable(e) and delivery['attempts'] < DELIVERY_CONFIG['MAX_RETRIES']:
+                    backoff = DELIVERY_CONFIG['RETRY_BASE'] * 2 ** delivery['attempts']
+                    delay = getattr(e, 'retry_after', None) or random.uniform(backoff / 2, backoff)
+                    delivery['attempts'] += 1
+                    self.logger.warning(
+                        f"Retrying {delivery['category']} delivery to {channel.name} in {delay:.1f}s: {str(e)}"
+                    )
+                    self._requeue_later(delivery, delay)
+                    return
+                self.logger.error(
+                    f"Giving up {delivery['category']} delivery to {channel.name}: {str(e)}", exc_info=False
+                )
+                self._finish(delivery, 'failed')
+                return
+            delivery['next_part'] += 1
+        self._finish(delivery, 'delivered')
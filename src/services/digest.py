@@ -0,0 +1,334 @@
+"""
+Rolling per-category digest that merges new items into earlier topics.
+
+Each category keeps the topics of its recent roundups with their last
+summary and the words of their headlines. New items are matched to those
+topics locally, and Gemini only sees the topics that received items, each
+as its ID and headline with the leads of its new items, plus the items
+that start new topics. Topics that received nothing cost no tokens and are not
+posted again.
+"""
+
+import asyncio
+import json
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from src.services.clustering import title_terms
+from src.utils.logger import Logger
+from src.utils.metrics import DIGEST_TOPICS
+from src.utils.tokens import estimate_tokens, plan_chunks, truncate_to_tokens
+from src.constants.app_constants import DIGEST_CONFIG, STORAGE_PATHS, SUMMARIZER_CONFIG
+
+SECTION_PATTERN = re.compile(r'^\s*🔹\s*\*\*\[(T\d+|NEW[^\]]*)\]\s*(.*?)\*\*\s*$', re.MULTILINE)
+ITEM_NUMBER_PATTERN = re.compile(r'\d+')
+
+class RollingDigest:
+    def __init__(self, generate, path: str = STORAGE_PATHS['DIGEST_STATE']):
+        """
+        Load the persisted topics.
+
+        Args:
+            generate (callable): Coroutine function (category, prompt, priority) returning Gemini's text
+            path (str): JSON file holding each category's topics
+        """
+        self.logger = Logger(__name__)
+        self.generate = generate
+        self.path = path
+        self._categories = self._load()
+        self._locks = defaultdict(asyncio.Lock)
+        # Responses to the prompts of a failed run, by category, reused when it is retried
+        self._responses = defaultdict(dict)
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading digest topics {self.path}: {str(e)}", exc_info=False)
+            return {}
+
+    def save(self):
+        """Write the topics to disk."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._categories, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"Error saving digest topics {self.path}: {str(e)}", exc_info=False)
+
+    def topics(self, category: str) -> list:
+        """Return the current topics of a category, most recently updated first."""
+        state = self._categories.get(category, {'topics': {}})
+        return sorted(state['topics'].values(), key=lambda topic: topic['updated_at'], reverse=True)
+
+    def _prune(self, state: dict, now: float):
+        """Forget topics past their TTL, then the least recently updated beyond MAX_TOPICS."""
+        topics = state['topics']
+        for topic_id in [topic_id for topic_id, topic in topics.items()
+                         if now - topic['updated_at'] > DIGEST_CONFIG['TOPIC_TTL']]:
+            del topics[topic_id]
+        excess = len(topics) - DIGEST_CONFIG['MAX_TOPICS']
+        if excess > 0:
+            for topic in sorted(topics.values(), key=lambda topic: topic['updated_at'])[:excess]:
+                del topics[topic['id']]
+
+    @staticmethod
+    def _assign(topics: dict, news_items: list) -> tuple:
+        """
+        Match items to the topics whose headline words cover most of their title.
+
+        Candidates come from an inverted index of topic words, and words found
+        in a large share of the topics are ignored as carrying no signal.
+
+        Returns:
+            tuple: ({topic ID: [items]}, [items matching no topic])
+        """
+        postings = defaultdict(list)
+        for topic_id, topic in topics.items():
+            for term in topic['terms']:
+                postings[term].append(topic_id)
+        max_postings = max(2, int(len(topics) * DIGEST_CONFIG['MAX_TERM_FREQUENCY']))
+
+        assigned = defaultdict(list)
+        unmatched = []
+        for item in news_items:
+            terms = title_terms(item.title)
+            overlaps = Counter(
+                topic_id
+                for term in terms if len(postings.get(term, ())) <= max_postings
+                for topic_id in postings.get(term, ())
+            )
+            best = max(overlaps.items(), key=lambda entry: entry[1], default=None)
+            if (best and best[1] >= DIGEST_CONFIG['MIN_SHARED_TERMS']
+                    and best[1] / len(terms) >= DIGEST_CONFIG['MATCH_THRESHOLD']):
+                assigned[best[0]].append(item)
+            else:
+                unmatched.append(item)
+        return assigned, unmatched
+
+    @staticmethod
+    def _format_item(item, max_tokens: int = SUMMARIZER_CONFIG['MAX_ITEM_TOKENS']) -> str:
+        """Format an item for a delta prompt; sources are rendered from the items, so Gemini only needs the text."""
+        description = truncate_to_tokens(item.description or 'No description available', max_tokens)
+        return f"Title: {item.title or 'No Title'}\nContent: {description}\n"
+
+    def _format_update_items(self, news_items: list) -> str:
+        # The topic was summarized before, so the lead of each item is enough to tell what is new
+        return ''.join(self._format_item(item, DIGEST_CONFIG['UPDATE_ITEM_TOKENS']) for item in news_items)
+
+    @staticmethod
+    def _header(topic: dict) -> str:
+        """Return the compact header identifying an ongoing topic in a delta prompt."""
+        return f"[{topic['id']}] {topic['headline']}\n"
+
+    def _build_prompt(self, category: str, updates: list, new_items: list) -> str:
+        """Build the delta prompt for changed topics and numbered new items."""
+        name = category.replace('_', ' ')
+        separator = f"\n{'-' * 80}\n"
+        sections = []
+        if updates:
+            blocks = [
+                f"{self._header(topic)}New items:\n{self._format_update_items(items)}"
+                for topic, items in updates
+            ]
+            sections.append(
+                "Ongoing topics with new developments, each with its ID, its headline and the leads of its "
+                "new items. For each, summarize what is new, with at most one sentence of background:"
+                f"{separator}{chr(10).join(blocks)}{separator}"
+            )
+        if new_items:
+            blocks = [f"[{number}]\n{self._format_item(item)}" for number, item in enumerate(new_items, 1)]
+            sections.append(
+                "New numbered items not covered by any ongoing topic. Filter out user queries or discussions, "
+                f"personal opinions or blog posts, duplicates and anything not relevant to {name}, "
+                "then group the remaining items by story:"
+                f"{separator}{chr(10).join(blocks)}{separator}"
+            )
+        return f"""
+        You are maintaining a rolling news digest for a Discord channel focused on {name} news.
+
+        {chr(10).join(sections)}
+
+        Output only the topics, with no header and no source list, in exactly this format:
+
+        🔹 **[T1] Updated headline**
+        [4-5 sentence summary of the key points]
+
+        🔹 **[NEW 2, 5] Headline**
+        [4-5 sentence summary of the key points]
+
+        Use one [T...] entry per ongoing topic above, keeping its ID, and one [NEW ...] entry per
+        new story listing the numbers of the items it covers.
+        """
+
+    def _plan_prompts(self, updates: list, new_items: list) -> list:
+        """Split the delta into prompts that fit the token budget, as (updates, new items) pairs."""
+        units = [('update', update) for update in updates] + [('new', item) for item in new_items]
+        costs = [
+            estimate_tokens(self._header(value[0]) + self._format_update_items(value[1]))
+            if kind == 'update' else estimate_tokens(self._format_item(value))
+            for kind, value in units
+        ]
+        budget = SUMMARIZER_CONFIG['MAX_PROMPT_TOKENS'] - SUMMARIZER_CONFIG['PROMPT_OVERHEAD_TOKENS']
+        return [
+            ([value for kind, value in chunk if kind == 'update'], [value for kind, value in chunk if kind == 'new'])
+            for chunk in plan_chunks(units, costs, budget)
+        ]
+
+    @staticmethod
+    def _parse(text: str) -> list:
+        """
+        Split a delta response into its topics.
+
+        Returns:
+            list: (tag, headline, summary) tuples in response order
+        """
+        matches = list(SECTION_PATTERN.finditer(text))
+        sections = []
+        for index, match in enumerate(matches):
+            end = matches[index + 1].start() if index + 1 < len(matches) else len(text)
+            summary = text[match.end():end].strip()
+            # Models sometimes add a source list anyway; sources are rendered from the items
+            summary = summary.split('\nSources:')[0].strip()
+            sections.append((match.group(1).strip(), match.group(2).strip(), summary))
+        return sections
+
+    @staticmethod
+    def _sources(news_items: list) -> list:
+        sources = {}
+        for item in news_items:
+            for source, url in item.related_sources or [(item.source, item.url)]:
+                sources.setdefault(url, source)
+        return [(source, url) for url, source in sources.items()]
+
+    @staticmethod
+    def _add_terms(topic: dict, texts: list):
+        terms = Counter(topic['terms'])
+        for text in texts:
+            terms.update(title_terms(text))
+        topic['terms'] = dict(terms.most_common(DIGEST_CONFIG['MAX_TOPIC_TERMS']))
+
+    def _apply(self, category: str, state: dict, chunk: tuple, text: str, now: float) -> list:
+        """
+        Fold one delta response into the topics.
+
+        Returns:
+            list: Posted entries as (topic, items, updated) tuples, or raw text when the response has no tagged topics
+        """
+        updates, new_items = chunk
+        sections = self._parse(text)
+        if not sections:
+            self.logger.warning(f"Digest response for {category} has no tagged topics, posting it as is")
+            return [text] if text else []
+
+        changed = {topic['id']: (topic, items) for topic, items in updates}
+        entries = []
+        for tag, headline, summary in sections:
+            if tag in changed:
+                topic, items = changed.pop(tag)
+                updated = True
+            elif tag.startswith('NEW'):
+                items = [
+                    new_items[number - 1] for number in map(int, ITEM_NUMBER_PATTERN.findall(tag))
+                    if 0 < number <= len(new_items)
+                ]
+                topic_id = f"T{state['next_id']}"
+                state['next_id'] += 1
+                topic = {'id': topic_id, 'headline': '', 'summary': '', 'terms': {}, 'items': 0, 'updated_at': now}
+                state['topics'][topic_id] = topic
+                updated = False
+            else:
+                continue
+            topic['headline'] = headline or topic['headline']
+            topic['summary'] = summary
+            topic['items'] += len(items)
+            topic['updated_at'] = now
+            self._add_terms(topic, [topic['headline']] + [item.title for item in items])
+            entries.append((topic, items, updated))
+            DIGEST_TOPICS.inc(category=category, change='updated' if updated else 'created')
+        if changed:
+            self.logger.warning(f"Digest response for {category} skipped {len(changed)} updated topics")
+        return entries
+
+    def _render(self, category: str, entries: list) -> str:
+        topics = []
+        for entry in entries:
+            if isinstance(entry, str):
+                topics.append(entry)
+                continue
+            topic, items, updated = entry
+            sources = ''.join(f"- [{source}]({url})\n" for source, url in self._sources(items))
+            marker = ' (update)' if updated else ''
+            block = f"🔹 **{topic['headline']}**{marker}\n{topic['summary']}"
+            topics.append(f"{block}\n\nSources:\n{sources}".rstrip() if sources else block)
+        if not topics:
+            return ''
+        header = f"📰 **Latest {category.replace('_', ' ').title()} News Roundup**"
+        return '\n\n'.join([header] + topics)
+
+    async def summarize(self, category: str, news_items: list, priority: str = 'scheduled') -> tuple:
+        """
+        Merge new items into the category's topics and summarize only what changed.
+
+        Args:
+            category (str): The category of news
+            news_items (list): Deduplicated news items
+            priority (str): Priority class for the Gemini limiter
+
+        Returns:
+            tuple: Roundup of the updated and new topics, empty if nothing survived
+            filtering, and the estimated prompt tokens spent
+
+        Raises:
+            Exception: The first failed prompt; the topics are left unchanged so the
+            items can be retried, and the responses already received are reused then
+        """
+        async with self._locks[category]:
+            now = time.time()
+            state = self._categories.setdefault(category, {'next_id': 1, 'topics': {}})
+            self._prune(state, now)
+            assigned, unmatched = self._assign(state['topics'], news_items)
+            updates = [(state['topics'][topic_id], items) for topic_id, items in assigned.items()]
+            self.logger.info(
+                f"Digest for {category}: {len(news_items)} items update {len(updates)} of "
+                f"{len(state['topics'])} topics, {len(unmatched)} items are new"
+            )
+
+            chunks = self._plan_prompts(updates, unmatched)
+            prompts = [self._build_prompt(category, *chunk) for chunk in chunks]
+            semaphore = asyncio.Semaphore(SUMMARIZER_CONFIG['MAP_CONCURRENCY'])
+
+            responses = self._responses[category]
+
+            async def summarize_chunk(prompt):
+                if prompt not in responses:
+                    async with semaphore:
+                        responses[prompt] = await self.generate(category, prompt, priority)
+                return responses[prompt]
+
+            results = await asyncio.gather(*(summarize_chunk(prompt) for prompt in prompts), return_exceptions=True)
+            errors = [result for result in results if isinstance(result, Exception)]
+            if errors:
+                # Only this run's responses are kept, since a retry with other items has other prompts
+                self._responses[category] = {prompt: responses[prompt] for prompt in prompts if prompt in responses}
+                self.logger.error(
+                    f"{len(errors)} of {len(prompts)} digest prompts for {category} failed, "
+                    f"keeping the batch for the next run: {str(errors[0])}",
+                    exc_info=False
+                )
+                raise errors[0]
+            self._responses.pop(category, None)
+
+            entries = []
+            for chunk, result in zip(chunks, results):
+                entries.extend(self._apply(category, state, chunk, result, now))
+
+            self._prune(state, now)
+            self.save()
+            return self._render(category, entries), sum(estimate_tokens(prompt) for prompt in prompts)
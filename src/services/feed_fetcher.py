@@ -0,0 +1,229 @@
+"""
+Concurrent, non-blocking RSS/Atom feed fetcher.
+"""
+
+import asyncio
+import calendar
+import time
+from functools import partial
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import feedparser
+from src.services.circuit_breaker import BREAKERS, CircuitOpenError
+from src.services.stream_parser import StreamingFeedParser
+from src.utils.logger import Logger
+from src.utils.metrics import FEED_FETCH_SECONDS, FEED_PARSE_SECONDS
+from src.constants.app_constants import CHRONOLOGICAL_FEEDS, FETCH_CONFIG, MAX_RESULTS
+
+class FeedFetcher:
+    def __init__(self, cache, get_session, is_processed=None):
+        """
+        Create the fetcher.
+
+        Args:
+            cache (ConditionalCache): Validator cache for conditional requests
+            get_session: Callable returning the shared aiohttp.ClientSession
+            is_processed: Optional callable taking a feed URL and entry ID, used to stop
+                reading a chronological feed at its first already-processed entry
+        """
+        self.logger = Logger(__name__)
+        self.cache = cache
+        self._get_session = get_session
+        self._is_processed = is_processed
+        self._host_semaphores = {}
+        self._parse_executor = ThreadPoolExecutor(
+            max_workers=FETCH_CONFIG['PARSE_WORKERS'],
+            thread_name_prefix='feed-parse'
+        )
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent requests to the URL's host."""
+        host = urlsplit(url).hostname or ''
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(FETCH_CONFIG['PER_HOST_LIMIT'])
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    @staticmethod
+    def _parse(body: bytes, headers: dict) -> list:
+        """Parse a feed body into plain entry dicts, keeping only the entries we use."""
+        feed = feedparser.parse(body, response_headers=headers)
+        entries = []
+        for entry in feed.entries[:MAX_RESULTS['RSS_FEED']]:
+            published = entry.get('published_parsed') or entry.get('updated_parsed')
+            entries.append({
+                'id': entry.get('id', entry.get('link')),
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'description': entry.get('description', ''),
+                'published': calendar.timegm(published) if published else None
+            })
+        return entries
+
+    async def fetch_feed(self, feed_url: str) -> dict:
+        """
+        Download a single feed and parse it off the event loop.
+
+        Sends the cached validators with the request; a 304 response returns
+        the previously parsed entries without downloading or parsing again.
+        Otherwise the body is parsed as it streams in, and the download stops
+        once enough entries have been read.
+
+        Args:
+            feed_url (str): URL of the RSS/Atom feed
+
+        Returns:
+            dict: 'entries', the entry dicts with id, title, link, description and
+                published timestamp, and 'not_modified', whether the server answered 304
+
+        Raises:
+            aiohttp.ClientError: If the request fails or returns an error status
+            asyncio.TimeoutError: If the request exceeds the configured timeout
+        """
+        session = self._get_session()
+        request_headers = self.cache.request_headers(feed_url)
+        with FEED_FETCH_SECONDS.time(feed=feed_url):
+            async with session.get(feed_url, headers=request_headers) as response:
+                if response.status == 304:
+                    entries = self.cache.hit(feed_url)
+                    if entries is not None:
+                        return {'entries': entries, 'not_modified': True}
+                response.raise_for_status()
+                headers = {k.lower(): v for k, v in response.headers.items()}
+                if FETCH_CONFIG['STREAM_PARSING']:
+                    entries, size, parse_seconds = await self._parse_stream(feed_url, response, headers)
+                else:
+                    body = await response.read()
+
+        if not FETCH_CONFIG['STREAM_PARSING']:
+            start = time.perf_counter()
+            entries = await self.parse(feed_url, body, headers)
+            size, parse_seconds = len(body), time.perf_counter() - start
+        self.cache.store(feed_url, headers, entries, size, parse_seconds)
+        return {'entries': entries, 'not_modified': False}
+
+    async def _parse_stream(self, feed_url: str, response, headers: dict) -> tuple:
+        """
+        Parse a response body chunk by chunk on the parse workers.
+
+        Stops reading once the parser has enough entries, or, for feeds in
+        CHRONOLOGICAL_FEEDS, at the first already-processed entry. Falls back
+        to feedparser on the whole body if the document is not well-formed.
+
+        Returns:
+            tuple: (entries, bytes read, seconds spent parsing)
+        """
+        loop = asyncio.get_running_loop()
+        parser = StreamingFeedParser(MAX_RESULTS['RSS_FEED'])
+        stop_at_processed = self._is_processed is not None and (
+            FETCH_CONFIG['STOP_AT_PROCESSED'] or feed_url in CHRONOLOGICAL_FEEDS
+        )
+        chunks = []
+        parse_seconds = 0.0
+        try:
+            async for chunk in response.content.iter_chunked(FETCH_CONFIG['STREAM_CHUNK_BYTES']):
+                chunks.append(chunk)
+                start = time.perf_counter()
+                done = await loop.run_in_executor(self._parse_executor, parser.feed, chunk)
+                parse_seconds += time.perf_counter() - start
+                # Checked here rather than in the worker, the dedup store belongs to the loop thread
+                if stop_at_processed:
+                    done = parser.stop_at(lambda entry_id: self._is_processed(feed_url, entry_id))
+                if done:
+                    break
+            start = time.perf_counter()
+            entries = await loop.run_in_executor(self._parse_executor, parser.close)
+            parse_seconds += time.perf_counter() - start
+        except (ET.ParseError, ValueError) as e:
+            self.logger.debug(f"Falling back to feedparser for {feed_url}: {str(e)}")
+            chunks.append(await response.read())
+            body = b''.join(chunks)
+            start = time.perf_counter()
+            entries = await loop.run_in_executor(self._parse_executor, self._parse, body, headers)
+            parse_seconds += time.perf_counter() - start
+
+        FEED_PARSE_SECONDS.observe(parse_seconds, feed=feed_url)
+        return entries, sum(len(chunk) for chunk in chunks), parse_seconds
+
+    def _parse_document(self, feed_url: str, body: bytes, headers: dict) -> list:
+        """Parse a complete document, with feedparser as the fallback for malformed XML."""
+        if FETCH_CONFIG['STREAM_PARSING']:
+            try:
+                parser = StreamingFeedParser(MAX_RESULTS['RSS_FEED'])
+                parser.feed(body)
+                return parser.close()
+            except (ET.ParseError, ValueError):
+                pass
+        return self._parse(body, headers)
+
+    async def parse(self, feed_url: str, body: bytes, headers: dict) -> list:
+        """
+        Parse a complete feed body on the parse workers.
+
+        Args:
+            feed_url (str): URL of the feed, used to label metrics
+            body (bytes): Raw RSS/Atom document
+            headers (dict): Response headers with lowercase keys
+
+        Returns:
+            list: Entry dicts, see fetch_feed
+        """
+        loop = asyncio.get_running_loop()
+        with FEED_PARSE_SECONDS.time(feed=feed_url):
+            return await loop.run_in_executor(
+                self._parse_executor, self._parse_document, feed_url, body, headers
+            )
+
+    async def _fetch_through_breaker(self, feed_url: str) -> dict:
+        # The per-host limit is waited for outside the breaker, so feeds queued
+        # behind others on the same host do not time out while waiting
+        async with self._host_semaphore(feed_url):
+            return await BREAKERS.call(f"rss:{feed_url}", 'rss', partial(self.fetch_feed, feed_url))
+
+    async def fetch_many(self, feed_urls: list) -> dict:
+        """
+        Fetch several feeds concurrently.
+
+        Each feed goes through its own circuit breaker. Failed feeds are logged
+        and left out of the result, and feeds whose circuit is open are skipped
+        without a request, so one slow or broken feed never holds back the
+        others beyond its own timeout.
+
+        Args:
+            feed_urls (list): Feed URLs to fetch
+
+        Returns:
+            dict: Mapping of feed URL to the fetch_feed result
+        """
+        unique_urls = list(dict.fromkeys(feed_urls))
+        stats_before = self.cache.stats()
+        results = await asyncio.gather(
+            *(self._fetch_through_breaker(url) for url in unique_urls),
+            return_exceptions=True
+        )
+
+        feeds = {}
+        skipped = 0
+        for feed_url, result in zip(unique_urls, results):
+            if isinstance(result, CircuitOpenError):
+                skipped += 1
+            elif isinstance(result, asyncio.TimeoutError):
+                self.logger.error(f"Timed out fetching RSS feed {feed_url}", exc_info=False)
+            elif isinstance(result, Exception):
+                self.logger.error(f"Error fetching RSS feed {feed_url}: {str(result)}", exc_info=False)
+            else:
+                feeds[feed_url] = result
+
+        if skipped:
+            self.logger.info(f"Skipped {skipped} RSS feeds with open circuits")
+        self.cache.save()
+        self.logger.info(
+            f"Feed cache: {self.cache.format_stats(stats_before, self.cache.stats())}"
+        )
+        return feeds
+
+    def close(self):
+        """Shut down the parse workers."""
+        self._parse_executor.shutdown(wait=False)
@@ -0,0 +1,166 @@
+"""
+Shared Gemini admission control: concurrency cap, RPM and TPM token
+buckets, and a priority queue for requests that have to wait.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from src.utils.logger import Logger
+from src.utils.metrics import GEMINI_QUEUE_DEPTH, GEMINI_QUEUE_WAIT_SECONDS
+from src.utils.rate_limiter import TokenBucket
+from src.constants.app_constants import GEMINI_LIMITS
+
+class GeminiLimiter:
+    def __init__(self):
+        """Create the limiter from GEMINI_LIMITS; lower priority ranks are admitted first."""
+        self.logger = Logger(__name__)
+        self.max_concurrency = GEMINI_LIMITS['MAX_CONCURRENCY']
+        self.priorities = GEMINI_LIMITS['PRIORITIES']
+        requests_per_minute = GEMINI_LIMITS['REQUESTS_PER_MINUTE']
+        tokens_per_minute = GEMINI_LIMITS['TOKENS_PER_MINUTE']
+        self._requests = TokenBucket(requests_per_minute / 60, requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute / 60, tokens_per_minute)
+        self._waiting = []
+        self._sequence = itertools.count()
+        self._active = 0
+        self._paused_until = 0.0
+        self._timer = None
+        self._stats = {'admitted': 0, 'queued': 0, 'wait_seconds': 0.0}
+
+    def _depth(self, priority: str) -> int:
+        return sum(1 for entry in self._waiting if entry[2] == priority and not entry[4].done())
+
+    def _update_depth(self, priority: str):
+        GEMINI_QUEUE_DEPTH.set(self._depth(priority), priority=priority)
+
+    def _schedule_wake(self, delay: float):
+        if self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Take one request and tokens from the buckets, or return the seconds to wait if paused or short."""
+        delay = self._paused_until - time.monotonic()
+        if delay <= 0:
+            delay = self._requests.try_acquire(1)
+        if delay <= 0:
+            delay = self._tokens.try_acquire(tokens)
+            if delay > 0:
+                self._requests.adjust(1)
+        return delay
+
+    def _dispatch(self):
+        """Admit waiting requests in priority order while concurrency and quota allow."""
+        while self._waiting and self._active < self.max_concurrency:
+            rank, sequence, priority, tokens, future = self._waiting[0]
+            if future.done():
+                # Cancelled while waiting
+                heapq.heappop(self._waiting)
+                self._update_depth(priority)
+                continue
+
+            delay = self._try_acquire(tokens)
+            if delay > 0:
+                # The head waits for quota and nothing overtakes it, so large
+                # prompts are not starved by a stream of small ones
+                self._schedule_wake(delay)
+                return
+
+            heapq.heappop(self._waiting)
+            self._active += 1
+            self._update_depth(priority)
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, estimated_tokens: int, priority: str = 'scheduled'):
+        """
+        Hold a Gemini request slot for the duration of the block.
+
+        Args:
+            estimated_tokens (int): Expected prompt plus response tokens, charged to the TPM bucket
+            priority (str): Priority class from GEMINI_LIMITS['PRIORITIES']
+        """
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        heapq.heappush(
+            self._waiting,
+            (self.priorities.get(priority, max(self.priorities.values())), next(self._sequence),
+             priority, estimated_tokens, future)
+        )
+        self._update_depth(priority)
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just before the cancellation arrived
+                self._release()
+            raise
+
+        waited = time.perf_counter() - start
+        GEMINI_QUEUE_WAIT_SECONDS.observe(waited, priority=priority)
+        self._stats['admitted'] += 1
+        self._stats['wait_seconds'] += waited
+        if waited > 0.001:
+            self._stats['queued'] += 1
+        if waited >= 1:
+            self.logger.info(f"Gemini request ({priority}) waited {waited:.1f}s for quota")
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        self._active -= 1
+        self._dispatch()
+
+    async def charge(self, estimated_tokens: int):
+        """
+        Charge a retry made within an admitted slot to the quota, waiting while paused or short of it.
+
+        Args:
+            estimated_tokens (int): Expected prompt plus response tokens of the retry
+        """
+        while True:
+            delay = self._try_acquire(estimated_tokens)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """
+        Correct the TPM bucket once the real token usage of a request is known.
+
+        Args:
+            estimated_tokens (int): Tokens charged when the request was admitted
+            actual_tokens (int): Tokens the API reported
+        """
+        self._tokens.adjust(estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float = None):
+        """Stop admitting requests for a while, by default GEMINI_LIMITS['QUOTA_BACKOFF'] after a 429."""
+        seconds = GEMINI_LIMITS['QUOTA_BACKOFF'] if seconds is None else seconds
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.logger.warning(f"Gemini quota exhausted, pausing requests for {seconds:.0f}s")
+
+    def stats(self) -> dict:
+        """
+        Report limiter activity.
+
+        Returns:
+            dict: Requests admitted and queued, mean wait, in-flight count and queue depth per priority
+        """
+        admitted = self._stats['admitted']
+        return {
+            'admitted': admitted,
+            'queued': self._stats['queued'],
+            'mean_wait_seconds': self._stats['wait_seconds'] / admitted if admitted else 0.0,
+            'active': self._active,
+            'depth': {priority: self._depth(priority) for priority in self.priorities}
+        }
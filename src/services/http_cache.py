@@ -0,0 +1,127 @@
+"""
+Persistent HTTP validator cache for conditional GET requests.
+"""
+
+import json
+import os
+from src.utils.logger import Logger
+from src.constants.app_constants import STORAGE_PATHS
+
+class ConditionalCache:
+    def __init__(self, path: str = STORAGE_PATHS['HTTP_CACHE']):
+        self.logger = Logger(__name__)
+        self.path = path
+        self._entries = {}
+        self._dirty = False
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'bytes_saved': 0,
+            'parse_seconds_saved': 0.0
+        }
+        self._load()
+
+    def _load(self):
+        """Load cached validators from disk, starting empty on any error."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+            self.logger.info(f"Loaded {len(self._entries)} cached HTTP validators")
+        except Exception as e:
+            self.logger.error(f"Error loading HTTP cache {self.path}: {str(e)}", exc_info=False)
+            self._entries = {}
+
+    def save(self):
+        """Write the cache to disk if it changed since the last save."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            self.logger.error(f"Error saving HTTP cache {self.path}: {str(e)}", exc_info=False)
+
+    def request_headers(self, url: str) -> dict:
+        """
+        Build the conditional request headers for a URL.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            dict: If-None-Match/If-Modified-Since headers, empty if nothing is cached
+        """
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url: str):
+        """
+        Record a 304 Not Modified response and return the cached payload.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            The payload stored with the validators, or None if nothing is cached
+        """
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        self._stats['hits'] += 1
+        self._stats['bytes_saved'] += entry.get('size', 0)
+        self._stats['parse_seconds_saved'] += entry.get('parse_seconds', 0.0)
+        return entry['payload']
+
+    def store(self, url: str, response_headers, payload, size: int, parse_seconds: float = 0.0):
+        """
+        Record a full response and remember its validators and payload.
+
+        Args:
+            url (str): Request URL
+            response_headers: Headers of the full response
+            payload: JSON-serializable result to return on future 304s
+            size (int): Response body size in bytes
+            parse_seconds (float): Time spent turning the body into the payload
+        """
+        self._stats['misses'] += 1
+        etag = response_headers.get('etag')
+        last_modified = response_headers.get('last-modified')
+        if not etag and not last_modified:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+            return
+        self._entries[url] = {
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': size,
+            'parse_seconds': parse_seconds,
+            'payload': payload
+        }
+        self._dirty = True
+
+    def stats(self) -> dict:
+        """Return cumulative hit/miss counters and estimated savings."""
+        return dict(self._stats)
+
+    @staticmethod
+    def format_stats(before: dict, after: dict) -> str:
+        """Describe the cache activity between two stats() snapshots."""
+        hits = after['hits'] - before['hits']
+        misses = after['misses'] - before['misses']
+        kb_saved = (after['bytes_saved'] - before['bytes_saved']) / 1024
+        ms_saved = (after['parse_seconds_saved'] - before['parse_seconds_saved']) * 1000
+        return (f"{hits} hits / {misses} misses, "
+                f"saved ~{kb_saved:.1f} KB download and ~{ms_saved:.0f} ms parsing")
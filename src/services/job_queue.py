@@ -0,0 +1,124 @@
+"""
+Bounded queue of background jobs with duplicate coalescing.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from src.utils.logger import Logger
+from src.constants.app_constants import API_CONFIG
+
+class JobQueue:
+    def __init__(self, max_size: int = API_CONFIG['JOB_QUEUE_SIZE'],
+                 workers: int = API_CONFIG['JOB_WORKERS'],
+                 history: int = API_CONFIG['JOB_HISTORY']):
+        """
+        Create the queue.
+
+        Args:
+            max_size (int): Maximum number of jobs waiting to run
+            workers (int): Number of jobs run concurrently
+            history (int): Number of jobs remembered for status lookups
+        """
+        self.logger = Logger(__name__)
+        self.worker_count = workers
+        self.history = history
+        self._queue = asyncio.Queue(maxsize=max_size)
+        self._jobs = OrderedDict()
+        self._active = {}
+        self._workers = []
+
+    def start(self):
+        """Start the worker tasks on the running event loop."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+                for i in range(self.worker_count)
+            ]
+
+    async def stop(self):
+        """Cancel the worker tasks and wait for them to finish."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _find_covering_job(self, kind: str, category):
+        """Return a queued or running job whose work includes the requested one."""
+        for (active_kind, active_category), job_id in self._active.items():
+            if active_kind in (kind, 'all') and active_category in (None, category):
+                return self._jobs[job_id]
+        return None
+
+    def submit(self, kind: str, category, run) -> tuple:
+        """
+        Queue a job unless an equivalent one is already queued or running.
+
+        Args:
+            kind (str): Job kind, e.g. 'rss', 'other' or 'all' ('all' covers the others)
+            category (str, optional): Category, None covers every category
+            run: Coroutine function taking the job dict
+
+        Returns:
+            tuple: The job dict and whether it was coalesced into an existing job
+
+        Raises:
+            asyncio.QueueFull: If the queue is at capacity
+        """
+        existing = self._find_covering_job(kind, category)
+        if existing is not None:
+            return existing, True
+
+        job = {
+            'id': uuid.uuid4().hex,
+            'kind': kind,
+            'category': category,
+            'status': 'queued',
+            'created_at': time.time(),
+            'started_at': None,
+            'finished_at': None,
+            'messages': [],
+            'error': None
+        }
+        self._queue.put_nowait((job, run))
+        self._jobs[job['id']] = job
+        self._active[(kind, category)] = job['id']
+        while len(self._jobs) > self.history:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if oldest['status'] in ('queued', 'running'):
+                break
+            del self._jobs[oldest_id]
+        return job, False
+
+    def get(self, job_id: str):
+        """Return the job dict for an ID, or None if unknown."""
+        return self._jobs.get(job_id)
+
+    def is_running(self) -> bool:
+        """Return True if every worker task is alive."""
+        return bool(self._workers) and not any(worker.done() for worker in self._workers)
+
+    def depth(self) -> int:
+        """Return the number of jobs waiting to run."""
+        return self._queue.qsize()
+
+    async def _worker(self):
+        while True:
+            job, run = await self._queue.get()
+            job['status'] = 'running'
+            job['started_at'] = time.time()
+            try:
+                await run(job)
+                job['status'] = 'succeeded'
+            except asyncio.CancelledError:
+                job['status'] = 'cancelled'
+                raise
+            except Exception as e:
+                job['status'] = 'failed'
+                job['error'] = str(e)
+                self.logger.error(f"Job {job['id']} ({job['kind']}) failed: {str(e)}")
+            finally:
+                job['finished_at'] = time.time()
+                self._active.pop((job['kind'], job['category']), None)
+                self._queue.task_done()
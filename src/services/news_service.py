@@ -2,11 +2,23 @@
 Service for handling different news sources (RSS, YouTube, Google News).
 """
 
-import feedparser
-from googleapiclient.discovery import build
 import aiohttp
+import json
+from functools import partial
+from urllib.parse import urlencode
+from src.models.news_item import NewsItem
+from src.services.article_store import ArticleStore
+from src.services.circuit_breaker import BREAKERS, CircuitOpenError
+from src.services.dedup_store import DedupStore
+from src.services.feed_fetcher import FeedFetcher
+from src.services.http_cache import ConditionalCache
+from src.services.poll_scheduler import AdaptivePollScheduler
+from src.services.websub import WebSubManager
+from src.services.youtube_client import YouTubeClient
+from src.utils.dates import parse_timestamp
 from src.utils.logger import Logger
-from src.constants.app_constants import RSS_FEEDS, SEARCH_QUERIES, MAX_RESULTS
+from src.utils.metrics import ITEMS_FETCHED, ITEMS_DEDUPLICATED, ITEMS_CROSS_SOURCE_DUPLICATES
+from src.constants.app_constants import RSS_FEEDS, SEARCH_QUERIES, MAX_RESULTS, FETCH_CONFIG, API_ENDPOINTS
 import os
 
 class NewsService:
@@ -14,42 +26,221 @@ class NewsService:
         self.logger = Logger(__name__)
         self.youtube_api_key = os.getenv('YOUTUBE_API_KEY')
         self.news_api_key = os.getenv('NEWS_API_KEY')
-        self.processed_items = set()
+        self.processed_items = DedupStore()
+        self.article_store = ArticleStore()
+        self.http_cache = ConditionalCache()
+        self.feed_fetcher = FeedFetcher(
+            self.http_cache,
+            self._get_session,
+            lambda feed_url, entry_id: NewsItem.feed_key(feed_url, entry_id) in self.processed_items
+        )
+        self.poll_scheduler = AdaptivePollScheduler()
+        self.websub = WebSubManager(self._get_session)
+        self.youtube_client = YouTubeClient(self.youtube_api_key, self._get_session, self.http_cache)
+        self.session = None
+        self._dedup_stats = {
+            'fetched': 0,
+            'already_processed': 0,
+            'cross_source': 0
+        }
+        self._connection_stats = {
+            'new_connections': 0,
+            'reused_connections': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0
+        }
         
-    async def fetch_rss_news(self, category: str) -> list:
+    def _count(self, stat: str):
+        """Build a trace callback incrementing a connection statistic."""
+        async def callback(session, trace_config_ctx, params):
+            self._connection_stats[stat] += 1
+        return callback
+        
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, opening it on first use."""
+        if self.session is None or self.session.closed:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._count('new_connections'))
+            trace_config.on_connection_reuseconn.append(self._count('reused_connections'))
+            trace_config.on_dns_cache_hit.append(self._count('dns_cache_hits'))
+            trace_config.on_dns_cache_miss.append(self._count('dns_cache_misses'))
+            
+            connector = aiohttp.TCPConnector(
+                limit=FETCH_CONFIG['MAX_CONNECTIONS'],
+                limit_per_host=FETCH_CONFIG['PER_HOST_CONNECTIONS'],
+                keepalive_timeout=FETCH_CONFIG['KEEPALIVE_TIMEOUT'],
+                ttl_dns_cache=FETCH_CONFIG['DNS_CACHE_TTL'],
+                enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(
+                    total=FETCH_CONFIG['REQUEST_TIMEOUT'],
+                    connect=FETCH_CONFIG['CONNECT_TIMEOUT']
+                ),
+                headers={'User-Agent': FETCH_CONFIG['USER_AGENT']},
+                trace_configs=[trace_config]
+            )
+        return self.session
+        
+    async def start(self):
+        """Open the shared HTTP session used by every source and start the article writer."""
+        self._get_session()
+        self.article_store.start()
+        self.logger.info("HTTP session opened")
+        
+    def connection_stats(self) -> dict:
+        """
+        Report how often HTTP requests reused pooled connections.
+        
+        Returns:
+            dict: New and reused connection counts, reuse ratio and DNS cache hits/misses
+        """
+        stats = dict(self._connection_stats)
+        total = stats['new_connections'] + stats['reused_connections']
+        stats['reuse_ratio'] = stats['reused_connections'] / total if total else 0.0
+        return stats
+        
+    def due_rss_categories(self) -> list:
+        """Return the categories with at least one RSS feed due for a poll."""
+        due = set(self.poll_scheduler.due_feeds([url for urls in RSS_FEEDS.values() for url in urls]))
+        return [category for category, feed_urls in RSS_FEEDS.items() if due.intersection(feed_urls)]
+
+    async def fetch_rss_news(self, category: str, force: bool = False) -> list:
         """
         Fetch news from RSS feeds for a specific category.
         
         Args:
             category (str): News category
+            force (bool): Poll every feed, even those not due yet
             
         Returns:
             list: List of news items
         """
-        news_items = []
-        feeds = RSS_FEEDS.get(category, [])
-        
-        for feed_url in feeds:
-            try:
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:MAX_RESULTS['RSS_FEED']]:
-                    item_id = f"{feed_url}_{entry.id}"
-                    
-                    if item_id not in self.processed_items:
-                        news_items.append({
-                            'id': item_id,
-                            'title': entry.title,
-                            'link': entry.link,
-                            'description': entry.description,
-                            'source': feed_url
-                        })
-                        
-                self.logger.info(f"Successfully fetched RSS feed: {feed_url}")
-                        
-            except Exception as e:
-                self.logger.error(f"Error fetching RSS feed {feed_url}: {str(e)}")
+        news_by_category = await self.fetch_all_rss_news([category], force)
+        return news_by_category.get(category, [])
+
+    async def fetch_all_rss_news(self, categories: list = None, force: bool = False) -> dict:
+        """
+        Fetch news from the RSS feeds of several categories in one concurrent pass.
+        
+        Only feeds whose adaptive polling interval has elapsed are fetched,
+        unless force is set.
+        
+        Args:
+            categories (list, optional): Categories to fetch, defaults to all
+            force (bool): Poll every feed, even those not due yet
+            
+        Returns:
+            dict: Mapping of category to list of news items
+        """
+        categories = categories or list(RSS_FEEDS.keys())
+        feed_urls = [url for category in categories for url in RSS_FEEDS.get(category, [])]
+        if not force:
+            feed_urls = self.poll_scheduler.due_feeds(feed_urls)
+        if not feed_urls:
+            return {category: [] for category in categories}
+        feeds = await self.feed_fetcher.fetch_many(feed_urls)
+
+        news_by_category = {}
+        for category in categories:
+            news_items = []
+            for feed_url in RSS_FEEDS.get(category, []):
+                result = feeds.get(feed_url)
+                if result is None:
+                    continue
+                new_items = self._parse_feed_entries(category, feed_url, result['entries'])
+                self.poll_scheduler.record_poll(
+                    feed_url, result['entries'], len(new_items), result['not_modified']
+                )
+                news_items.extend(new_items)
+            news_by_category[category] = news_items
+        self.poll_scheduler.save()
+        return news_by_category
+
+    def category_for_feed(self, feed_url: str):
+        """Return the category a feed is configured under, or None."""
+        for category, feed_urls in RSS_FEEDS.items():
+            if feed_url in feed_urls:
+                return category
+        return None
+
+    async def ingest_pushed_feed(self, feed_url: str, body: bytes, headers: dict) -> tuple:
+        """
+        Turn a feed document pushed by a WebSub hub into unprocessed news items.
+        
+        The push counts as a poll of the feed, so its next scheduled poll
+        moves back and polling stays a fallback for missed pushes.
+        
+        Args:
+            feed_url (str): Subscribed feed the payload belongs to
+            body (bytes): Pushed RSS/Atom document
+            headers (dict): Request headers with lowercase keys
+            
+        Returns:
+            tuple: (category, list of news items), category is None for unknown feeds
+        """
+        category = self.category_for_feed(feed_url)
+        if category is None:
+            return None, []
+        entries = await self.feed_fetcher.parse(feed_url, body, headers)
+        news_items = self._parse_feed_entries(category, feed_url, entries)
+        self.poll_scheduler.record_poll(feed_url, entries, len(news_items), False)
+        self.poll_scheduler.save()
+        return category, news_items
+
+    def _filter_new(self, category: str, source: str, news_items: list) -> list:
+        """
+        Drop items that were already processed, count what was dropped and
+        queue the new items for the article store.
+        
+        An item is processed when its source-specific ID or its canonical URL
+        key is in the dedup store, so an article already posted from one
+        source is skipped when another source returns it.
+        
+        Args:
+            category (str): News category
+            source (str): Source group for metrics: 'rss', 'youtube' or 'newsapi'
+            news_items (list): Fetched NewsItems
+            
+        Returns:
+            list: The unprocessed items
+        """
+        new_items = []
+        cross_source = 0
+        for item in news_items:
+            if item.id in self.processed_items:
+                continue
+            if item.url_key and item.url_key in self.processed_items:
+                cross_source += 1
                 continue
-                
+            new_items.append(item)
+            
+        duplicates = len(news_items) - len(new_items)
+        self._dedup_stats['fetched'] += len(news_items)
+        self._dedup_stats['already_processed'] += duplicates - cross_source
+        self._dedup_stats['cross_source'] += cross_source
+        ITEMS_FETCHED.inc(len(news_items), category=category, source=source)
+        ITEMS_DEDUPLICATED.inc(duplicates, category=category, source=source)
+        ITEMS_CROSS_SOURCE_DUPLICATES.inc(cross_source, category=category, source=source)
+        self.article_store.add(category, new_items)
+        return new_items
+        
+    def dedup_stats(self) -> dict:
+        """
+        Report how many fetched items deduplication eliminated.
+        
+        Returns:
+            dict: Cumulative fetched, already_processed and cross_source counts
+        """
+        return dict(self._dedup_stats)
+        
+    def _parse_feed_entries(self, category: str, feed_url: str, entries: list) -> list:
+        """Convert the unprocessed entries of a fetched feed into news items."""
+        news_items = self._filter_new(
+            category, 'rss', [NewsItem.from_feed_entry(feed_url, entry) for entry in entries]
+        )
+        self.logger.info(f"Successfully fetched RSS feed: {feed_url}")
         return news_items
         
     async def fetch_youtube_news(self, category: str) -> list:
@@ -60,43 +251,81 @@ class NewsService:
             category (str): News category
             
         Returns:
-            list: List of YouTube videos
+            list: List of NewsItem videos
         """
         if not self.youtube_api_key:
             self.logger.error("YouTube API key not found")
             return []
             
         try:
-            youtube = build('youtube', 'v3', developerKey=self.youtube_api_key)
-            query = SEARCH_QUERIES.get(category, '')
-            
-            search_response = youtube.search().list(
-                q=query,
-                part='snippet',
-                type='video',
-                order='date',
-                maxResults=MAX_RESULTS['YOUTUBE']
-            ).execute()
-            
-            videos = []
-            for item in search_response['items']:
-                video_id = item['id']['videoId']
-                if video_id not in self.processed_items:
-                    videos.append({
-                        'id': video_id,
-                        'title': item['snippet']['title'],
-                        'description': item['snippet']['description'],
-                        'thumbnail': item['snippet']['thumbnails']['default']['url'],
-                        'url': f"https://www.youtube.com/watch?v={video_id}"
-                    })
-                    
+            search_results = await BREAKERS.call(
+                'youtube', 'youtube',
+                partial(self.youtube_client.search_videos, SEARCH_QUERIES.get(category, ''), MAX_RESULTS['YOUTUBE'])
+            )
+            videos = self._filter_new(category, 'youtube', [
+                NewsItem(
+                    id=video['video_id'],
+                    title=video['title'],
+                    url=f"https://www.youtube.com/watch?v={video['video_id']}",
+                    source=video.get('channel') or 'YouTube',
+                    origin='youtube',
+                    description=video['description'] or '',
+                    published=parse_timestamp(video.get('published_at')),
+                    thumbnail=video['thumbnail']
+                )
+                for video in search_results
+            ])
             self.logger.info(f"Successfully fetched YouTube videos for category: {category}")
             return videos
             
+        except CircuitOpenError as e:
+            self.logger.info(f"Skipping YouTube for {category}: {str(e)}")
+            return []
         except Exception as e:
-            self.logger.error(f"Error fetching YouTube content for {category}: {str(e)}")
+            self.logger.error(f"Error fetching YouTube content for {category}: {str(e)}", exc_info=False)
             return []
             
+    async def _request_google_news(self, query: str) -> list:
+        """
+        Request the latest articles for a query from NewsAPI.
+        
+        Args:
+            query (str): Search query
+            
+        Returns:
+            list: Article dicts with title, description, url, source and published_at
+            
+        Raises:
+            aiohttp.ClientResponseError: If NewsAPI responds with an error status
+        """
+        session = self._get_session()
+        url = f"{API_ENDPOINTS['NEWS_API']}?{urlencode({'q': query, 'sortBy': 'publishedAt'})}"
+        headers = {'X-Api-Key': self.news_api_key}
+        headers.update(self.http_cache.request_headers(url))
+        
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                raw_articles = self.http_cache.hit(url)
+                if raw_articles is not None:
+                    return raw_articles
+            response.raise_for_status()
+            body = await response.read()
+            
+        data = json.loads(body)
+        raw_articles = [
+            {
+                'title': article['title'],
+                'description': article['description'],
+                'url': article['url'],
+                'source': article['source']['name'],
+                'published_at': article.get('publishedAt')
+            }
+            for article in data['articles'][:MAX_RESULTS['GOOGLE_NEWS']]
+        ]
+        self.http_cache.store(url, response.headers, raw_articles, len(body))
+        self.http_cache.save()
+        return raw_articles
+        
     async def fetch_google_news(self, category: str) -> list:
         """
         Fetch news from Google News API for a specific category.
@@ -105,43 +334,49 @@ class NewsService:
             category (str): News category
             
         Returns:
-            list: List of news articles
+            list: List of NewsItem articles
         """
         if not self.news_api_key:
             self.logger.error("Google API key not found")
             return []
             
         try:
-            async with aiohttp.ClientSession() as session:
-                query = SEARCH_QUERIES.get(category, '')
-                url = f"https://newsapi.org/v2/everything?q={query}&sortBy=publishedAt&apiKey={self.news_api_key}"
-                
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = []
-                        
-                        for article in data['articles'][:MAX_RESULTS['GOOGLE_NEWS']]:
-                            article_id = f"google_{article['url']}"
-                            if article_id not in self.processed_items:
-                                articles.append({
-                                    'id': article_id,
-                                    'title': article['title'],
-                                    'description': article['description'],
-                                    'url': article['url'],
-                                    'source': article['source']['name']
-                                })
-                                
-                        self.logger.info(f"Successfully fetched Google News for category: {category}")
-                        return articles
-                    else:
-                        self.logger.error(f"Error fetching Google News: {response.status}")
-                        return []
-                        
+            raw_articles = await BREAKERS.call(
+                'newsapi', 'newsapi',
+                partial(self._request_google_news, SEARCH_QUERIES.get(category, ''))
+            )
+            articles = self._filter_new(category, 'newsapi', [
+                NewsItem(
+                    id=f"google_{article['url']}",
+                    title=article['title'] or '',
+                    url=article['url'],
+                    source=article['source'] or 'Unknown Source',
+                    origin='newsapi',
+                    description=article['description'] or '',
+                    published=parse_timestamp(article.get('published_at'))
+                )
+                for article in raw_articles
+            ])
+            self.logger.info(f"Successfully fetched Google News for category: {category}")
+            return articles
+            
+        except CircuitOpenError as e:
+            self.logger.info(f"Skipping Google News for {category}: {str(e)}")
+            return []
         except Exception as e:
-            self.logger.error(f"Error fetching Google News for {category}: {str(e)}")
+            self.logger.error(f"Error fetching Google News for {category}: {str(e)}", exc_info=False)
             return []
             
-    def mark_as_processed(self, item_id: str):
-        """Mark an item as processed."""
-        self.processed_items.add(item_id) 
\ No newline at end of file
+    def mark_items_as_processed(self, news_items: list):
+        """Mark NewsItems as processed under their source IDs and canonical URL keys."""
+        self.processed_items.add_many(
+            key for item in news_items for key in (item.id, item.url_key) if key
+        )
+
+    async def close(self):
+        """Release network resources held by the service."""
+        self.feed_fetcher.close()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        await self.article_store.close()
+        self.processed_items.close()
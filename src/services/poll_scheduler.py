@@ -0,0 +1,109 @@
+"""
+Per-feed adaptive polling intervals.
+"""
+
+import json
+import os
+import random
+import time
+from src.utils.logger import Logger
+from src.constants.app_constants import STORAGE_PATHS, POLL_CONFIG
+
+class AdaptivePollScheduler:
+    def __init__(self, path: str = STORAGE_PATHS['POLL_STATE']):
+        """
+        Load the persisted polling state.
+
+        Args:
+            path (str): JSON file holding each feed's interval and next poll time
+        """
+        self.logger = Logger(__name__)
+        self.path = path
+        self._state = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._state = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading poll state {self.path}: {str(e)}", exc_info=False)
+            self._state = {}
+
+    def save(self):
+        """Write the polling state to disk."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"Error saving poll state {self.path}: {str(e)}", exc_info=False)
+
+    def is_due(self, feed_url: str, now: float = None) -> bool:
+        """Return True if the feed should be polled now; unknown feeds are always due."""
+        state = self._state.get(feed_url)
+        return state is None or state['next_poll'] <= (now or time.time())
+
+    def due_feeds(self, feed_urls: list, now: float = None) -> list:
+        """Return the feeds from feed_urls that are due for a poll."""
+        now = now or time.time()
+        return [url for url in feed_urls if self.is_due(url, now)]
+
+    def _target_interval(self, interval: float, entries: list, new_count: int,
+                         not_modified: bool, now: float) -> float:
+        """Estimate the interval that would see about TARGET_NEW_ITEMS_PER_POLL new entries."""
+        target_items = POLL_CONFIG['TARGET_NEW_ITEMS_PER_POLL']
+        if not_modified or new_count == 0:
+            return interval * POLL_CONFIG['BACKOFF_FACTOR']
+
+        timestamps = sorted(entry['published'] for entry in entries if entry.get('published'))
+        if len(timestamps) >= 2:
+            gap = (timestamps[-1] - timestamps[0]) / (len(timestamps) - 1)
+            # A feed whose newest entry is old has slowed down since then
+            gap = max(gap, now - timestamps[-1])
+            return gap * target_items
+
+        # Without timestamps, scale by how many new entries this poll found
+        return interval * target_items / new_count
+
+    def record_poll(self, feed_url: str, entries: list, new_count: int, not_modified: bool,
+                    now: float = None) -> float:
+        """
+        Update a feed's interval from the result of a poll and schedule the next one.
+
+        Args:
+            feed_url (str): Polled feed
+            entries (list): Entry dicts returned by the feed, with optional 'published' timestamps
+            new_count (int): Entries that had not been processed before
+            not_modified (bool): Whether the server answered 304 Not Modified
+            now (float, optional): Poll time, defaults to the current time
+
+        Returns:
+            float: The new polling interval in seconds
+        """
+        now = now or time.time()
+        state = self._state.setdefault(feed_url, {
+            'interval': POLL_CONFIG['INITIAL_INTERVAL'],
+            'polls': 0,
+            'not_modified_polls': 0
+        })
+        target = self._target_interval(state['interval'], entries, new_count, not_modified, now)
+        smoothing = POLL_CONFIG['SMOOTHING']
+        interval = (1 - smoothing) * state['interval'] + smoothing * target
+        interval = min(POLL_CONFIG['MAX_INTERVAL'], max(POLL_CONFIG['MIN_INTERVAL'], interval))
+
+        jitter = POLL_CONFIG['JITTER']
+        state['interval'] = interval
+        state['last_poll'] = now
+        state['next_poll'] = now + interval * random.uniform(1 - jitter, 1 + jitter)
+        state['polls'] += 1
+        state['not_modified_polls'] += int(not_modified)
+        return interval
+
+    def describe(self) -> dict:
+        """Return a copy of every feed's polling state."""
+        return {url: dict(state) for url, state in self._state.items()}
@@ -0,0 +1,126 @@
+"""
+Incremental RSS/Atom parser that stops once it has the entries it needs.
+"""
+
+import xml.etree.ElementTree as ET
+from src.utils.dates import parse_timestamp
+
+FEED_ROOTS = {'rss', 'feed', 'RDF'}
+ENTRY_TAGS = {'item', 'entry'}
+RDF_ABOUT = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'
+DESCRIPTION_TAGS = ('description', 'summary', 'content', 'encoded')
+DATE_TAGS = ('pubDate', 'published', 'updated', 'date')
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition('}')[2]
+
+class StreamingFeedParser:
+    def __init__(self, limit: int):
+        """
+        Create a parser for one feed document.
+
+        Args:
+            limit (int): Stop after this many entries
+        """
+        self.limit = limit
+        self.entries = []
+        self.done = False
+        self._checked = 0
+        self._parser = ET.XMLPullParser(events=('start', 'end'))
+        self._open = []
+
+    def feed(self, data: bytes) -> bool:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            data (bytes): Next chunk of the raw document
+
+        Returns:
+            bool: True once no further input is needed
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document is not well-formed XML
+            ValueError: If the document is not an RSS or Atom feed
+        """
+        if self.done:
+            return True
+        self._parser.feed(data)
+        for event, element in self._parser.read_events():
+            if event == 'start':
+                if not self._open and _local_name(element.tag) not in FEED_ROOTS:
+                    raise ValueError(f"Not an RSS/Atom document: <{_local_name(element.tag)}>")
+                self._open.append(element)
+                continue
+
+            self._open.pop()
+            if _local_name(element.tag) not in ENTRY_TAGS:
+                continue
+            entry = self._entry(element)
+            # Drop the finished entry so memory stays flat on large feeds
+            if self._open:
+                self._open[-1].remove(element)
+            self.entries.append(entry)
+            if len(self.entries) >= self.limit:
+                self.done = True
+                return True
+        return False
+
+    def stop_at(self, is_processed) -> bool:
+        """
+        Drop the entries from the first already-processed one on and stop parsing there.
+
+        Only entries added since the previous call are checked, so this can
+        run after every chunk.
+
+        Args:
+            is_processed: Callable taking an entry ID
+
+        Returns:
+            bool: True once no further input is needed
+        """
+        for index in range(self._checked, len(self.entries)):
+            if is_processed(self.entries[index]['id']):
+                del self.entries[index:]
+                self.done = True
+                break
+        self._checked = len(self.entries)
+        return self.done
+
+    def close(self) -> list:
+        """
+        Finish parsing and return the entries.
+
+        Raises:
+            xml.etree.ElementTree.ParseError: If the document ended early
+        """
+        if not self.done:
+            self._parser.close()
+        return self.entries
+
+    @staticmethod
+    def _entry(element) -> dict:
+        """Build the same entry dict FeedFetcher._parse builds with feedparser."""
+        children = {}
+        link = ''
+        for child in element:
+            name = _local_name(child.tag)
+            if name == 'link':
+                href = child.get('href')
+                if href is None:
+                    link = link or (child.text or '').strip()
+                elif not link and child.get('rel', 'alternate') == 'alternate':
+                    link = href.strip()
+            elif name not in children:
+                children[name] = ''.join(child.itertext()).strip()
+
+        def first(names):
+            return next((children[name] for name in names if children.get(name)), '')
+
+        return {
+            'id': first(('guid', 'id')) or element.get(RDF_ABOUT) or link,
+            'title': children.get('title', ''),
+            'link': link,
+            'description': first(DESCRIPTION_TAGS),
+            'published': parse_timestamp(first(DATE_TAGS))
+        }
@@ -0,0 +1,137 @@
+"""
+Registry of the Discord channels subscribed to each news category.
+"""
+
+import json
+import os
+from src.utils.logger import Logger
+from src.constants.app_constants import CATEGORIES, CHANNEL_IDS, STORAGE_PATHS
+
+class SubscriptionRegistry:
+    def __init__(self, path: str = STORAGE_PATHS['SUBSCRIPTIONS']):
+        """
+        Load the persisted subscriptions, seeding them from CHANNEL_IDS on first run.
+
+        Args:
+            path (str): JSON file holding each channel's guild and categories
+        """
+        self.logger = Logger(__name__)
+        self.path = path
+        self._channels = {}
+        self._by_category = {category: set() for category in CATEGORIES}
+        # Incremented on every change so resolved channel lists can be reused until then
+        self.version = 0
+        if not self._load():
+            for category in CATEGORIES:
+                channel_id = CHANNEL_IDS.get(category.upper())
+                if channel_id:
+                    self.subscribe(None, channel_id, category)
+
+    def _load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading subscriptions {self.path}: {str(e)}", exc_info=False)
+            return False
+        for channel_id, entry in data.items():
+            for category in entry['categories']:
+                self.subscribe(entry['guild_id'], int(channel_id), category)
+        return True
+
+    def save(self):
+        """Write the subscriptions to disk."""
+        data = {
+            str(channel_id): {'guild_id': entry['guild_id'], 'categories': sorted(entry['categories'])}
+            for channel_id, entry in self._channels.items()
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"Error saving subscriptions {self.path}: {str(e)}", exc_info=False)
+
+    def subscribe(self, guild_id: int, channel_id: int, category: str) -> bool:
+        """
+        Subscribe a channel to a category.
+
+        Args:
+            guild_id (int): Guild owning the channel, None if unknown
+            channel_id (int): Channel receiving the category's roundups
+            category (str): News category
+
+        Returns:
+            bool: True if the subscription is new
+
+        Raises:
+            ValueError: If category is not a known category
+        """
+        if category not in self._by_category:
+            raise ValueError(f"Invalid category: {category}")
+        entry = self._channels.setdefault(channel_id, {'guild_id': guild_id, 'categories': set()})
+        if guild_id is not None:
+            entry['guild_id'] = guild_id
+        if category in entry['categories']:
+            return False
+        entry['categories'].add(category)
+        self._by_category[category].add(channel_id)
+        self.version += 1
+        return True
+
+    def unsubscribe(self, channel_id: int, category: str = None) -> list:
+        """
+        Remove one or all of a channel's subscriptions.
+
+        Args:
+            channel_id (int): Subscribed channel
+            category (str, optional): Category to remove, defaults to all of them
+
+        Returns:
+            list: Categories the channel was unsubscribed from
+        """
+        entry = self._channels.get(channel_id)
+        if entry is None:
+            return []
+        removed = [category] if category in entry['categories'] else []
+        if category is None:
+            removed = sorted(entry['categories'])
+        for name in removed:
+            entry['categories'].discard(name)
+            self._by_category[name].discard(channel_id)
+        if not entry['categories']:
+            del self._channels[channel_id]
+        if removed:
+            self.version += 1
+        return removed
+
+    def remove_guild(self, guild_id: int) -> int:
+        """
+        Drop every subscription of a guild, e.g. after the bot left it.
+
+        Returns:
+            int: Number of channels unsubscribed
+        """
+        channel_ids = [
+            channel_id for channel_id, entry in self._channels.items() if entry['guild_id'] == guild_id
+        ]
+        for channel_id in channel_ids:
+            self.unsubscribe(channel_id)
+        return len(channel_ids)
+
+    def subscribers(self, category: str) -> list:
+        """Return the IDs of the channels subscribed to a category."""
+        return list(self._by_category.get(category, ()))
+
+    def categories(self, channel_id: int) -> list:
+        """Return the categories a channel is subscribed to."""
+        entry = self._channels.get(channel_id)
+        return sorted(entry['categories']) if entry else []
+
+    def describe(self) -> dict:
+        """Return the number of subscribed channels per category."""
+        return {category: len(channel_ids) for category, channel_ids in self._by_category.items()}
@@ -2,9 +2,20 @@
 Text summarization service using Google's Gemini API.
 """
 
+import asyncio
 import os
+from functools import partial
 import google.generativeai as genai
+from src.models.news_item import NewsItem
+from src.services.circuit_breaker import BREAKERS, CircuitOpenError, QuotaExceededError
+from src.services.clustering import collapse_duplicates
+from src.services.digest import RollingDigest
+from src.services.gemini_limiter import GeminiLimiter
+from src.services.summary_cache import SummaryCache
 from src.utils.logger import Logger
+from src.utils.metrics import GEMINI_REQUEST_SECONDS, GEMINI_PROMPT_TOKENS
+from src.utils.tokens import estimate_tokens, plan_chunks, truncate_to_tokens
+from src.constants.app_constants import DIGEST_CONFIG, GEMINI_LIMITS, SUMMARIZER_CONFIG
 
 class GeminiSummarizer:
     def __init__(self):
@@ -16,76 +27,259 @@ class GeminiSummarizer:
             
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.cache = SummaryCache()
+        self.limiter = GeminiLimiter()
+        self.digest = RollingDigest(self._generate)
         
-    async def summarize_batch(self, category: str, news_items: list) -> str:
+    @staticmethod
+    def _format_item(item: NewsItem) -> str:
+        """Format a news item for a prompt, trimming overly long descriptions."""
+        description = truncate_to_tokens(
+            item.description or 'No description available',
+            SUMMARIZER_CONFIG['MAX_ITEM_TOKENS']
+        )
+        if item.related_sources:
+            sources = ''.join(f"- {source}: {url}\n" for source, url in item.related_sources)
+            return (
+                f"Title: {item.title or 'No Title'}\n"
+                f"Sources (same story):\n{sources}"
+                f"Content: {description}\n"
+            )
+        return (
+            f"Title: {item.title or 'No Title'}\n"
+            f"Source: {item.source or 'Unknown Source'}\n"
+            f"URL: {item.url or 'No URL'}\n"
+            f"Content: {description}\n"
+        )
+
+    def _plan_chunks(self, news_items: list) -> list:
+        """Split a batch into sub-batches whose prompts fit the token budget."""
+        costs = [estimate_tokens(self._format_item(item)) for item in news_items]
+        budget = SUMMARIZER_CONFIG['MAX_PROMPT_TOKENS'] - SUMMARIZER_CONFIG['PROMPT_OVERHEAD_TOKENS']
+        return plan_chunks(news_items, costs, budget)
+
+    def _build_reduce_prompt(self, category: str, partial_summaries: list) -> str:
+        """Build the prompt merging partial roundups into one."""
+        separator = f"\n{'-' * 80}\n"
+        return f"""
+        You are a news curator for a Discord channel focused on {category.replace('_', ' ')} news.
+        Below are several partial news roundups, each covering a different subset of today's items.
+        Merge them into a single roundup:
+
+        1. Combine topics that cover the same story into one entry and merge their sources
+        2. Keep every distinct topic, ordered from most to least significant
+        3. Keep the exact output format below, with a single header
+
+           📰 **Latest {category.replace('_', ' ').title()} News Roundup**
+
+           🔹 **[Topic/Headline]**
+           [4-5 sentence summary of the key points]
+           
+           Sources:
+           - [Source Name 1](URL1)
+           - ...
+
+        Here are the partial roundups:
+        {separator}{separator.join(partial_summaries)}{separator}
+        """
+
+    async def _request(self, prompt: str):
+        """Make one Gemini request, pausing the shared limiter if the quota is exhausted."""
+        try:
+            return await self.model.generate_content_async(prompt)
+        except Exception as e:
+            if getattr(e, 'code', None) == 429 or type(e).__name__ == 'ResourceExhausted':
+                self.limiter.pause()
+                raise QuotaExceededError(str(e)) from e
+            raise
+
+    async def _generate(self, category: str, prompt: str, priority: str = 'scheduled') -> str:
+        """Send a prompt to Gemini through the shared limiter and its circuit breaker, returning the stripped text."""
+        prompt_tokens = estimate_tokens(prompt)
+        GEMINI_PROMPT_TOKENS.observe(prompt_tokens, category=category)
+        estimated_tokens = prompt_tokens + GEMINI_LIMITS['EXPECTED_OUTPUT_TOKENS']
+        # Queueing happens outside the breaker so a long wait for quota is not a timeout;
+        # a request rejected for quota goes back through the queue once the pause is over
+        for attempt in range(GEMINI_LIMITS['QUOTA_RETRIES'] + 1):
+            try:
+                async with self.limiter.slot(estimated_tokens, priority):
+                    with GEMINI_REQUEST_SECONDS.time(category=category):
+                        response = await BREAKERS.call(
+                            'gemini', 'gemini', partial(self._request, prompt),
+                            before_retry=partial(self.limiter.charge, estimated_tokens)
+                        )
+                break
+            except QuotaExceededError:
+                if attempt == GEMINI_LIMITS['QUOTA_RETRIES']:
+                    raise
+        usage = getattr(response, 'usage_metadata', None)
+        if usage and getattr(usage, 'total_token_count', None):
+            self.limiter.settle(estimated_tokens, usage.total_token_count)
+        return response.text.strip() if response.text else ''
+
+    async def _summarize_chunks(self, category: str, chunks: list, priority: str = 'scheduled') -> tuple:
+        """
+        Summarize sub-batches concurrently, then merge them in a reduce step.
+        
+        Partial summaries are memoized per sub-batch, so when one sub-batch
+        fails the whole batch is kept for the next run and only the failed
+        sub-batches are sent to Gemini again.
+        
+        Args:
+            category (str): The category of news
+            chunks (list): Sub-batches from _plan_chunks
+            priority (str): Priority class for the Gemini limiter
+            
+        Returns:
+            tuple: Final summary and the estimated prompt tokens spent
+            
+        Raises:
+            Exception: The first sub-batch failure, once every sub-batch has finished
+        """
+        semaphore = asyncio.Semaphore(SUMMARIZER_CONFIG['MAP_CONCURRENCY'])
+        prompts = [self._build_prompt(category, chunk) for chunk in chunks]
+        
+        async def summarize_chunk(chunk, prompt):
+            cache_key = self.cache.make_key(f"{category}:sub-batch", chunk)
+            cached_summary = self.cache.get(cache_key)
+            if cached_summary is not None:
+                return cached_summary
+            async with semaphore:
+                summary = await self._generate(category, prompt, priority)
+            if summary:
+                self.cache.put(cache_key, summary, estimate_tokens(prompt))
+            return summary
+                
+        results = await asyncio.gather(
+            *(summarize_chunk(chunk, prompt) for chunk, prompt in zip(chunks, prompts)),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            self.logger.error(
+                f"{len(errors)} of {len(chunks)} sub-batches for {category} failed, "
+                f"keeping the batch for the next run: {str(errors[0])}",
+                exc_info=False
+            )
+            raise errors[0]
+        partial_summaries = [result for result in results if result]
+        if not partial_summaries:
+            return '', 0
+            
+        map_tokens = sum(estimate_tokens(prompt) for prompt in prompts)
+        if len(partial_summaries) == 1:
+            return partial_summaries[0], map_tokens
+            
+        reduce_prompt = self._build_reduce_prompt(category, partial_summaries)
+        summary = await self._generate(category, reduce_prompt, priority)
+        return summary, map_tokens + estimate_tokens(reduce_prompt)
+
+    def _build_prompt(self, category: str, news_items: list) -> str:
+        """Build the roundup prompt for a batch of news items."""
+        # Prepare the news items for the prompt
+        formatted_items = [self._format_item(item) for item in news_items]
+        
+        # Create the prompt
+        prompt = f"""
+        You are a news curator for a Discord channel focused on {category.replace('_', ' ')} news.
+        Below are several news items. Please analyze them and:
+
+        1. Filter out any items that are:
+           - User queries or discussions
+           - Personal opinions or blog posts
+           - Duplicate or redundant information
+           - Not relevant to {category.replace('_', ' ')}
+
+        2. For the remaining important and genuine news items:
+           - Provide a concise summary of each key development
+           - Group related items together if they cover the same topic
+           - Highlight any significant announcements or breakthroughs
+           - Include relevant technical details when appropriate
+
+        3. Format the output as follows:
+           📰 **Latest {category.replace('_', ' ').title()} News Roundup**
+
+           [For each major topic/story]:
+           🔹 **[Topic/Headline]**
+           [4-5 sentence summary of the key points]
+           
+           Sources:
+           - [Source Name 1](URL1)
+           - [Source Name 2](URL2)
+           - ...
+
+           [Repeat for each major topic]
+
+        Here are the news items to analyze:
+
+        {'-' * 80}
+        {''.join(formatted_items)}
+        {'-' * 80}
+        """
+        return prompt
+
+    async def summarize_batch(self, category: str, news_items: list, priority: str = 'scheduled') -> str:
         """
         Summarize a batch of news items using Gemini.
         
         Args:
             category (str): The category of news
             news_items (list): List of news items to summarize
+            priority (str): Priority class for the Gemini limiter, 'scheduled' or 'manual'
             
         Returns:
             str: Formatted summary of important news
+            
+        Raises:
+            CircuitOpenError: If Gemini's circuit is open
+            Exception: Any other Gemini failure; either way nothing is posted and the items are kept for a later run
         """
+        cache_key = self.cache.make_key(category, news_items)
+        cached_summary = self.cache.get(cache_key)
+        if cached_summary is not None:
+            stats = self.cache.stats()
+            self.logger.info(
+                f"Summary cache hit for category: {category} "
+                f"(hit rate {stats['hit_rate']:.0%}, ~{stats['tokens_saved']} tokens saved so far)"
+            )
+            return cached_summary
+            
         try:
-            # Prepare the news items for the prompt
-            formatted_items = []
-            for item in news_items:
-                formatted_items.append(
-                    f"Title: {item.get('title', 'No Title')}\n"
-                    f"Source: {item.get('source', 'Unknown Source')}\n"
-                    f"URL: {item.get('url') or item.get('link', 'No URL')}\n"
-                    f"Content: {item.get('description', 'No description available')}\n"
+            unique_items = collapse_duplicates(news_items)
+            if len(unique_items) < len(news_items):
+                self.logger.info(
+                    f"Collapsed {len(news_items)} {category} items into {len(unique_items)} unique stories"
                 )
+                
+            if DIGEST_CONFIG['INCREMENTAL']:
+                # Only topics that received items are sent to Gemini, with their previous summary
+                summary, prompt_tokens = await self.digest.summarize(category, unique_items, priority)
+            else:
+                chunks = self._plan_chunks(unique_items)
+                if len(chunks) > 1:
+                    self.logger.info(
+                        f"Splitting {len(unique_items)} {category} items into {len(chunks)} sub-batches"
+                    )
+                    summary, prompt_tokens = await self._summarize_chunks(category, chunks, priority)
+                else:
+                    prompt = self._build_prompt(category, unique_items)
+                    summary = await self._generate(category, prompt, priority)
+                    prompt_tokens = estimate_tokens(prompt)
             
-            # Create the prompt
-            prompt = f"""
-            You are a news curator for a Discord channel focused on {category.replace('_', ' ')} news.
-            Below are several news items. Please analyze them and:
-
-            1. Filter out any items that are:
-               - User queries or discussions
-               - Personal opinions or blog posts
-               - Duplicate or redundant information
-               - Not relevant to {category.replace('_', ' ')}
-
-            2. For the remaining important and genuine news items:
-               - Provide a concise summary of each key development
-               - Group related items together if they cover the same topic
-               - Highlight any significant announcements or breakthroughs
-               - Include relevant technical details when appropriate
-
-            3. Format the output as follows:
-               📰 **Latest {category.replace('_', ' ').title()} News Roundup**
-
-               [For each major topic/story]:
-               🔹 **[Topic/Headline]**
-               [4-5 sentence summary of the key points]
-               
-               Sources:
-               - [Source Name 1](URL1)
-               - [Source Name 2](URL2)
-               - ...
-
-               [Repeat for each major topic]
-
-            Here are the news items to analyze:
-
-            {'-' * 80}
-            {''.join(formatted_items)}
-            {'-' * 80}
-            """
-            
-            response = await self.model.generate_content_async(prompt)
-            
-            if response.text:
+            if summary:
                 self.logger.info(f"Successfully summarized {len(news_items)} items for category: {category}")
-                return response.text.strip()
+                self.cache.put(cache_key, summary, prompt_tokens)
+                return summary
             else:
                 self.logger.warning(f"Empty response from Gemini for category: {category}")
                 return f"⚠️ Unable to generate summary for {category.replace('_', ' ')} news at this time."
                 
+        except CircuitOpenError:
+            raise
         except Exception as e:
-            self.logger.error(f"Error summarizing news batch: {str(e)}")
-            return f"⚠️ Error processing {category.replace('_', ' ')} news: {str(e)}" 
\ No newline at end of file
+            self.logger.error(f"Error summarizing {category} news batch: {str(e)}", exc_info=False)
+            raise
+
+    def close(self):
+        """Release resources held by the summarizer."""
+        self.cache.close()
@@ -0,0 +1,139 @@
+"""
+Content-addressed cache of generated news summaries.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from src.utils.logger import Logger
+from src.constants.app_constants import STORAGE_PATHS, SUMMARY_CACHE_CONFIG
+
+class SummaryCache:
+    def __init__(self, path: str = STORAGE_PATHS['SUMMARY_CACHE'],
+                 persist: bool = SUMMARY_CACHE_CONFIG['PERSIST'],
+                 max_entries: int = SUMMARY_CACHE_CONFIG['MAX_ENTRIES'],
+                 max_bytes: int = SUMMARY_CACHE_CONFIG['MAX_BYTES']):
+        """
+        Create the cache.
+
+        Args:
+            path (str): SQLite database used for persistence
+            persist (bool): Keep summaries on disk so they survive restarts
+            max_entries (int): Maximum number of summaries kept
+            max_bytes (int): Maximum total size of the summaries kept in memory
+        """
+        self.logger = Logger(__name__)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'tokens_saved': 0}
+        self._conn = None
+        if persist:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            self._conn = sqlite3.connect(path)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS summaries ('
+                'cache_key TEXT PRIMARY KEY, summary TEXT NOT NULL, '
+                'prompt_tokens INTEGER NOT NULL, created_at REAL NOT NULL) WITHOUT ROWID'
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(category: str, news_items: list) -> str:
+        """
+        Build a stable key from the category and the items' IDs and content hashes.
+
+        The key does not depend on item order, so the same batch fetched in a
+        different order still hits the cache.
+
+        Args:
+            category (str): News category
+            news_items (list): NewsItems being summarized
+
+        Returns:
+            str: Hex digest identifying the batch
+        """
+        digest = hashlib.sha256(category.encode('utf-8'))
+        for item in sorted(news_items, key=lambda item: item.id):
+            digest.update(f"\x00{item.id}\x00".encode('utf-8'))
+            digest.update(item.content_hash)
+        return digest.hexdigest()
+
+    def _remember(self, key: str, summary: str, prompt_tokens: int):
+        """Insert into the in-memory LRU and evict the oldest entries over the limits."""
+        if key in self._entries:
+            self._bytes -= len(self._entries[key][0])
+        self._entries[key] = (summary, prompt_tokens)
+        self._entries.move_to_end(key)
+        self._bytes += len(summary)
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def get(self, key: str):
+        """
+        Look up a cached summary.
+
+        Args:
+            key (str): Key from make_key
+
+        Returns:
+            str: The cached summary, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None and self._conn is not None:
+            row = self._conn.execute(
+                'SELECT summary, prompt_tokens FROM summaries WHERE cache_key = ?', (key,)
+            ).fetchone()
+            if row is not None:
+                entry = (row[0], row[1])
+                self._remember(key, *entry)
+        if entry is None:
+            self._stats['misses'] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats['hits'] += 1
+        self._stats['tokens_saved'] += entry[1]
+        return entry[0]
+
+    def put(self, key: str, summary: str, prompt_tokens: int):
+        """
+        Store a summary.
+
+        Args:
+            key (str): Key from make_key
+            summary (str): Generated summary
+            prompt_tokens (int): Estimated prompt size, counted as saved on later hits
+        """
+        self._remember(key, summary, prompt_tokens)
+        if self._conn is None:
+            return
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO summaries (cache_key, summary, prompt_tokens, created_at) '
+                'VALUES (?, ?, ?, ?)',
+                (key, summary, prompt_tokens, time.time())
+            )
+            self._conn.execute(
+                'DELETE FROM summaries WHERE cache_key NOT IN ('
+                'SELECT cache_key FROM summaries ORDER BY created_at DESC LIMIT ?)',
+                (self.max_entries,)
+            )
+
+    def stats(self) -> dict:
+        """Return hit/miss counters, hit rate and estimated tokens saved."""
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'entries': len(self._entries)
+        }
+
+    def close(self):
+        """Close the database connection, if any."""
+        if self._conn is not None:
+            self._conn.close()
@@ -0,0 +1,278 @@
+"""
+WebSub (PubSubHubbub) subscriptions for feeds that advertise a hub.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import re
+import secrets
+import time
+from src.utils.logger import Logger
+from src.constants.app_constants import RSS_FEEDS, STORAGE_PATHS, WEBSUB_CONFIG
+
+LINK_TAG_PATTERN = re.compile(rb'<(?:atom:)?link\b[^>]*>', re.IGNORECASE)
+ATTRIBUTE_PATTERN = re.compile(rb'([\w:-]+)\s*=\s*["\']([^"\']*)["\']')
+SIGNATURE_ALGORITHMS = {
+    'sha1': hashlib.sha1,
+    'sha256': hashlib.sha256,
+    'sha384': hashlib.sha384,
+    'sha512': hashlib.sha512
+}
+DISCOVERY_BYTES = 64 * 1024
+
+class WebSubManager:
+    def __init__(self, get_session, path: str = STORAGE_PATHS['WEBSUB_STATE'],
+                 callback_url: str = WEBSUB_CONFIG['CALLBACK_URL']):
+        """
+        Load the persisted subscriptions.
+
+        Args:
+            get_session: Callable returning the shared aiohttp.ClientSession
+            path (str): JSON file holding one subscription per feed
+            callback_url (str): Public base URL of the API server, push is disabled when empty
+        """
+        self.logger = Logger(__name__)
+        self._get_session = get_session
+        self.path = path
+        self.callback_url = callback_url
+        self._subscriptions = {}
+        self._by_id = {}
+        self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.callback_url)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._subscriptions = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Error loading WebSub subscriptions {self.path}: {str(e)}", exc_info=False)
+            self._subscriptions = {}
+        self._by_id = {
+            subscription['id']: feed_url
+            for feed_url, subscription in self._subscriptions.items()
+            if subscription.get('id')
+        }
+
+    def save(self):
+        """Write the subscriptions to disk."""
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._subscriptions, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            self.logger.error(f"Error saving WebSub subscriptions {self.path}: {str(e)}", exc_info=False)
+
+    @staticmethod
+    def _find_links(body: bytes) -> dict:
+        """Return the hub and self links declared in the head of a feed document."""
+        links = {}
+        for tag in LINK_TAG_PATTERN.findall(body[:DISCOVERY_BYTES]):
+            attributes = {
+                name.lower(): value
+                for name, value in ATTRIBUTE_PATTERN.findall(tag)
+            }
+            href = attributes.get(b'href')
+            for rel in attributes.get(b'rel', b'').lower().split():
+                if href and rel in (b'hub', b'self'):
+                    links.setdefault(rel.decode(), href.decode('utf-8', 'replace'))
+        return links
+
+    async def discover(self, feed_url: str) -> tuple:
+        """
+        Find the hub and topic URL a feed advertises.
+
+        Link response headers take precedence over links in the document.
+
+        Args:
+            feed_url (str): URL of the RSS/Atom feed
+
+        Returns:
+            tuple: (hub URL, topic URL), hub is None if the feed has none
+        """
+        async with self._get_session().get(feed_url) as response:
+            response.raise_for_status()
+            links = {
+                rel: str(response.links[rel]['url'])
+                for rel in ('hub', 'self')
+                if rel in response.links
+            }
+            if 'hub' not in links:
+                body = await response.content.read(DISCOVERY_BYTES)
+                for rel, href in self._find_links(body).items():
+                    links.setdefault(rel, href)
+        return links.get('hub'), links.get('self', feed_url)
+
+    async def subscribe(self, feed_url: str, hub: str, topic: str):
+        """
+        Ask a hub to start pushing a feed to us.
+
+        The subscription stays pending until the hub verifies the intent
+        on the callback URL.
+
+        Args:
+            feed_url (str): Feed as configured in RSS_FEEDS
+            hub (str): Hub URL
+            topic (str): Topic URL advertised by the feed
+
+        Raises:
+            aiohttp.ClientError: If the hub rejects the request
+        """
+        subscription = self._subscriptions.get(feed_url) or {}
+        subscription_id = subscription.get('id') or secrets.token_hex(16)
+        renewing = subscription.get('state') == 'verified' and subscription.get('hub') == hub
+        subscription.update({
+            'id': subscription_id,
+            'hub': hub,
+            'topic': topic,
+            # Keep the secret on renewal, the hub signs with it until it re-verifies
+            'secret': subscription.get('secret') if renewing else secrets.token_hex(32),
+            'state': 'verified' if renewing else 'pending',
+            'requested_at': time.time()
+        })
+        self._subscriptions[feed_url] = subscription
+        self._by_id[subscription_id] = feed_url
+
+        data = {
+            'hub.mode': 'subscribe',
+            'hub.topic': topic,
+            'hub.callback': f"{self.callback_url}/websub/{subscription_id}",
+            'hub.secret': subscription['secret'],
+            'hub.lease_seconds': str(WEBSUB_CONFIG['LEASE_SECONDS'])
+        }
+        async with self._get_session().post(hub, data=data) as response:
+            response.raise_for_status()
+        self.logger.info(f"Requested WebSub subscription for {feed_url} from {hub}")
+
+    def _needs_subscription(self, subscription: dict, now: float) -> bool:
+        if subscription is None:
+            return True
+        state = subscription.get('state')
+        if state == 'no_hub':
+            return now - subscription['checked_at'] > WEBSUB_CONFIG['REDISCOVER_INTERVAL']
+        if state == 'verified':
+            return subscription['lease_expires'] - now < WEBSUB_CONFIG['RENEW_MARGIN']
+        if state == 'pending':
+            return now - subscription['requested_at'] > WEBSUB_CONFIG['VERIFY_TIMEOUT']
+        return True
+
+    async def _maintain_feed(self, feed_url: str):
+        subscription = self._subscriptions.get(feed_url)
+        hub = subscription.get('hub') if subscription else None
+        topic = subscription.get('topic') if subscription else None
+        if hub is None or subscription.get('state') == 'denied':
+            hub, topic = await self.discover(feed_url)
+        if hub is None:
+            self._subscriptions[feed_url] = {'state': 'no_hub', 'checked_at': time.time()}
+            return
+        await self.subscribe(feed_url, hub, topic)
+
+    async def maintain(self, feed_urls: list = None):
+        """
+        Subscribe feeds that advertise a hub and renew leases close to expiry.
+
+        Args:
+            feed_urls (list, optional): Feeds to consider, defaults to every RSS feed
+        """
+        if not self.enabled:
+            return
+        if feed_urls is None:
+            feed_urls = [url for urls in RSS_FEEDS.values() for url in urls]
+        now = time.time()
+        pending = [
+            url for url in dict.fromkeys(feed_urls)
+            if self._needs_subscription(self._subscriptions.get(url), now)
+        ]
+        results = await asyncio.gather(
+            *(self._maintain_feed(url) for url in pending),
+            return_exceptions=True
+        )
+        for feed_url, result in zip(pending, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error subscribing to {feed_url} via WebSub: {str(result)}", exc_info=False)
+        self.save()
+
+    def get(self, subscription_id: str):
+        """
+        Look up a subscription by its callback ID.
+
+        Returns:
+            tuple: (feed URL, subscription dict), or None if the ID is unknown
+        """
+        feed_url = self._by_id.get(subscription_id)
+        if feed_url is None or feed_url not in self._subscriptions:
+            return None
+        return feed_url, self._subscriptions[feed_url]
+
+    def verify_intent(self, subscription_id: str, params) -> str:
+        """
+        Answer a hub's verification of intent or denial notice.
+
+        Args:
+            subscription_id (str): Callback ID from the URL
+            params: Query parameters of the hub's GET request
+
+        Returns:
+            str: The body to answer with, or None to refuse with 404
+        """
+        found = self.get(subscription_id)
+        if found is None:
+            return None
+        feed_url, subscription = found
+        mode = params.get('hub.mode')
+
+        if mode == 'denied':
+            subscription['state'] = 'denied'
+            self.logger.warning(f"WebSub hub denied subscription for {feed_url}: {params.get('hub.reason', '')}")
+            self.save()
+            return ''
+        if mode != 'subscribe' or params.get('hub.topic') != subscription['topic']:
+            return None
+        if subscription['state'] not in ('pending', 'verified'):
+            return None
+
+        try:
+            lease_seconds = int(params.get('hub.lease_seconds', WEBSUB_CONFIG['LEASE_SECONDS']))
+        except ValueError:
+            lease_seconds = WEBSUB_CONFIG['LEASE_SECONDS']
+        subscription['state'] = 'verified'
+        subscription['lease_expires'] = time.time() + lease_seconds
+        self.logger.info(f"WebSub subscription verified for {feed_url} ({lease_seconds}s lease)")
+        self.save()
+        return params.get('hub.challenge', '')
+
+    @staticmethod
+    def verify_signature(subscription: dict, body: bytes, signature: str) -> bool:
+        """
+        Check a pushed payload's X-Hub-Signature against the subscription secret.
+
+        Args:
+            subscription (dict): Subscription the payload was delivered to
+            body (bytes): Raw request body
+            signature (str): X-Hub-Signature header, e.g. 'sha256=<hex>'
+
+        Returns:
+            bool: True if the signature matches
+        """
+        algorithm, _, digest = (signature or '').partition('=')
+        hash_function = SIGNATURE_ALGORITHMS.get(algorithm.lower())
+        if hash_function is None or not digest:
+            return False
+        expected = hmac.new(subscription['secret'].encode(), body, hash_function).hexdigest()
+        return hmac.compare_digest(expected, digest.lower())
+
+    def describe(self) -> dict:
+        """Return each feed's subscription state without secrets."""
+        return {
+            feed_url: {key: value for key, value in subscription.items() if key != 'secret'}
+            for feed_url, subscription in self._subscriptions.items()
+        }
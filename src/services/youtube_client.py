@@ -0,0 +1,75 @@
+"""
+Asynchronous client for the YouTube Data API search endpoint.
+"""
+
+import json
+from urllib.parse import urlencode
+from src.utils.logger import Logger
+from src.constants.app_constants import API_ENDPOINTS
+
+class YouTubeClient:
+    def __init__(self, api_key: str, get_session, cache):
+        """
+        Create the client.
+
+        Calls the REST endpoint directly on the shared aiohttp session, so no
+        discovery document is fetched and no request blocks the event loop.
+
+        Args:
+            api_key (str): YouTube Data API key
+            get_session: Callable returning the shared aiohttp.ClientSession
+            cache (ConditionalCache): Validator cache for conditional requests
+        """
+        self.logger = Logger(__name__)
+        self.api_key = api_key
+        self._get_session = get_session
+        self.cache = cache
+
+    async def search_videos(self, query: str, max_results: int) -> list:
+        """
+        Search for the most recent videos matching a query.
+
+        Args:
+            query (str): Search query
+            max_results (int): Maximum number of videos
+
+        Returns:
+            list: Video dicts with video_id, title, description, thumbnail, channel and published_at
+
+        Raises:
+            aiohttp.ClientResponseError: If the API responds with an error status
+        """
+        params = {
+            'q': query,
+            'part': 'snippet',
+            'type': 'video',
+            'order': 'date',
+            'maxResults': max_results
+        }
+        url = f"{API_ENDPOINTS['YOUTUBE_SEARCH']}?{urlencode(params)}"
+        headers = {'X-Goog-Api-Key': self.api_key}
+        headers.update(self.cache.request_headers(url))
+
+        session = self._get_session()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304:
+                videos = self.cache.hit(url)
+                if videos is not None:
+                    return videos
+            response.raise_for_status()
+            body = await response.read()
+
+        videos = [
+            {
+                'video_id': item['id']['videoId'],
+                'title': item['snippet']['title'],
+                'description': item['snippet']['description'],
+                'thumbnail': item['snippet']['thumbnails']['default']['url'],
+                'channel': item['snippet'].get('channelTitle', ''),
+                'published_at': item['snippet'].get('publishedAt', '')
+            }
+            for item in json.loads(body).get('items', [])
+        ]
+        self.cache.store(url, response.headers, videos, len(body))
+        self.cache.save()
+        return videos
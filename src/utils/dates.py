@@ -0,0 +1,33 @@
+"""
+Date parsing shared by the feed and API sources.
+"""
+
+from datetime import datetime, timezone
+from email.utils import mktime_tz, parsedate_tz
+
+def parse_timestamp(text: str):
+    """
+    Convert an RFC 822 or ISO 8601 date to a UTC timestamp.
+
+    Args:
+        text (str): Date as found in feeds and API responses
+
+    Returns:
+        int: Seconds since the epoch, or None if the date cannot be parsed
+    """
+    if not text:
+        return None
+    text = text.strip()
+    parsed = parsedate_tz(text)
+    if parsed is not None:
+        return mktime_tz(parsed)
+    if text[-1:] in ('Z', 'z'):
+        # fromisoformat only accepts the Z suffix from Python 3.11
+        text = f"{text[:-1]}+00:00"
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
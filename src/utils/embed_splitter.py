@@ -0,0 +1,54 @@
+"""
+Splitting of long roundups into parts that fit a Discord embed description.
+"""
+
+import re
+from src.constants.app_constants import DELIVERY_CONFIG
+
+TOPIC_BOUNDARY = re.compile(r'(?=🔹)')
+
+def _fit(text: str, limit: int):
+    """Yield pieces of text no longer than limit, breaking at line ends where possible."""
+    if len(text) <= limit:
+        yield text
+        return
+    piece = ''
+    for line in text.splitlines(keepends=True):
+        if piece and len(piece) + len(line) > limit and len(line) <= limit:
+            yield piece
+            piece = ''
+        piece += line
+        # A single line longer than limit is cut where it overflows
+        while len(piece) > limit:
+            yield piece[:limit]
+            piece = piece[limit:]
+    if piece:
+        yield piece
+
+def split_embed_text(text: str, limit: int = DELIVERY_CONFIG['EMBED_DESCRIPTION_LIMIT']) -> list:
+    """
+    Split a roundup into embed descriptions of at most limit characters.
+
+    Parts break between topics (🔹) and pack as many whole topics as fit; a
+    single topic longer than limit is broken at line ends.
+
+    Args:
+        text (str): Roundup as returned by the summarizer
+        limit (int): Maximum characters per part
+
+    Returns:
+        list: Parts in order, a single part if text already fits
+    """
+    if len(text) <= limit:
+        return [text]
+    parts = []
+    current = ''
+    for topic in TOPIC_BOUNDARY.split(text):
+        for piece in _fit(topic, limit):
+            if current and len(current) + len(piece) > limit:
+                parts.append(current.rstrip())
+                current = ''
+            current += piece
+    if current.strip():
+        parts.append(current.rstrip())
+    return parts
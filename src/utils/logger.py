@@ -1,60 +1,158 @@
 """
 Logging utility for the Discord News Bot.
+
+Records are handed to a queue on the calling thread and written to the
+console and log file by a single background listener thread, so logging
+never performs file I/O on the event loop.
 """
 
+import atexit
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime, timezone
+from src.constants.app_constants import LOGGING_CONFIG
+
+_install_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+_stats = {
+    'records': 0,
+    'enqueue_seconds': 0.0,
+    'max_enqueue_seconds': 0.0,
+    'started_at': time.time()
+}
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+class _TimedQueueHandler(QueueHandler):
+    """Queue handler that defers formatting to the listener and times each enqueue."""
+
+    def prepare(self, record):
+        # Only merge the message arguments here; tracebacks are formatted
+        # by the listener thread instead of on the caller's thread
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def emit(self, record):
+        start = time.perf_counter()
+        super().emit(record)
+        elapsed = time.perf_counter() - start
+        _stats['records'] += 1
+        _stats['enqueue_seconds'] += elapsed
+        if elapsed > _stats['max_enqueue_seconds']:
+            _stats['max_enqueue_seconds'] = elapsed
+
+def _install_handlers() -> QueueHandler:
+    """Create the file/console handlers and start the listener, once per process."""
+    global _queue_handler, _listener
+    with _install_lock:
+        if _queue_handler is not None:
+            return _queue_handler
 
-class Logger:
-    def __init__(self, name):
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
-        
         # Create logs directory if it doesn't exist
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
+        os.makedirs(LOGGING_CONFIG['DIRECTORY'], exist_ok=True)
+
         # Create formatters
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
-        
+        if LOGGING_CONFIG['FORMAT'] == 'json':
+            file_formatter = console_formatter = JsonFormatter()
+        else:
+            file_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            console_formatter = logging.Formatter(
+                '%(asctime)s - %(levelname)s - %(message)s'
+            )
+
         # File handler
-        log_file = f'logs/newsbot_{datetime.now().strftime("%Y%m%d")}.log'
+        log_file = os.path.join(
+            LOGGING_CONFIG['DIRECTORY'],
+            f'newsbot_{datetime.now().strftime("%Y%m%d")}.log'
+        )
         file_handler = RotatingFileHandler(
             log_file,
-            maxBytes=10485760,  # 10MB
-            backupCount=5
+            maxBytes=LOGGING_CONFIG['MAX_BYTES'],
+            backupCount=LOGGING_CONFIG['BACKUP_COUNT']
         )
         file_handler.setFormatter(file_formatter)
         file_handler.setLevel(logging.INFO)
-        
+
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(console_formatter)
         console_handler.setLevel(logging.INFO)
-        
-        # Add handlers
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-    
+
+        _listener = QueueListener(
+            queue.SimpleQueue(),
+            file_handler,
+            console_handler,
+            respect_handler_level=True
+        )
+        _queue_handler = _TimedQueueHandler(_listener.queue)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _queue_handler
+
+class Logger:
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.INFO)
+        # Records are fully handled by the queue; a root handler would write them again, on the caller's thread
+        self.logger.propagate = False
+
+        queue_handler = _install_handlers()
+        if queue_handler not in self.logger.handlers:
+            self.logger.addHandler(queue_handler)
+
+    @staticmethod
+    def stats() -> dict:
+        """
+        Report logging throughput and the time callers spent emitting records.
+
+        Returns:
+            dict: Record count, records per second, mean and max enqueue time
+                in microseconds, and the number of records waiting to be written
+        """
+        records = _stats['records']
+        uptime = max(time.time() - _stats['started_at'], 1e-9)
+        return {
+            'records': records,
+            'records_per_second': records / uptime,
+            'mean_enqueue_us': _stats['enqueue_seconds'] / records * 1e6 if records else 0.0,
+            'max_enqueue_us': _stats['max_enqueue_seconds'] * 1e6,
+            'queue_depth': _listener.queue.qsize() if _listener else 0
+        }
+
     def info(self, message):
         """Log info level message."""
         self.logger.info(message)
-    
+
     def error(self, message, exc_info=True):
         """Log error level message with exception info."""
         self.logger.error(message, exc_info=exc_info)
-    
+
     def warning(self, message):
         """Log warning level message."""
         self.logger.warning(message)
-    
+
     def debug(self, message):
         """Log debug level message."""
-        self.logger.debug(message) 
\ No newline at end of file
+        self.logger.debug(message)
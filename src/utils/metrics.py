@@ -0,0 +1,195 @@
+"""
+Lightweight Prometheus-style metrics.
+
+Metrics are plain in-process counters and histograms rendered in the
+Prometheus text exposition format, cheap enough to update on every
+request of the news pipeline.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: tuple, values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    type_name = 'counter'
+
+    def __init__(self, name: str, description: str, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        for key, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.labels, key)} {value}"
+
+class Gauge(Counter):
+    """Value that can go up and down per label set."""
+
+    type_name = 'gauge'
+
+    def set(self, value: float, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        self._values[key] = value
+
+class Histogram:
+    """Cumulative bucketed distribution of observed values per label set."""
+
+    type_name = 'histogram'
+
+    def __init__(self, name: str, description: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+
+    def observe(self, value: float, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        series = self._series.get(key)
+        if series is None:
+            # Per-bucket counts, with a final slot for +Inf, then sum
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def time(self, **labels):
+        """Return a context manager observing the duration of its block."""
+        return _Timer(self, labels)
+
+    def samples(self):
+        for key, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                labels = _format_labels(self.labels, key, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labels, key)
+            yield f"{self.name}_sum{labels} {total}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def counter(self, name: str, description: str, labels: tuple = ()) -> Counter:
+        return self._register(Counter(name, description, labels))
+
+    def gauge(self, name: str, description: str, labels: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, description, labels))
+
+    def histogram(self, name: str, description: str, labels: tuple = (),
+                  buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, labels, buckets))
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+REGISTRY = MetricsRegistry()
+
+FEED_FETCH_SECONDS = REGISTRY.histogram(
+    'newsbot_feed_fetch_seconds', 'Time to download a feed, including parsing when streamed', ('feed',))
+FEED_PARSE_SECONDS = REGISTRY.histogram(
+    'newsbot_feed_parse_seconds', 'Time to parse a downloaded feed', ('feed',))
+ITEMS_FETCHED = REGISTRY.counter(
+    'newsbot_items_fetched_total', 'Items returned by a source', ('category', 'source'))
+ITEMS_DEDUPLICATED = REGISTRY.counter(
+    'newsbot_items_deduplicated_total', 'Fetched items dropped as already processed', ('category', 'source'))
+ITEMS_CROSS_SOURCE_DUPLICATES = REGISTRY.counter(
+    'newsbot_items_cross_source_duplicates_total',
+    'Deduplicated items matched only by canonical URL, i.e. seen through another source', ('category', 'source'))
+GEMINI_REQUEST_SECONDS = REGISTRY.histogram(
+    'newsbot_gemini_request_seconds', 'Gemini generate_content latency', ('category',))
+GEMINI_PROMPT_TOKENS = REGISTRY.histogram(
+    'newsbot_gemini_prompt_tokens', 'Estimated prompt size sent to Gemini', ('category',), TOKEN_BUCKETS)
+GEMINI_QUEUE_DEPTH = REGISTRY.gauge(
+    'newsbot_gemini_queue_depth', 'Gemini requests waiting for a concurrency slot or quota', ('priority',))
+GEMINI_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    'newsbot_gemini_queue_wait_seconds', 'Time a Gemini request waited before being sent', ('priority',))
+DISCORD_SEND_SECONDS = REGISTRY.histogram(
+    'newsbot_discord_send_seconds', 'Discord message send latency', ('category',))
+DISCORD_DELIVERIES = REGISTRY.counter(
+    'newsbot_discord_deliveries_total', 'Roundups delivered to a channel by outcome', ('category', 'outcome'))
+SUBSCRIBED_CHANNELS = REGISTRY.gauge(
+    'newsbot_subscribed_channels', 'Channels subscribed to each category', ('category',))
+DELIVERY_QUEUE_DEPTH = REGISTRY.gauge(
+    'newsbot_delivery_queue_depth', 'Channel deliveries queued, in progress or waiting to retry')
+ARTICLES_STORED = REGISTRY.counter(
+    'newsbot_articles_stored_total', 'Articles written to the search index')
+ARTICLE_STORE_PENDING = REGISTRY.gauge(
+    'newsbot_article_store_pending', 'Articles queued for the next batched write')
+ARTICLE_STORE_BATCHES = REGISTRY.counter(
+    'newsbot_article_store_batches_total', 'Batched article writes')
+ARTICLE_SEARCH_SECONDS = REGISTRY.histogram(
+    'newsbot_article_search_seconds', 'Full-text article search latency')
+DIGEST_TOPICS = REGISTRY.counter(
+    'newsbot_digest_topics_total', 'Rolling digest topics posted, by whether they were updated or created',
+    ('category', 'change'))
+PIPELINE_CYCLE_SECONDS = REGISTRY.histogram(
+    'newsbot_pipeline_cycle_seconds', 'Duration of one category pipeline run', ('category', 'source'))
+PIPELINE_RUNS = REGISTRY.counter(
+    'newsbot_pipeline_runs_total', 'Category pipeline runs by outcome', ('category', 'source', 'outcome'))
+JOB_QUEUE_DEPTH = REGISTRY.gauge(
+    'newsbot_job_queue_depth', 'Triggered jobs waiting to run')
+LOG_RECORDS = REGISTRY.gauge(
+    'newsbot_log_records', 'Log records emitted since startup')
+LOG_QUEUE_DEPTH = REGISTRY.gauge(
+    'newsbot_log_queue_depth', 'Log records waiting for the writer thread')
+LOG_ENQUEUE_SECONDS = REGISTRY.gauge(
+    'newsbot_log_enqueue_seconds', 'Time callers spent handing a record to the log queue', ('stat',))
+EVENT_LOOP_LAG_SECONDS = REGISTRY.histogram(
+    'newsbot_event_loop_lag_seconds', 'Delay between scheduled and actual event loop wake-ups')
+
+async def monitor_event_loop_lag(interval: float = 1.0):
+    """
+    Record how late the event loop wakes up from a fixed sleep, forever.
+
+    Args:
+        interval (float): Seconds between samples
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, loop.time() - start - interval))
@@ -0,0 +1,79 @@
+"""
+Asynchronous token bucket rate limiter.
+"""
+
+import asyncio
+import time
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float):
+        """
+        Create a bucket that refills continuously.
+
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum tokens held, i.e. the allowed burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """
+        Wait until the requested tokens are available and take them.
+
+        Args:
+            tokens (float): Tokens to take, capped at the bucket capacity
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+        # The lock keeps waiters in FIFO order
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Take the requested tokens if they are available, without waiting.
+
+        Args:
+            tokens (float): Tokens to take, capped at the bucket capacity
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise seconds until they will be available
+        """
+        tokens = min(tokens, self.capacity)
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def adjust(self, tokens: float):
+        """
+        Return tokens to the bucket, or take more when negative.
+
+        The balance may go below zero, which delays later acquisitions
+        until the overdraft has refilled.
+
+        Args:
+            tokens (float): Tokens to add, negative to remove
+        """
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + tokens)
@@ -0,0 +1,72 @@
+"""
+Cheap token estimates for LLM prompts.
+"""
+
+# Gemini tokenizes English prose at roughly four characters per token
+CHARS_PER_TOKEN = 4
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens a text will use.
+
+    Args:
+        text (str): Prompt or completion text
+
+    Returns:
+        int: Estimated token count
+    """
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut a text down to roughly max_tokens, on a word boundary when possible.
+
+    Args:
+        text (str): Text to shorten
+        max_tokens (int): Token budget for the text
+
+    Returns:
+        str: The text, truncated with an ellipsis if it was over budget
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if not text or len(text) <= max_chars:
+        return text
+    cut = text.rfind(' ', 0, max_chars)
+    return text[:cut if cut > max_chars // 2 else max_chars].rstrip() + '…'
+
+def plan_chunks(items: list, costs: list, budget: int) -> list:
+    """
+    Split items into consecutive chunks that each fit a token budget.
+
+    The number of chunks is the minimum the budget allows, and items are
+    spread evenly across them so the largest chunk stays as small as
+    possible.
+
+    Args:
+        items (list): Items to split
+        costs (list): Estimated token cost of each item
+        budget (int): Maximum tokens per chunk
+
+    Returns:
+        list: List of item lists, in the original order
+    """
+    if not items:
+        return []
+    total = sum(costs)
+    chunk_count = max(1, -(-total // budget))
+    target = min(budget, -(-total // chunk_count))
+
+    chunks = [[]]
+    used = 0
+    for item, cost in zip(items, costs):
+        filled = used + cost
+        # Close the chunk when it would exceed the budget, or when adding the
+        # item overshoots the balanced target by more than leaving it out undershoots
+        if chunks[-1] and (filled > budget or filled - target > target - used):
+            chunks.append([])
+            used = 0
+        chunks[-1].append(item)
+        used += cost
+    return chunks
@@ -0,0 +1,116 @@
+"""
+Canonical URL normalization for cross-source deduplication.
+
+The same article reached through a feed, NewsAPI or a redirector should
+map to one canonical URL. Rules are compiled once at import time and
+results are memoized, since each cycle sees mostly the same URLs.
+"""
+
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track the click, never select the content
+TRACKING_PARAMS = re.compile(
+    r'^(?:utm_\w+|fbclid|gclid|dclid|msclkid|mc_cid|mc_eid|igshid|yclid|_hsenc|_hsmi|'
+    r'mkt_tok|ref|ref_src|ref_url|referrer|cmpid|ncid|guccounter|guce_\w+|__twitter_impression|'
+    r'sr_share|share|via|ocid|soc_src|soc_trk|taid|smid|xtor|wt\.mc_id)$',
+    re.IGNORECASE
+)
+
+HOST_PREFIXES = re.compile(r'^(?:www\d*|m|mobile|amp)\.')
+AMP_PATH = re.compile(r'(?:/amp/?|\.amp(?:\.html)?)$')
+DUPLICATE_SLASHES = re.compile(r'/{2,}')
+# arxiv.org/pdf/2401.01234v2.pdf and arxiv.org/abs/2401.01234 are the same paper
+ARXIV_PATH = re.compile(r'^/(?:abs|pdf)/(.+?)(?:v\d+)?(?:\.pdf)?$')
+
+# Redirector host -> query parameters that may hold the destination URL
+REDIRECTORS = {
+    'google.com': ('url', 'q'),
+    'news.google.com': ('url',),
+    'l.facebook.com': ('u',),
+    'lm.facebook.com': ('u',),
+    'l.messenger.com': ('u',),
+    'out.reddit.com': ('url',),
+    't.umblr.com': ('z',),
+    'slack-redirect.com': ('url',),
+    'linkedin.com': ('url',),
+    'duckduckgo.com': ('uddg',),
+    'href.li': ()  # destination is the whole query string
+}
+
+# Host -> query parameters that identify the content; all others are dropped
+KEEP_ONLY_PARAMS = {
+    'youtube.com': ('v',),
+    'news.ycombinator.com': ('id',),
+    'arxiv.org': ()
+}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+MAX_REDIRECT_DEPTH = 3
+
+def _normalize_host(hostname: str, port) -> str:
+    host = HOST_PREFIXES.sub('', hostname.lower().rstrip('.'))
+    if port and port not in DEFAULT_PORTS.values():
+        return f"{host}:{port}"
+    return host
+
+def _redirect_target(host: str, path: str, query: str):
+    """Return the destination of a known redirector URL, or None."""
+    if host not in REDIRECTORS:
+        return None
+    params = REDIRECTORS[host]
+    if not params:
+        return unquote(query) or None
+    if host in ('google.com', 'linkedin.com') and not path.startswith(('/url', '/redir')):
+        return None
+    for name, value in parse_qsl(query, keep_blank_values=True):
+        if name in params and value.startswith(('http://', 'https://')):
+            return value
+    return None
+
+@lru_cache(maxsize=16384)
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so the same article always yields the same string.
+
+    Resolves known redirectors, forces https, lowercases the host and drops
+    www/m/amp prefixes, default ports, fragments, tracking parameters, AMP
+    suffixes and trailing slashes, and sorts the remaining parameters.
+
+    Args:
+        url (str): URL as found in a feed or API response
+
+    Returns:
+        str: Canonical URL, or an empty string if url is not an http(s) URL
+    """
+    url = (url or '').strip()
+    for _ in range(MAX_REDIRECT_DEPTH + 1):
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return ''
+        if parts.scheme.lower() not in DEFAULT_PORTS or not parts.hostname:
+            return ''
+        host = _normalize_host(parts.hostname, port)
+        target = _redirect_target(host, parts.path, parts.query)
+        if target is None:
+            break
+        url = target
+
+    if host == 'youtu.be':
+        host, path, query = 'youtube.com', '/watch', f"v={parts.path.strip('/')}"
+    else:
+        path, query = parts.path, parts.query
+
+    path = AMP_PATH.sub('', DUPLICATE_SLASHES.sub('/', path)).rstrip('/')
+    if host == 'arxiv.org':
+        path = ARXIV_PATH.sub(r'/abs/\1', path)
+    keep_only = KEEP_ONLY_PARAMS.get(host)
+    params = sorted(
+        (name, value)
+        for name, value in parse_qsl(query, keep_blank_values=True)
+        if (name in keep_only if keep_only is not None else not TRACKING_PARAMS.match(name))
+    )
+    return urlunsplit(('https', host, path, urlencode(params), ''))